@@ -1,17 +1,26 @@
 import streamlit as st
+import uuid
 from datetime import date, timedelta
 import pandas as pd
-import plotly.graph_objects as go
-from utils.model_utils import load_model, predict_prices
-from utils.sentiment_utils import analyze_sentiment
-from utils.plotting_utils import plot_candlestick, plot_sentiment
+from utils.app_cache import (cache_stats, cached_forecast, cached_predict_batch, cached_predict_range,
+                             cached_sentiment, invalidate)
+from utils import instrumentation
+from utils.sentiment_utils import SCORERS
+from utils.forecast import FORECAST_HORIZONS, forecast_latency
+from utils.plotting_utils import MAX_PLOT_POINTS, plot_candlestick, plot_forecast, plot_ohlc, plot_sentiment
+from utils.stocks import STOCK_LIST
+from utils import warmup
 
 # Set page config
 st.set_page_config(page_title="Stock Insights", layout="wide")
 
+# Load models and price data while the first page is on screen; runs once
+# per server process, reruns only see the running or finished thread
+warmup.start_background_warm_up()
+
 # Title and Tabs
 st.title("📈 Stock Price Prediction & Sentiment Analysis")
-tabs = st.tabs(["🔮 Predict Stock Price", "📰 Analyze Sentiment"])
+tabs = st.tabs(["🔮 Predict Stock Price", "📰 Analyze Sentiment", "📋 Predict All"])
 
 # Set default dates to today and a recent range
 _today = date.today()
@@ -21,8 +30,13 @@ default_end = _today
 # If you see date picker errors, use Streamlit's 'Clear cache' option in the menu.
 
 # STOCK LIST
-stock_list = ["RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK", "HCLTECH", "LT", "SBIN", "WIPRO", "ITC",
-              "BAJFINANCE", "HINDUNILVR", "KOTAKBANK", "ASIANPAINT", "NTPC", "TATAMOTORS", "ONGC", "SUNPHARMA", "TECHM", "POWERGRID"]
+stock_list = STOCK_LIST
+
+# Records this session's stage timings; with PERF_TRACE=1 every session is
+# recorded regardless and the checkbox only shows or hides the panel
+record_timings = st.sidebar.checkbox("⏱️ Record timings", value=instrumentation.PERF_TRACE, key="perf_enabled")
+perf_session = st.session_state.setdefault("perf_session", uuid.uuid4().hex)
+instrumentation.enable_thread(record_timings, session=perf_session)
 
 # -------- TAB 1: Price Prediction --------
 with tabs[0]:
@@ -36,7 +50,7 @@ with tabs[0]:
     if isinstance(end_date, tuple):
         end_date = end_date[0] if end_date else default_end
 
-    plot_type = st.radio("Display Format", ["Tabulation", "Line Plot"], horizontal=True)
+    plot_type = st.radio("Display Format", ["Tabulation", "Line Plot", "Candlestick"], horizontal=True)
 
     # Validate date range
     date_error = None
@@ -44,22 +58,60 @@ with tabs[0]:
         date_error = "❌ Please select both start and end dates."
     elif end_date < start_date:
         date_error = "❌ End date must be after start date."
-    elif (end_date - start_date).days > 30:
-        date_error = "❌ Date range cannot exceed 30 days."
 
     if date_error:
         st.error(date_error)
-    elif st.button("🚀 Predict Price"):
-        pred_df, actual_df = predict_prices(stock, start_date, end_date)
-        st.success("✅ Prediction Complete!")
+    else:
+        inputs = (stock, start_date, end_date)
+        if st.button("🚀 Predict Price"):
+            try:
+                # Predicted in chunks from the stored prices, so long ranges are fine
+                combined = cached_predict_range(stock, start_date, end_date)
+                st.session_state["prediction"] = {"inputs": inputs, "result": combined}
+            except Exception as e:
+                st.error(f"❌ {str(e)}")
+
+        prediction = st.session_state.get("prediction")
+        if prediction and prediction["inputs"] == inputs:
+            combined = prediction["result"]
+            st.success(f"✅ Prediction Complete! {len(combined)} trading days")
+
+            if plot_type == "Tabulation":
+                st.dataframe(combined, use_container_width=True)
+            else:
+                if plot_type == "Candlestick":
+                    fig = plot_ohlc(combined, max_points=MAX_PLOT_POINTS)
+                else:
+                    fig = plot_candlestick(combined, max_points=MAX_PLOT_POINTS)
+                st.plotly_chart(fig, use_container_width=True)
+                if len(combined) > MAX_PLOT_POINTS:
+                    st.caption(f"Plot shows {MAX_PLOT_POINTS} of {len(combined)} days (downsampled); "
+                               "the table has all of them.")
+
+    st.markdown("#### 🔭 Multi-day Forecast")
+    horizon = st.selectbox("Forecast Horizon (trading days)", options=FORECAST_HORIZONS, index=1)
+
+    forecast_inputs = (stock, horizon)
+    if st.button("📅 Forecast"):
+        try:
+            st.session_state["forecast"] = {"inputs": forecast_inputs, "result": cached_forecast(stock, horizon)}
+        except Exception as e:
+            st.error(f"❌ {str(e)}")
 
-        combined = pd.merge(actual_df, pred_df, on="Date", suffixes=("_Actual", "_Predicted"))
+    forecast = st.session_state.get("forecast")
+    if forecast and forecast["inputs"] == forecast_inputs:
+        forecast_df, recent_df = forecast["result"]
+        st.success(f"✅ {horizon}-day forecast from {recent_df['Date'].iloc[-1].date()}")
 
         if plot_type == "Tabulation":
-            st.dataframe(combined, use_container_width=True)
+            st.dataframe(forecast_df, use_container_width=True)
         else:
-            fig = plot_candlestick(combined)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(plot_forecast(forecast_df, recent_df), use_container_width=True)
+
+        latency = forecast_latency.stats().get(horizon)
+        if latency:
+            st.caption(f"Latency over {latency['count']} runs: p50 {latency['p50_ms']:.1f} ms, "
+                       f"p95 {latency['p95_ms']:.1f} ms, {latency['step_ms']:.2f} ms per step")
 
 # -------- TAB 2: Sentiment Analysis --------
 with tabs[1]:
@@ -74,6 +126,7 @@ with tabs[1]:
         sentiment_end = sentiment_end[0] if sentiment_end else default_end
 
     sentiment_type = st.radio("Display Format", ["Tabulation", "Plot"], horizontal=True)
+    sentiment_scorer = st.radio("Sentiment Model", list(SCORERS), horizontal=True, key="sent_scorer")
 
     # Validate date range
     sent_date_error = None
@@ -86,16 +139,135 @@ with tabs[1]:
 
     if sent_date_error:
         st.error(sent_date_error)
-    elif st.button("📥 Analyze Sentiment"):
-        sent_df, summary, top_news_df = analyze_sentiment(stock, sentiment_start, sentiment_end)
-        st.success(f"✅ Overall Sentiment: **{summary}**")
+    else:
+        sentiment_inputs = (stock, sentiment_start, sentiment_end, sentiment_scorer)
+        if st.button("📥 Analyze Sentiment"):
+            st.session_state["sentiment"] = {
+                "inputs": sentiment_inputs,
+                "result": cached_sentiment(stock, sentiment_start, sentiment_end, sentiment_scorer),
+            }
 
-        if sentiment_type == "Tabulation":
-            st.dataframe(sent_df, use_container_width=True)
-        else:
-            fig = plot_sentiment(sent_df)
-            st.plotly_chart(fig, use_container_width=True)
+        sentiment = st.session_state.get("sentiment")
+        if sentiment and sentiment["inputs"] == sentiment_inputs:
+            sent_df, summary, top_news_df = sentiment["result"]
+            st.success(f"✅ Overall Sentiment: **{summary}**")
+
+            if sentiment_type == "Tabulation":
+                st.dataframe(sent_df, use_container_width=True)
+            else:
+                fig = plot_sentiment(sent_df)
+                st.plotly_chart(fig, use_container_width=True)
+
+            st.markdown("### 📰 Top 5 Influential News")
+            for i, row in top_news_df.iterrows():
+                st.markdown(f"**{i+1}.** [{row['Headline']}]({row['URL']}) — *{row['Sentiment']}* (Score: {row['Score']})")
+
+# -------- TAB 3: Predict All --------
+with tabs[2]:
+    st.subheader("📋 Predict All Stocks")
+
+    batch_start = st.date_input("Prediction Start Date", value=default_start, key="batch_start")
+    if isinstance(batch_start, tuple):
+        batch_start = batch_start[0] if batch_start else default_start
+    batch_end = st.date_input("Prediction End Date", value=default_end, key="batch_end")
+    if isinstance(batch_end, tuple):
+        batch_end = batch_end[0] if batch_end else default_end
+
+    # Validate date range
+    batch_date_error = None
+    if batch_start is None or batch_end is None:
+        batch_date_error = "❌ Please select both start and end dates."
+    elif batch_end < batch_start:
+        batch_date_error = "❌ End date must be after start date."
+    elif (batch_end - batch_start).days > 30:
+        batch_date_error = "❌ Date range cannot exceed 30 days."
+
+    if batch_date_error:
+        st.error(batch_date_error)
+    else:
+        batch_inputs = (batch_start, batch_end)
+        if st.button("🚀 Predict All"):
+            st.session_state["batch"] = {
+                "inputs": batch_inputs,
+                "result": cached_predict_batch(stock_list, batch_start, batch_end),
+            }
+
+        batch = st.session_state.get("batch")
+        if batch and batch["inputs"] == batch_inputs:
+            results, failures = batch["result"]
+            # The cached frame is shared between reruns; add columns to a copy
+            results = results.copy()
+
+            if not results.empty:
+                results['Abs_Error'] = results['Error'].abs()
+                results['Pct_Error'] = results['Abs_Error'] / results['Actual'] * 100
+                summary = results.groupby('Stock').agg(
+                    Days=('Date', 'count'),
+                    Last_Actual=('Actual', 'last'),
+                    Last_Predicted=('Predicted', 'last'),
+                    MAE=('Abs_Error', 'mean'),
+                    MAPE=('Pct_Error', 'mean'),
+                    Bias=('Error', 'mean'),
+                ).sort_values('MAPE').reset_index()
+                st.success(f"✅ Predicted {len(summary)} of {len(stock_list)} stocks")
+                st.caption("Click a column header to sort.")
+                st.dataframe(summary.round(2), use_container_width=True)
+
+                with st.expander("Daily predictions"):
+                    st.dataframe(results.drop(columns=['Abs_Error', 'Pct_Error']), use_container_width=True)
+
+            if failures:
+                with st.expander(f"⚠️ {len(failures)} stocks failed"):
+                    for failed_stock, error in failures.items():
+                        st.markdown(f"**{failed_stock}**: {error}")
+
+# -------- Sidebar: cache admin --------
+# Results are cached per ticker, range and data file version, and the last
+# result of each tab is kept in session state so changing the display
+# format re-renders it without recomputing
+with st.sidebar.expander("🛠️ Cache Admin"):
+    admin_stock = st.selectbox("Ticker", options=stock_list, key="admin_stock")
+    refetch_news = st.checkbox("Also refetch news", value=False, key="admin_news")
+    if st.button("🧹 Invalidate Ticker"):
+        invalidate(admin_stock, news=refetch_news)
+        st.success(f"✅ Cleared cached results for {admin_stock}")
+    if st.button("🗑️ Clear All Caches"):
+        invalidate(news=refetch_news)
+        st.success("✅ Cleared all cached results")
+
+    stats = cache_stats()
+    if stats["results"]:
+        st.dataframe(pd.DataFrame(stats["results"]).T.round(3), use_container_width=True)
+    models = stats["models"]
+    news = stats["news"]
+    st.caption(f"Models: {len(models['models'])} loaded, hit rate {models['hit_rate']:.0%}, "
+               f"{models['cached_bytes'] / 1e6:.1f} MB")
+    st.caption(f"News days: hit rate {news['hit_rate']:.0%}, {news['fetches']} API fetches")
+    warm = warmup.status()
+    if warm["state"] == "running":
+        st.caption("Warm-up: loading models…")
+    elif warm["seconds"] is not None:
+        st.caption(f"Warm-up: {warm['state']} in {warm['seconds']:.1f}s, {len(warm['failures'])} failed")
+
+# -------- Performance panel --------
+if record_timings:
+    with st.expander("⏱️ Performance"):
+        # Requests of this session; the stage totals below cover the whole process
+        traces = instrumentation.recorder.recent_traces(session=perf_session)
+        if not traces:
+            st.caption("No timed requests in this session yet. Cached results are not re-timed.")
+        for trace in {trace["name"]: trace for trace in reversed(traces)}.values():
+            st.markdown(f"**{trace['name']}**: {trace['ms']:.1f} ms")
+            stages = pd.DataFrame([
+                {"Stage": child["path"].split("/", 1)[1], "ms": round(child["ms"], 2),
+                 "RSS delta (KB)": None if child["rss_delta"] is None else child["rss_delta"] // 1024}
+                for child in trace["children"]
+            ], columns=["Stage", "ms", "RSS delta (KB)"])
+            st.dataframe(stages, use_container_width=True)
 
-        st.markdown("### 📰 Top 5 Influential News")
-        for i, row in top_news_df.iterrows():
-            st.markdown(f"**{i+1}.** [{row['Headline']}]({row['URL']}) — *{row['Sentiment']}* (Score: {row['Score']})")
+        summary = instrumentation.recorder.summary()
+        if summary:
+            st.markdown("**All stages (all sessions)**")
+            st.dataframe(pd.DataFrame(summary).round(2), use_container_width=True)
+            st.download_button("📤 Export Prometheus metrics", instrumentation.prometheus_text(),
+                               file_name="metrics.txt", mime="text/plain")
@@ -0,0 +1,87 @@
+"""
+Indicator throughput: one NumPy batch over all tickers vs per-ticker loops.
+
+Compares computing SMA7/SMA21/RSI/MACD/MACD_Signal for every ticker in data/
+with a single ``utils.indicators`` batch call, the same engine called once
+per ticker, and the ``ta`` + pandas path predict_prices used to run.
+
+Usage:
+    python benchmarks/bench_indicators.py [--repeat 10] [--tile 1]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from utils import indicators, price_store
+
+
+def load_closes(data_dir):
+    closes = []
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        df = price_store.read_price_csv(path)
+        if len(df):
+            closes.append(df['Close'].to_numpy())
+    # Left-pad shorter histories so every ticker shares the date axis
+    length = max(len(c) for c in closes)
+    return np.column_stack([np.concatenate([np.full(length - len(c), np.nan), c]) for c in closes])
+
+
+def run_ta(batch):
+    from ta.momentum import RSIIndicator
+    from ta.trend import MACD
+
+    for i in range(batch.shape[1]):
+        close = pd.Series(batch[:, i]).dropna()
+        close.rolling(window=7).mean()
+        close.rolling(window=21).mean()
+        RSIIndicator(close=close).rsi()
+        macd = MACD(close=close)
+        macd.macd()
+        macd.macd_signal()
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=price_store.DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--tile", type=int, default=1, help="Repeat the ticker set to simulate a wider universe")
+    args = parser.parse_args()
+
+    batch = np.tile(load_closes(args.data_dir), (1, args.tile))
+    n_days, n_tickers = batch.shape
+    bars = n_days * n_tickers
+
+    results = {
+        "numpy batch": best_of(lambda: indicators.compute_indicators(batch), args.repeat),
+        "numpy per ticker": best_of(
+            lambda: [indicators.compute_indicators(batch[:, i]) for i in range(n_tickers)], args.repeat
+        ),
+    }
+    try:
+        results["ta per ticker"] = best_of(lambda: run_ta(batch), args.repeat)
+    except ImportError:
+        print("ta not installed, skipping the ta baseline")
+
+    print(f"{n_tickers} tickers x {n_days} days")
+    for name, elapsed in results.items():
+        print(f"{name:>18}: {elapsed * 1000:8.2f} ms  ({bars / elapsed / 1e6:6.2f} M bars/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+TextBlob vs the precompiled lexicon scorer on headline polarity.
+
+Scores the regression corpus (tiled to ``--headlines``) with
+``TextBlob(text).sentiment.polarity`` per headline, as analyze_sentiment
+did, and with LexiconSentimentScorer, and checks the scores are equal.
+Headlines are made unique so the scorer's de-duplication does not help.
+
+Usage:
+    python benchmarks/bench_lexicon_sentiment.py [--headlines 5000]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textblob import TextBlob
+
+from utils.lexicon_sentiment import LexiconSentimentScorer
+
+CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testing", "fixtures", "sentiment_corpus.jsonl")
+
+
+def best_of(fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--headlines", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(CORPUS, encoding="utf-8") as f:
+        corpus = [json.loads(line)["text"] for line in f if line.strip()]
+    headlines = [f"{corpus[i % len(corpus)]} ({i})" for i in range(args.headlines)]
+
+    scorer = LexiconSentimentScorer()
+    scorer.score(headlines[0])
+    TextBlob(headlines[0]).sentiment
+
+    textblob_time, expected = best_of(lambda: [TextBlob(h).sentiment.polarity for h in headlines], args.repeat)
+    lexicon_time, scores = best_of(lambda: scorer.polarity(headlines), args.repeat)
+
+    print(f"{len(headlines)} headlines")
+    print(f"{'textblob':<10}{textblob_time * 1000:10.1f} ms{textblob_time / len(headlines) * 1e6:10.1f} us/headline")
+    print(f"{'lexicon':<10}{lexicon_time * 1000:10.1f} ms{lexicon_time / len(headlines) * 1e6:10.1f} us/headline")
+    print(f"speedup x{textblob_time / lexicon_time:.1f}, identical scores: {scores == expected}")
+
+
+if __name__ == "__main__":
+    main()
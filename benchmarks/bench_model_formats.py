@@ -0,0 +1,95 @@
+"""
+Cold-load time and memory of pickle vs native XGBoost model files.
+
+Every *.pkl in the models directory is converted to UBJ and JSON in a temp
+directory. Each file is then loaded in a fresh interpreter (xgboost already
+imported), recording load time and the resident-set growth, repeated
+--runs times. Run ``python train.py --format pkl`` first to benchmark all
+stocks rather than only the committed model.
+
+Usage:
+    python benchmarks/bench_model_formats.py [--models-dir models] [--runs 5]
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from utils.model_utils import _load_pickle, save_model
+
+CHILD = r"""
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+import xgboost
+from utils.model_utils import load_model_file
+
+def rss():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+before = rss()
+started = time.perf_counter()
+load_model_file({path!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "rss": rss() - before}}))
+"""
+
+
+def cold_load(path, runs):
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-W", "ignore", "-c", CHILD.format(root=ROOT, path=path)],
+                             capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return (statistics.median(r["seconds"] for r in results), statistics.median(r["rss"] for r in results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models-dir", default=os.path.join(ROOT, "models"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    pickles = sorted(glob.glob(os.path.join(args.models_dir, "*.pkl")))
+    if not pickles:
+        sys.exit(f"No .pkl models in {args.models_dir}")
+
+    totals = {}
+    print(f"{'model':<12}{'format':<8}{'size KB':>10}{'load ms':>10}{'RSS MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in pickles:
+            stock = os.path.splitext(os.path.basename(path))[0]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                model = _load_pickle(path)
+            files = {"pkl": path}
+            for fmt in ("ubj", "json"):
+                files[fmt] = save_model(model, stock, tmp, fmt=fmt, keep_other_formats=True)
+            for fmt, file in files.items():
+                seconds, rss = cold_load(file, args.runs)
+                size = os.path.getsize(file)
+                total = totals.setdefault(fmt, [0, 0.0, 0])
+                total[0] += size
+                total[1] += seconds
+                total[2] += rss
+                print(f"{stock:<12}{fmt:<8}{size / 1024:10.0f}{seconds * 1000:10.1f}{rss / 2**20:10.1f}")
+
+    print(f"\nTotals over {len(pickles)} models")
+    for fmt, (size, seconds, rss) in totals.items():
+        speedup = totals["pkl"][1] / seconds
+        print(f"{fmt:<8}{size / 2**20:8.1f} MB on disk{seconds * 1000:10.1f} ms load{rss / 2**20:10.1f} MB RSS  x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Serial vs asyncio news ingestion against a local fake NewsAPI server.
+
+The serial baseline fetches one ticker after another through NewsClient,
+as the Streamlit handler did; the async pipeline fetches all tickers
+concurrently. The fake server adds a fixed latency per request.
+
+Usage:
+    python benchmarks/bench_news_ingest.py [--latency 0.05] [--days 7]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from testing.fake_newsapi import FakeNewsAPIServer
+from utils.news_client import NewsClient
+from utils.news_ingest import ingest_news
+from utils.sentiment_cache import ArticleStore
+from utils.stocks import STOCK_LIST
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake server latency per request (s)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--per-day", type=int, default=5, help="Articles per ticker per day")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    end = date(2025, 5, 28)
+    start = end - timedelta(days=args.days - 1)
+
+    with FakeNewsAPIServer(per_day=args.per_day, latency=args.latency) as server:
+        client = NewsClient(api_key="bench", endpoint=server.endpoint, page_size=args.page_size, max_workers=1)
+        t0 = time.perf_counter()
+        serial = sum(len(client.everything(f"{stock} stock", start, end)) for stock in STOCK_LIST)
+        serial_time = time.perf_counter() - t0
+        serial_requests = len(server.requests)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = ingest_news(
+                STOCK_LIST, start, end, store=ArticleStore(os.path.join(tmp, "news.db")),
+                api_key="bench", endpoint=server.endpoint, page_size=args.page_size,
+                concurrency=args.concurrency, rate=1000, burst=args.concurrency,
+            )
+
+    fetched = sum(len(articles) for articles in summary["articles"].values())
+    print(f"{len(STOCK_LIST)} tickers, {args.days} days, {args.latency * 1000:.0f} ms server latency")
+    print(f"serial:  {serial_time:6.2f}s  {serial_requests:4d} requests  {serial} articles")
+    print(f"asyncio: {summary['elapsed']:6.2f}s  {summary['requests']:4d} requests  {fetched} articles "
+          f"(incl. store writes)")
+    print(f"speedup: {serial_time / summary['elapsed']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
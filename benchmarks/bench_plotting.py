@@ -0,0 +1,99 @@
+"""
+Figure build time and payload size for long price series, by plotting mode.
+
+For synthetic histories of each ``--rows`` length this times building the
+figure and serializing it to JSON, which is what Streamlit sends to the
+browser. It also reports the JSON size. Modes:
+
+    line-raw       plot_candlestick with every point (SVG Scatter)
+    line           plot_candlestick with the LTTB point budget (WebGL above
+                   the threshold)
+    candle-raw     plot_ohlc with one candle per day
+    candle         plot_ohlc with bars merged down to the budget
+    sentiment-raw  plot_sentiment with one point per day
+    sentiment      plot_sentiment with LTTB over the daily counts
+
+Usage:
+    python benchmarks/bench_plotting.py [--rows 1000 10000 100000] [--max-points 2000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from utils.plotting_utils import plot_candlestick, plot_ohlc, plot_sentiment
+
+
+def price_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.01, n))
+    return pd.DataFrame({
+        'Date': pd.bdate_range("1900-01-01", periods=n),
+        'Open': close * (1 + rng.normal(0, 0.003, n)),
+        'High': close * (1 + spread),
+        'Low': close * (1 - spread),
+        'Close_Actual': close,
+        'Close_Predicted': close * (1 + rng.normal(0, 0.01, n)),
+    })
+
+
+def sentiment_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("1900-01-01", periods=n)
+    labels = np.array(['POSITIVE', 'NEGATIVE', 'NEUTRAL'])
+    per_day = rng.integers(1, 4, n)
+    return pd.DataFrame({
+        'Date': np.repeat(days, per_day),
+        'Sentiment': labels[rng.integers(0, 3, per_day.sum())],
+        'Score': 0.0,
+    })
+
+
+def measure(build, repeat):
+    best_build = best_json = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fig = build()
+        built = time.perf_counter()
+        payload = fig.to_json()
+        best_build = min(best_build, built - started)
+        best_json = min(best_json, time.perf_counter() - built)
+    return best_build, best_json, len(payload), [trace.type for trace in fig.data]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--max-points", type=int, default=2000, help="Point budget per trace")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # The first figure pays for plotly's validators
+    plot_candlestick(price_frame(10))
+
+    print(f"{'rows':>7}  {'mode':<14} {'build ms':>9} {'to_json ms':>11} {'payload KB':>11}  traces")
+    for n in args.rows:
+        prices = price_frame(n)
+        news = sentiment_frame(n)
+        modes = {
+            "line-raw": lambda: plot_candlestick(prices, max_points=None),
+            "line": lambda: plot_candlestick(prices, max_points=args.max_points),
+            "candle-raw": lambda: plot_ohlc(prices, max_points=None),
+            "candle": lambda: plot_ohlc(prices, max_points=args.max_points),
+            "sentiment-raw": lambda: plot_sentiment(news, max_points=None),
+            "sentiment": lambda: plot_sentiment(news, max_points=args.max_points),
+        }
+        for mode, build in modes.items():
+            build_s, json_s, size, traces = measure(build, args.repeat)
+            print(f"{n:>7}  {mode:<14} {build_s * 1000:>9.1f} {json_s * 1000:>11.1f} {size / 1024:>11.0f}  "
+                  f"{','.join(traces)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare per-request CSV parsing against the columnar price store.
+
+For every file in data/ this times the original predict_prices loading path
+(read_csv, per-column to_numeric, to_datetime, sort) against loading the
+same columns from the memory-mapped store.
+
+Usage:
+    python benchmarks/bench_price_store.py [--repeat 20]
+"""
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from utils import price_store
+
+
+def load_csv_baseline(path):
+    df = pd.read_csv(path)
+    if 'Date' not in df.columns:
+        df = df.rename(columns={df.columns[0]: 'Date'})
+    numeric_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+    for col in numeric_columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = df.dropna(subset=numeric_columns)
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df.sort_values('Date')
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=price_store.DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.data_dir, "*.csv")))
+    rows = []
+    with tempfile.TemporaryDirectory() as store_dir:
+        for path in paths:
+            stock = os.path.splitext(os.path.basename(path))[0]
+            df = price_store.ingest_csv(stock, args.data_dir, store_dir)
+            csv_time = best_of(lambda: load_csv_baseline(path), args.repeat)
+            store_time = best_of(lambda: price_store.load_store(stock, store_dir=store_dir), args.repeat)
+            rows.append({
+                "file": os.path.basename(path),
+                "rows": len(df),
+                "csv_ms": csv_time * 1000,
+                "store_ms": store_time * 1000,
+                "speedup": csv_time / store_time if store_time else float("nan"),
+            })
+
+    report = pd.DataFrame(rows)
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    print()
+    print(f"Total CSV:   {report['csv_ms'].sum():.2f} ms")
+    print(f"Total store: {report['store_ms'].sum():.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Accuracy and latency of the price model with and without sentiment features.
+
+Works in a scratch workspace. By default it uses a synthetic price history
+of ``--rows`` trading days. On a ``--coverage`` share of the days it adds
+1-3 synthetic headlines, whose tone matches the sign of the day's
+open-to-close move with probability ``--signal`` (0.5 is pure noise). Pass
+``--db`` to use a real article store and ``--stock`` from data/ instead.
+Reported:
+
+    build        scoring the cached articles into the daily store (once per
+                 news update, never per request)
+    accuracy     walk-forward backtest MAE/RMSE/MAPE, technical features vs
+                 technical + sentiment
+    latency      predict_range per request for the last month and for the
+                 whole history, cold (first request after a news update,
+                 which pays for the as-of join) and warm
+
+Usage:
+    python benchmarks/bench_sentiment_features.py [--rows 3000] [--coverage 0.3] [--signal 0.7]
+    python benchmarks/bench_sentiment_features.py --stock RELIANCE --db data/news.db
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import numpy as np
+import pandas as pd
+
+TONES = {
+    1: ["{s} shares gain on great results", "Excellent quarter lifts {s}", "{s} rallies on strong demand"],
+    -1: ["{s} shares fall on terrible outlook", "Weak demand hurts {s}", "{s} slides after bad results"],
+    0: ["{s} shares trade", "{s} holds annual meeting"],
+}
+
+
+def make_prices(path, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1400 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    open_ = close * (1 + rng.normal(0, 0.01, rows))
+    spread = np.abs(rng.normal(0, 0.005, rows))
+    df = pd.DataFrame({
+        "Date": pd.bdate_range("2000-01-03", periods=rows), "Close": close,
+        "High": np.maximum(open_, close) * (1 + spread), "Low": np.minimum(open_, close) * (1 - spread),
+        "Open": open_, "Volume": rng.integers(1e5, 1e7, rows),
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+def make_news(store, stock, prices, coverage, signal, seed=0):
+    rng = np.random.default_rng(seed + 1)
+    moves = np.sign(prices['Close'] - prices['Open']).astype(int).to_numpy()
+    days = {}
+    for day, move in zip(prices['Date'], moves):
+        if rng.random() >= coverage:
+            continue
+        articles = []
+        for n in range(rng.integers(1, 4)):
+            tone = move if rng.random() < signal else int(rng.choice([-1, 0, 1]))
+            title = TONES[tone][rng.integers(len(TONES[tone]))].format(s=stock.upper())
+            articles.append({"url": f"https://news.example/{stock}/{day.date()}/{n}",
+                             "publishedAt": f"{day.date()}T09:00:00Z", "title": title})
+        days[day.date()] = articles
+    store.put_days(stock, days, time.time())
+    return sum(len(articles) for articles in days.values())
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def latency(stock, start, end, repeat):
+    from utils import sentiment_features
+    from utils.model_utils import predict_range
+
+    predict_range(stock, start, end)
+    sentiment_features.clear_cache()
+    cold = timed(lambda: predict_range(stock, start, end), 1)
+    warm = timed(lambda: predict_range(stock, start, end), repeat)
+    return cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stock", default=None, help="Stock from data/ (default: synthetic)")
+    parser.add_argument("--db", default=None, help="Article store for --stock")
+    parser.add_argument("--rows", type=int, default=3000, help="Trading days of the synthetic history")
+    parser.add_argument("--coverage", type=float, default=0.3, help="Share of days with synthetic news")
+    parser.add_argument("--signal", type=float, default=0.7, help="Chance a headline follows the day's move")
+    parser.add_argument("--initial", type=int, default=500, help="Rows in the first backtest training window")
+    parser.add_argument("--step", type=int, default=63, help="Rows predicted per backtest fold")
+    parser.add_argument("--n-estimators", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    workspace = tempfile.mkdtemp(prefix="bench-sentiment-")
+    try:
+        os.makedirs(os.path.join(workspace, "data"))
+        stock = (args.stock or "synthetic").lower()
+        if args.stock:
+            shutil.copy(os.path.join(ROOT, "data", f"{stock}.csv"), os.path.join(workspace, "data"))
+        os.chdir(workspace)
+        from utils import sentiment_features
+        from utils.backtest import backtest_stock
+        from utils.model_utils import load_price_data, model_registry
+        from utils.sentiment_cache import ArticleStore
+        from utils.training import train_stock
+
+        if args.db:
+            store = ArticleStore(os.path.join(ROOT, args.db) if not os.path.isabs(args.db) else args.db)
+            source = f"{args.stock.upper()} with the articles in {args.db}"
+        else:
+            store = ArticleStore(os.path.join(workspace, "news.db"))
+            prices = make_prices(os.path.join("data", f"{stock}.csv"), args.rows)
+            articles = make_news(store, stock, prices, args.coverage, args.signal)
+            source = (f"synthetic: {args.rows} days, {articles} headlines on {args.coverage:.0%} of days, "
+                      f"signal {args.signal:.0%}")
+
+        started = time.perf_counter()
+        daily = sentiment_features.build_daily_sentiment(stock, store)
+        build = time.perf_counter() - started
+        print(source)
+        print(f"build: {len(daily)} news days, {int(daily['News_Volume'].sum())} articles scored in "
+              f"{build * 1000:.0f} ms ({sentiment_features.DEFAULT_SCORER})")
+
+        params = {"n_estimators": args.n_estimators}
+        dates = load_price_data(stock)['Date']
+        month = (dates.iloc[-1] - pd.Timedelta(days=30), dates.iloc[-1])
+        print(f"\n{'features':<22} {'MAE':>8} {'RMSE':>8} {'MAPE %':>7} {'fit s':>6}   "
+              f"{'month cold':>10} {'warm':>6} {'all cold':>9} {'warm':>6}  (predict_range ms)")
+        for sentiment in (False, True):
+            summary, _ = backtest_stock(stock, args.initial, args.step, params=params, sentiment=sentiment)
+            train_stock(stock, "bench", params=params, models_dir="models", sentiment=sentiment)
+            model_registry.invalidate()
+            month_cold, month_warm = latency(stock, *month, args.repeat)
+            all_cold, all_warm = latency(stock, dates.iloc[0], dates.iloc[-1], max(1, args.repeat // 4))
+            label = "technical + sentiment" if sentiment else "technical"
+            print(f"{label:<22} {summary['MAE']:>8.3f} {summary['RMSE']:>8.3f} {summary['MAPE']:>7.3f} "
+                  f"{summary['Fit_s']:>6.2f}   {month_cold * 1000:>10.1f} {month_warm * 1000:>6.1f} "
+                  f"{all_cold * 1000:>9.1f} {all_warm * 1000:>6.1f}")
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
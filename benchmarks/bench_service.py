@@ -0,0 +1,124 @@
+"""
+Load test for the prediction service: p50/p99 latency and requests per second.
+
+Sends ``--requests`` GETs with ``--concurrency`` in flight. Requests cycle
+over ``--distinct`` different date windows ending at ``--end``; with few
+distinct windows most concurrent requests are identical and get coalesced.
+Without ``--url`` a server is started in this process on a free port.
+
+Usage:
+    python benchmarks/bench_service.py [--requests 2000] [--concurrency 32] [--distinct 4]
+    python benchmarks/bench_service.py --url http://localhost:8000 --endpoint sentiment --scorer lexicon
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+import warnings
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def start_server(workers, max_pending):
+    import uvicorn
+
+    from utils.service import create_app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = uvicorn.Config(create_app(max_workers=workers, max_pending=max_pending), host="127.0.0.1",
+                            port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}", server, thread
+
+
+def request_urls(args):
+    end = date.fromisoformat(args.end)
+    urls = []
+    for i in range(args.distinct):
+        start = end - timedelta(days=args.days + i)
+        query = f"stock={args.stock}&start={start.isoformat()}&end={end.isoformat()}"
+        if args.endpoint == "sentiment":
+            query += f"&scorer={args.scorer}"
+        urls.append(f"{args.url}/{args.endpoint}?{query}")
+    return urls
+
+
+async def run_load(base_url, urls, total, concurrency):
+    import aiohttp
+
+    latencies = []
+    statuses = {}
+    counter = iter(range(total))
+
+    async def worker(session):
+        for i in counter:
+            started = time.perf_counter()
+            async with session.get(urls[i % len(urls)]) as response:
+                await response.read()
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        async with session.get(f"{base_url}/health") as response:
+            health = await response.json()
+    return np.array(latencies), statuses, elapsed, health
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Service base URL (default: start one in-process)")
+    parser.add_argument("--endpoint", choices=["predict", "sentiment"], default="predict")
+    parser.add_argument("--stock", default="RELIANCE")
+    parser.add_argument("--end", default="2025-05-29", help="Last date of every window")
+    parser.add_argument("--days", type=int, default=7, help="Length of the shortest window")
+    parser.add_argument("--scorer", default="lexicon", help="Sentiment scorer for --endpoint sentiment")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--distinct", type=int, default=4, help="Distinct date windows cycled through")
+    parser.add_argument("--workers", type=int, default=4, help="Inference threads of the in-process server")
+    parser.add_argument("--max-pending", type=int, default=256)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    server = None
+    if args.url is None:
+        args.url, server, thread = start_server(args.workers, args.max_pending)
+    args.url = args.url.rstrip("/")
+    urls = request_urls(args)
+
+    # One request per window first, so model and data loading is not timed
+    asyncio.run(run_load(args.url, urls, len(urls), 1))
+    latencies, statuses, elapsed, health = asyncio.run(run_load(args.url, urls, args.requests, args.concurrency))
+
+    ms = latencies * 1000
+    print(f"{args.requests} x /{args.endpoint} ({args.distinct} distinct), concurrency {args.concurrency}")
+    print(f"  p50 {np.percentile(ms, 50):.2f} ms   p90 {np.percentile(ms, 90):.2f} ms   "
+          f"p99 {np.percentile(ms, 99):.2f} ms   max {ms.max():.2f} ms")
+    print(f"  {args.requests / elapsed:.0f} req/s over {elapsed:.2f}s")
+    print(f"  status codes: {dict(sorted(statuses.items()))}")
+    print(f"  server: {health['computations']} computations, {health['coalesced']} coalesced, "
+          f"{health['rejected']} rejected")
+
+    if server is not None:
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
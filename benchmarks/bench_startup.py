@@ -0,0 +1,146 @@
+"""
+App cold start: import cost of the app's modules and time to first render.
+
+Both are measured in fresh interpreters, so nothing is already imported:
+
+- ``python -X importtime`` over the modules app.py imports, reporting the
+  total and the most expensive top-level imports;
+- a first render of app.py with Streamlit's AppTest, reporting the time
+  the script takes and which heavy dependencies it left loaded.
+
+Every figure is the median of ``--repeat`` runs. ``--output`` writes them
+as JSON; ``--baseline`` compares against such a file.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--top 15]
+    python benchmarks/bench_startup.py --output startup.json
+    python benchmarks/bench_startup.py --baseline startup.json --no-warm-up
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What app.py imports before its first st call
+APP_IMPORTS = [
+    "streamlit",
+    "pandas",
+    "utils.app_cache",
+    "utils.instrumentation",
+    "utils.sentiment_utils",
+    "utils.forecast",
+    "utils.plotting_utils",
+    "utils.stocks",
+    "utils.warmup",
+]
+# Only needed once a user asks for them; a first render should not load these
+HEAVY_MODULES = ["matplotlib", "textblob", "nltk", "transformers", "torch", "xgboost"]
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+_RENDER = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+harness = time.perf_counter() - started
+app = AppTest.from_file("app.py", default_timeout=120)
+started = time.perf_counter()
+app.run()
+render = time.perf_counter() - started
+print(json.dumps({
+    "render_s": render,
+    "harness_s": harness,
+    "exceptions": [str(e.value) for e in app.exception],
+    "loaded": sorted(m for m in %r if m in sys.modules),
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """Return [(module, self_us, cumulative_us, depth)] from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def measure_imports(modules):
+    """Return the top-level ``(module, seconds)`` imports of ``modules``, without interpreter startup."""
+    def importtime(code):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                cwd=ROOT, capture_output=True, text=True, check=True)
+        return parse_importtime(result.stderr)
+
+    startup = {row[0] for row in importtime("pass")}
+    return [(module, cumulative_us / 1e6) for module, _, cumulative_us, depth in importtime("import " + ", ".join(modules))
+            if depth == 0 and module not in startup]
+
+
+def measure_render(warm_up):
+    env = {**os.environ, "APP_WARMUP": "1" if warm_up else "0"}
+    result = subprocess.run(
+        [sys.executable, "-c", _RENDER % (HEAVY_MODULES,)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Top-level imports listed")
+    parser.add_argument("--no-warm-up", action="store_true", help="Render with APP_WARMUP=0")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Compare with a JSON file written by --output")
+    args = parser.parse_args()
+
+    totals = []
+    cumulative = {}
+    for _ in range(args.repeat):
+        top_level = measure_imports(APP_IMPORTS)
+        totals.append(sum(seconds for _, seconds in top_level))
+        for module, seconds in top_level:
+            cumulative.setdefault(module, []).append(seconds)
+    imports = {module: statistics.median(values) for module, values in cumulative.items()}
+
+    renders = [measure_render(not args.no_warm_up) for _ in range(args.repeat)]
+    exceptions = renders[-1]["exceptions"]
+    results = {
+        "import_s": statistics.median(totals),
+        "render_s": statistics.median(r["render_s"] for r in renders),
+        "harness_s": statistics.median(r["harness_s"] for r in renders),
+        "warm_up": not args.no_warm_up,
+        "loaded_after_render": renders[-1]["loaded"],
+        "top_imports": dict(sorted(imports.items(), key=lambda item: -item[1])[:args.top]),
+    }
+
+    print(f"App imports: {results['import_s'] * 1000:.0f} ms (median of {args.repeat})")
+    for module, seconds in results["top_imports"].items():
+        print(f"  {seconds * 1000:8.1f} ms  {module}")
+    print(f"First render: {results['render_s'] * 1000:.0f} ms "
+          f"(+{results['harness_s'] * 1000:.0f} ms AppTest import), warm-up {'on' if results['warm_up'] else 'off'}")
+    print(f"  heavy modules loaded: {', '.join(results['loaded_after_render']) or 'none'}")
+    if exceptions:
+        print(f"  app raised: {exceptions}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for key in ("import_s", "render_s"):
+            change = (results[key] - baseline[key]) / baseline[key]
+            print(f"  {key}: {baseline[key] * 1000:.0f} -> {results[key] * 1000:.0f} ms ({change:+.0%})")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Per-headline vs batched DistilBERT sentiment scoring on CPU.
+
+The baseline calls a transformers pipeline once per headline, as
+scripts/news_sentiment.py did; the batched scorer tokenizes all headlines
+at once and runs length-sorted batches. The result cache is cleared
+between runs so every configuration scores every headline.
+
+Usage:
+    python benchmarks/bench_transformer_sentiment.py [--articles 256] [--threads 4]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from testing.fake_newsapi import make_articles
+from utils.transformer_sentiment import DEFAULT_MODEL, TransformerSentimentScorer
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=256)
+    parser.add_argument("--batch-sizes", default="1,2,4,8,16,32,64")
+    parser.add_argument("--threads", type=int, default=None, help="torch CPU threads")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from transformers import pipeline
+
+    end = date(2025, 5, 28)
+    articles = make_articles("RELIANCE stock", end - timedelta(days=60), end, per_day=10)[:args.articles]
+    texts = [f"{article['title']} {article.get('description', '')}" for article in articles]
+
+    scorer = TransformerSentimentScorer(model_name=args.model, num_threads=args.threads)
+    scorer.predict(texts[:2])
+    _, model = scorer._load()
+    classifier = pipeline("sentiment-analysis", model=model, tokenizer=scorer._tokenizer)
+
+    print(f"{len(texts)} headlines, model {args.model}")
+    baseline = best_of(lambda: [classifier(text[:512]) for text in texts], args.repeat)
+    print(f"{'per-headline pipeline':<24}{baseline * 1000:10.1f} ms{len(texts) / baseline:10.1f} articles/s")
+
+    for batch_size in [int(size) for size in args.batch_sizes.split(",")]:
+        scorer.batch_size = batch_size
+
+        def run():
+            scorer._cache.clear()
+            scorer.predict(texts)
+
+        elapsed = best_of(run, args.repeat)
+        label = f"batched (batch={batch_size})"
+        print(f"{label:<24}{elapsed * 1000:10.1f} ms{len(texts) / elapsed:10.1f} articles/s  x{baseline / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Booster vs compiled NumPy tree inference latency for 1, 22 and 10,000 rows.
+
+``xgboost`` is ``model.predict`` on a FEATURES DataFrame, as predict_prices
+calls it; ``inplace`` is ``Booster.inplace_predict`` on a NumPy array, the
+cheapest booster call; ``compiled`` is CompiledEnsemble.predict. Rows are
+cycled from the stock's real feature matrix and every backend's output is
+checked to be identical.
+
+Usage:
+    python benchmarks/bench_tree_inference.py [--stock reliance] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.backtest import feature_matrix
+from utils.model_utils import FEATURES, load_model
+from utils.tree_inference import CompiledEnsemble
+
+
+def timings(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return np.median(samples) * 1000, np.percentile(samples, 99) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stock", default="reliance")
+    parser.add_argument("--rows", default="1,22,10000")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model = load_model(args.stock)
+    booster = model.get_booster()
+    started = time.perf_counter()
+    compiled = CompiledEnsemble.from_booster(model)
+    print(f"Compiled {len(compiled.roots)} trees ({len(compiled.value)} nodes, depth {compiled.max_depth}) "
+          f"in {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+    _, X, _ = feature_matrix(args.stock)
+    print(f"{'rows':>6}  {'backend':<10}{'median ms':>11}{'p99 ms':>10}{'vs xgboost':>12}")
+    for n_rows in [int(n) for n in args.rows.split(",")]:
+        rows = X[np.arange(n_rows) % len(X)]
+        frame = pd.DataFrame(rows, columns=FEATURES)
+        backends = {
+            "xgboost": lambda: model.predict(frame),
+            "inplace": lambda: booster.inplace_predict(rows),
+            "compiled": lambda: compiled.predict(rows),
+        }
+        expected = backends["xgboost"]()
+        repeat = max(5, args.repeat // max(1, n_rows // 1000))
+        baseline = None
+        for name, fn in backends.items():
+            assert np.array_equal(fn(), expected), f"{name} predictions differ"
+            median, p99 = timings(fn, repeat)
+            baseline = baseline or median
+            print(f"{n_rows:>6}  {name:<10}{median:11.3f}{p99:10.3f}{baseline / median:11.1f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
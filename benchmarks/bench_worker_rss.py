@@ -0,0 +1,152 @@
+"""
+Memory per worker process when several workers serve predictions.
+
+Builds a scratch workspace with ``--tickers`` synthetic price histories of
+``--rows`` trading days each (all using the RELIANCE model). It then starts
+``--workers`` processes per mode. Every worker predicts each ticker's whole
+history ``--passes`` times. Modes:
+
+    frames   full-history DataFrames per request (predict_prices_batch path)
+    stores   predict_range over the memory-mapped price and feature stores
+    matrix   predict_range over the published float32 feature matrices
+
+Reported per worker, as the growth over the worker's state after imports
+and model loading: resident memory (RSS), peak RSS, private memory (USS,
+what every extra worker adds) and proportional set size (PSS, which splits
+shared page-cache pages between the processes mapping them), plus the
+absolute PSS.
+
+Usage:
+    python benchmarks/bench_worker_rss.py [--workers 4] [--tickers 8] [--rows 50000]
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+MODES = ("frames", "stores", "matrix")
+
+
+def memory_kb():
+    """Return VmRSS, VmHWM, Pss and private (USS) memory of this process in KB."""
+    values = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                values[line.split(":")[0]] = int(line.split()[1])
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Pss:", "Private_Clean:", "Private_Dirty:")):
+                values[line.split(":")[0]] = int(line.split()[1])
+    values["Private"] = values.pop("Private_Clean") + values.pop("Private_Dirty")
+    return values
+
+
+def make_workspace(path, tickers, rows):
+    import numpy as np
+    import pandas as pd
+
+    os.makedirs(os.path.join(path, "data"))
+    os.makedirs(os.path.join(path, "models"))
+    dates = pd.bdate_range("1850-01-01", periods=rows).strftime("%Y-%m-%d")
+    names = []
+    for i in range(tickers):
+        name = f"synth{i}"
+        rng = np.random.default_rng(i)
+        close = 1400 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+        spread = np.abs(rng.normal(0, 0.01, rows))
+        pd.DataFrame({
+            "Date": dates, "Close": close, "High": close * (1 + spread), "Low": close * (1 - spread),
+            "Open": close * (1 + rng.normal(0, 0.003, rows)), "Volume": rng.integers(1e5, 1e7, rows),
+        }).to_csv(os.path.join(path, "data", f"{name}.csv"), index=False)
+        shutil.copy(os.path.join(ROOT, "models", "reliance.pkl"), os.path.join(path, "models", f"{name}.pkl"))
+        names.append(name)
+    return names
+
+
+def worker(workspace, mode, names, passes, barrier, results):
+    os.chdir(workspace)
+    os.environ["FEATURE_MATRIX_DIR"] = os.path.join("data", "matrix" if mode == "matrix" else "no-matrix")
+    warnings.filterwarnings("ignore")
+    from utils.model_utils import model_registry, predict_prices_batch, predict_range
+
+    for name in names:
+        model_registry.get(name)
+    before = memory_kb()
+    barrier.wait()
+    for _ in range(passes):
+        for name in names:
+            if mode == "frames":
+                predict_prices_batch([name], "1800-01-01", "2100-01-01", max_workers=1)
+            else:
+                predict_range(name, "1800-01-01", "2100-01-01")
+    # Measure while every worker is still alive, so shared pages are split
+    barrier.wait()
+    after = memory_kb()
+    barrier.wait()
+    results.put({
+        "rss": after["VmRSS"] - before["VmRSS"],
+        "peak": after["VmHWM"] - before["VmRSS"],
+        "pss_growth": after["Pss"] - before["Pss"],
+        "uss_growth": after["Private"] - before["Private"],
+        "pss": after["Pss"],
+    })
+
+
+def run_mode(workspace, mode, names, workers, passes):
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=worker, args=(workspace, mode, names, passes, barrier, results))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return {key: statistics.mean(row[key] for row in rows) for key in rows[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tickers", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=50000, help="Trading days per synthetic ticker")
+    parser.add_argument("--passes", type=int, default=3, help="Predictions of every ticker per worker")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    workspace = tempfile.mkdtemp(prefix="bench-rss-")
+    try:
+        names = make_workspace(workspace, args.tickers, args.rows)
+        os.chdir(workspace)
+        from utils import feature_matrix, feature_store, price_store
+
+        # Stores and matrices are built once, as the loader would, not per worker
+        for name in names:
+            feature_store.update_features(name, price_store.ingest_csv(name))
+        manifest, _ = feature_matrix.publish_all(names, os.path.join("data", "matrix"))
+        matrix_mb = sum(entry["nbytes"] for entry in manifest["stocks"].values()) / 1024 ** 2
+
+        print(f"{args.workers} workers, {args.tickers} tickers x {args.rows} days "
+              f"({matrix_mb:.1f} MB of published matrices)")
+        print(f"{'mode':<8} {'RSS growth':>11} {'peak growth':>12} {'USS growth':>11} {'PSS growth':>11} {'PSS':>9}"
+              "   (MB per worker)")
+        for mode in MODES:
+            result = run_mode(workspace, mode, names, args.workers, args.passes)
+            print(f"{mode:<8} {result['rss'] / 1024:>11.1f} {result['peak'] / 1024:>12.1f} "
+                  f"{result['uss_growth'] / 1024:>11.1f} {result['pss_growth'] / 1024:>11.1f} {result['pss'] / 1024:>9.1f}")
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
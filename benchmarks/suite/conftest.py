@@ -0,0 +1,56 @@
+"""
+Offline fixtures for the benchmark suite.
+
+Every benchmark runs in a scratch copy of the repo's data and models, so
+stores and feature files written while benchmarking never touch ``data/``.
+NewsAPI is replaced by a recorded response (testing/fixtures/newsapi).
+"""
+import json
+import os
+import shutil
+import sys
+from datetime import date
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(ROOT)
+
+FIXTURES = os.path.join(ROOT, "testing", "fixtures")
+BENCH_STOCK = "RELIANCE"
+
+
+@pytest.fixture(scope="session")
+def workspace(tmp_path_factory):
+    """Scratch directory with data/<stock>.csv and models/<stock>.pkl."""
+    path = tmp_path_factory.mktemp("bench")
+    os.makedirs(path / "data")
+    os.makedirs(path / "models")
+    shutil.copy(os.path.join(ROOT, "data", f"{BENCH_STOCK.lower()}.csv"), path / "data")
+    shutil.copy(os.path.join(ROOT, "models", f"{BENCH_STOCK.lower()}.pkl"), path / "models")
+    return path
+
+
+@pytest.fixture
+def in_workspace(workspace, monkeypatch):
+    # The app resolves data/ and models/ relative to the working directory
+    monkeypatch.chdir(workspace)
+    return workspace
+
+
+@pytest.fixture(scope="session")
+def headlines():
+    with open(os.path.join(FIXTURES, "sentiment_corpus.jsonl")) as f:
+        return [json.loads(line)["text"] for line in f]
+
+
+@pytest.fixture
+def recorded_news(monkeypatch):
+    """Serve NewsAPI from the recorded response, with memory-only caching."""
+    from testing.fake_newsapi import ReplayTransport, load_recorded
+    from utils import sentiment_utils
+    from utils.news_client import NewsClient
+
+    recorded = load_recorded(os.path.join(FIXTURES, "newsapi", "reliance_everything.json"), end=date.today())
+    monkeypatch.setattr(sentiment_utils, "news_client", NewsClient(api_key="bench", transport=ReplayTransport(*recorded)))
+    return recorded
@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import BENCH_STOCK
+from utils import feature_store
+from utils.indicators import compute_indicators
+from utils.model_utils import load_price_data
+
+pytestmark = pytest.mark.benchmark(group="features")
+
+
+@pytest.fixture
+def prices(in_workspace):
+    return load_price_data(BENCH_STOCK)
+
+
+def test_compute_indicators_full_history(benchmark, prices):
+    close = prices['Close'].to_numpy(dtype=np.float64)
+    indicators = benchmark(compute_indicators, close)
+    assert len(indicators['SMA21']) == len(close)
+
+
+def test_update_features_one_new_bar(benchmark, prices, tmp_path):
+    feature_dir = str(tmp_path)
+
+    def setup():
+        # Store every bar but the last, so the update runs one bar
+        os.makedirs(feature_dir, exist_ok=True)
+        feature_store.update_features(BENCH_STOCK, prices.iloc[:-1], feature_dir)
+        return (BENCH_STOCK, prices, feature_dir), {}
+
+    frame = benchmark.pedantic(feature_store.update_features, setup=setup, rounds=30)
+    assert len(frame) == len(prices)
+
+
+def test_update_features_unchanged(benchmark, prices, tmp_path):
+    feature_store.update_features(BENCH_STOCK, prices, str(tmp_path))
+    frame = benchmark(feature_store.update_features, BENCH_STOCK, prices, str(tmp_path))
+    assert len(frame) == len(prices)
@@ -0,0 +1,34 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import BENCH_STOCK
+from utils.backtest import feature_matrix
+from utils.model_utils import FEATURES, find_model_file, load_model_file, predict_features, save_model
+
+pytestmark = [pytest.mark.benchmark(group="models"), pytest.mark.filterwarnings("ignore::UserWarning")]
+
+
+@pytest.fixture
+def model_files(in_workspace, tmp_path):
+    pkl_path = find_model_file(BENCH_STOCK)
+    model = load_model_file(pkl_path)
+    ubj_path = save_model(model, BENCH_STOCK, str(tmp_path), fmt="ubj")
+    return {"pkl": pkl_path, "ubj": ubj_path, "model": model}
+
+
+@pytest.mark.parametrize("fmt", ["pkl", "ubj"])
+def test_model_load(benchmark, model_files, fmt):
+    model = benchmark(load_model_file, model_files[fmt])
+    assert model.get_booster().num_boosted_rounds() > 0
+
+
+@pytest.mark.parametrize("backend", ["xgboost", "compiled"])
+def test_inference_one_month(benchmark, model_files, backend):
+    _, X, _ = feature_matrix(BENCH_STOCK)
+    features = pd.DataFrame(X[-22:], columns=FEATURES)
+    predictions = benchmark(predict_features, model_files["model"], features, backend)
+    assert len(predictions) == 22
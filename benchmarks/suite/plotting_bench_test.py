@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from utils.plotting_utils import MAX_PLOT_POINTS, plot_candlestick, plot_forecast, plot_ohlc, plot_sentiment
+
+pytestmark = pytest.mark.benchmark(group="plotting")
+
+
+@pytest.fixture(scope="module")
+def prediction_frame():
+    dates = pd.bdate_range("2025-05-01", periods=22)
+    actual = 1400 + np.cumsum(np.sin(np.arange(22)) * 5)
+    return pd.DataFrame({"Date": dates, "Close_Actual": actual, "Close_Predicted": actual + 3})
+
+
+@pytest.fixture(scope="module")
+def long_frame():
+    # Forty years of trading days
+    n = 10000
+    rng = np.random.default_rng(0)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        "Date": pd.bdate_range("1985-01-01", periods=n),
+        "Open": close * 0.999,
+        "High": close * 1.01,
+        "Low": close * 0.99,
+        "Close_Actual": close,
+        "Close_Predicted": close * (1 + rng.normal(0, 0.01, n)),
+    })
+
+
+def test_plot_candlestick(benchmark, prediction_frame):
+    fig = benchmark(plot_candlestick, prediction_frame)
+    assert len(fig.data) == 2
+
+
+def test_plot_sentiment(benchmark, headlines):
+    n = 100
+    df = pd.DataFrame({
+        "Date": pd.to_datetime("2025-05-23") + pd.to_timedelta(np.arange(n) % 7, unit="D"),
+        "Headline": headlines[:n],
+        "Sentiment": np.array(["POSITIVE", "NEGATIVE", "NEUTRAL"])[np.arange(n) % 3],
+        "Score": np.linspace(-1, 1, n),
+    })
+    fig = benchmark(plot_sentiment, df)
+    assert len(fig.data) == 3
+
+
+def test_plot_forecast(benchmark, prediction_frame):
+    forecast = pd.DataFrame({
+        "Date": pd.bdate_range("2025-06-02", periods=20),
+        "Close": np.linspace(1400, 1420, 20),
+    })
+    forecast["Lower"] = forecast["Close"] * 0.95
+    forecast["Upper"] = forecast["Close"] * 1.05
+    actual = prediction_frame.rename(columns={"Close_Actual": "Close"})[["Date", "Close"]]
+    fig = benchmark(plot_forecast, forecast, actual)
+    assert len(fig.data) == 4
+
+
+def _build_and_serialize(plot, df, max_points):
+    return plot(df, max_points=max_points).to_json()
+
+
+@pytest.mark.parametrize("max_points", [None, MAX_PLOT_POINTS], ids=["raw", "lttb"])
+def test_plot_candlestick_long(benchmark, long_frame, max_points):
+    payload = benchmark(_build_and_serialize, plot_candlestick, long_frame, max_points)
+    benchmark.extra_info["payload_bytes"] = len(payload)
+
+
+@pytest.mark.parametrize("max_points", [None, MAX_PLOT_POINTS], ids=["raw", "resampled"])
+def test_plot_ohlc_long(benchmark, long_frame, max_points):
+    payload = benchmark(_build_and_serialize, plot_ohlc, long_frame, max_points)
+    benchmark.extra_info["payload_bytes"] = len(payload)
@@ -0,0 +1,43 @@
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import BENCH_STOCK
+from utils import price_store
+from utils.model_utils import load_price_data, predict_prices
+
+pytestmark = [pytest.mark.benchmark(group="prices"), pytest.mark.filterwarnings("ignore::UserWarning")]
+
+START, END = "2025-04-29", "2025-05-29"
+
+
+def _drop_stores():
+    for name in ("store", "features"):
+        shutil.rmtree(os.path.join("data", name), ignore_errors=True)
+
+
+def test_predict_prices_warm(benchmark, in_workspace):
+    predict_prices(BENCH_STOCK, START, END)
+    pred_df, actual_df = benchmark(predict_prices, BENCH_STOCK, START, END)
+    assert len(pred_df) == len(actual_df) > 15
+
+
+def test_predict_prices_cold(benchmark, in_workspace):
+    # CSV parse, store write, full indicator rebuild and inference
+    pred_df, _ = benchmark.pedantic(predict_prices, (BENCH_STOCK, START, END), setup=_drop_stores,
+                                    rounds=20, warmup_rounds=1)
+    assert len(pred_df) > 15
+
+
+def test_read_price_csv(benchmark, in_workspace):
+    df = benchmark(price_store.read_price_csv, price_store.csv_path(BENCH_STOCK))
+    assert len(df) > 300
+
+
+def test_load_price_data_from_store(benchmark, in_workspace):
+    load_price_data(BENCH_STOCK)
+    df = benchmark(load_price_data, BENCH_STOCK)
+    assert len(df) > 300
@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from utils import sentiment_utils
+from utils.sentiment_cache import SentimentCache
+from utils.sentiment_utils import analyze_sentiment, score_headlines
+
+pytestmark = pytest.mark.benchmark(group="sentiment")
+
+
+@pytest.mark.parametrize("scorer", ["textblob", "lexicon"])
+def test_score_headlines(benchmark, headlines, scorer):
+    scores = benchmark(score_headlines, headlines, scorer)
+    assert len(scores) == len(headlines)
+
+
+@pytest.mark.parametrize("scorer", ["textblob", "lexicon"])
+def test_analyze_sentiment_recorded(benchmark, recorded_news, monkeypatch, scorer):
+    def setup():
+        # A fresh cache each round, so every round goes through the client
+        monkeypatch.setattr(sentiment_utils, "sentiment_cache", SentimentCache(store=None))
+        return ("RELIANCE", date.today() - timedelta(days=6), date.today(), scorer), {}
+
+    df, summary, _ = benchmark.pedantic(analyze_sentiment, setup=setup, rounds=30)
+    assert len(df) == 100
+    assert summary in ("POSITIVE", "NEGATIVE", "NEUTRAL")
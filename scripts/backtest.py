@@ -0,0 +1,63 @@
+"""
+Walk-forward backtest of the XGBoost price model for every stock in data/.
+
+Each stock is retrained every --step trading days on an expanding (or
+rolling) window and scored on the days that follow. Stocks run in parallel,
+one per worker process.
+
+Usage:
+    python scripts/backtest.py [--mode rolling --window 250] [--step 21] [--workers 4]
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from utils.backtest import MODES, run_backtest
+from utils.price_store import DATA_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stocks", nargs="+", default=None, help="Stock symbols (default: every CSV in data/)")
+    parser.add_argument("--mode", choices=MODES, default="expanding")
+    parser.add_argument("--initial", type=int, default=250, help="Rows in the first training window")
+    parser.add_argument("--window", type=int, default=None, help="Rolling window length (default: --initial)")
+    parser.add_argument("--step", type=int, default=21, help="Rows predicted per fold")
+    parser.add_argument("--n-estimators", type=int, default=None, help="Override the number of trees")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--sentiment", action="store_true",
+                        help="Also train on daily news sentiment (scripts/build_sentiment_features.py)")
+    parser.add_argument("--output", default=None, help="Write out-of-sample predictions to this CSV")
+    args = parser.parse_args()
+
+    params = {"n_estimators": args.n_estimators} if args.n_estimators else None
+    metrics, predictions, failures, elapsed = run_backtest(
+        args.stocks, initial=args.initial, step=args.step, mode=args.mode, window=args.window,
+        params=params, max_workers=args.workers, data_dir=args.data_dir, sentiment=args.sentiment,
+    )
+
+    pd.set_option("display.width", 200)
+    if not metrics.empty:
+        print(f"\n📊 Walk-forward metrics ({args.mode}, step {args.step})")
+        print(metrics[['Stock', 'Folds', 'Test_Rows', 'MAE', 'RMSE', 'R2', 'MAPE', 'Bias']].to_string(index=False, float_format="%.3f"))
+
+        print("\n⏱️ Timing (seconds)")
+        print(metrics[['Stock', 'Feature_s', 'Fit_s', 'Predict_s', 'Total_s']].to_string(index=False, float_format="%.3f"))
+        print(f"\nWall clock: {elapsed:.2f}s, summed per-stock time: {metrics['Total_s'].sum():.2f}s "
+              f"(x{metrics['Total_s'].sum() / elapsed:.1f} from parallelism)")
+
+    for stock, error in sorted(failures.items()):
+        print(f"⚠️ {stock}: {error}")
+
+    if args.output and not predictions.empty:
+        predictions.to_csv(args.output, index=False)
+        print(f"✅ Saved predictions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
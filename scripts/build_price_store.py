@@ -0,0 +1,37 @@
+"""
+Convert every CSV in data/ into the memory-mappable columnar price store
+and precompute its technical-indicator columns.
+
+Usage:
+    python scripts/build_price_store.py [--data-dir data] [--store-dir data/store]
+"""
+import argparse
+import glob
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_store, price_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the columnar price store from data/*.csv")
+    parser.add_argument("--data-dir", default=price_store.DATA_DIR)
+    parser.add_argument("--store-dir", default=price_store.STORE_DIR)
+    parser.add_argument("--feature-dir", default=feature_store.FEATURE_DIR)
+    parser.add_argument("--force", action="store_true", help="Rebuild stores that are already up to date")
+    args = parser.parse_args()
+
+    for path in sorted(glob.glob(os.path.join(args.data_dir, "*.csv"))):
+        stock = os.path.splitext(os.path.basename(path))[0]
+        if not args.force and price_store.is_fresh(stock, args.data_dir, args.store_dir):
+            print(f"⏭️  Up to date: {stock}")
+            continue
+        df = price_store.ingest_csv(stock, args.data_dir, args.store_dir)
+        feature_store.update_features(stock, df, args.feature_dir)
+        print(f"✅ Stored: {stock} ({len(df)} rows)")
+
+
+if __name__ == "__main__":
+    main()
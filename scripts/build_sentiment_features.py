@@ -0,0 +1,40 @@
+"""
+Score the cached news of every stock once and store its daily sentiment
+aggregates, which models trained with ``train.py --sentiment`` take as
+features. Run it after scripts/news_ingest.py (which also does this for
+the tickers it ingested) or after the dashboard has cached new articles.
+
+Usage:
+    python scripts/build_sentiment_features.py [--tickers RELIANCE TCS] [--scorer lexicon]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import sentiment_features
+from utils.sentiment_cache import NEWS_DB_PATH, ArticleStore
+from utils.sentiment_utils import SCORERS
+from utils.stocks import STOCK_LIST
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build daily sentiment features from the article store")
+    parser.add_argument("--tickers", nargs="+", default=STOCK_LIST)
+    parser.add_argument("--scorer", choices=list(SCORERS), default=sentiment_features.DEFAULT_SCORER)
+    parser.add_argument("--db", default=NEWS_DB_PATH)
+    parser.add_argument("--sentiment-dir", default=sentiment_features.SENTIMENT_DIR)
+    args = parser.parse_args()
+
+    store = ArticleStore(args.db)
+    for ticker in args.tickers:
+        started = time.perf_counter()
+        daily = sentiment_features.build_daily_sentiment(ticker, store, args.scorer, args.sentiment_dir)
+        print(f"✅ {ticker.upper()}: {len(daily)} days, {int(daily['News_Volume'].sum())} articles "
+              f"({time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Convert pickled models in models/ to XGBoost's native format.
+
+Writes models/<stock>.ubj (or .json) plus a models/<stock>.meta.json
+sidecar with the feature list. load_model prefers the native file, so the
+pickle is no longer unpickled once converted; pass --remove-pickle to
+delete it.
+
+Usage:
+    python scripts/convert_models.py [--format json] [--remove-pickle]
+"""
+import argparse
+import glob
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.model_utils import MODELS_DIR, NATIVE_FORMATS, _load_pickle, check_features, save_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=NATIVE_FORMATS, default="ubj")
+    parser.add_argument("--models-dir", default=MODELS_DIR)
+    parser.add_argument("--remove-pickle", action="store_true")
+    args = parser.parse_args()
+
+    for path in sorted(glob.glob(os.path.join(args.models_dir, "*.pkl"))):
+        stock = os.path.splitext(os.path.basename(path))[0]
+        try:
+            # Only convert pickles you trust: unpickling runs code from the file
+            model = _load_pickle(path)
+            check_features(model, stock)
+            out = save_model(model, stock, args.models_dir, fmt=args.format, remove_pickle=args.remove_pickle)
+        except Exception as e:
+            print(f"⚠️ {stock}: {str(e)}")
+            continue
+        print(f"✅ {stock}: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,40 @@
-import yfinance as yf
-import pandas as pd
-
-stock_tickers = {
-    "reliance": "RELIANCE.NS",
-    "tcs": "TCS.NS",
-    "infy": "INFY.NS",
-    "hdfcbank": "HDFCBANK.NS",
-    "icicibank": "ICICIBANK.NS",
-    "hcltech": "HCLTECH.NS",
-    "lt": "LT.NS",
-    "sbin": "SBIN.NS",
-    "wipro": "WIPRO.NS",
-    "itc": "ITC.NS",
-    "bajfinance": "BAJFINANCE.NS",
-    "hindunilvr": "HINDUNILVR.NS",
-    "kotakbank": "KOTAKBANK.NS",
-    "asianpaint": "ASIANPAINT.NS",
-    "ntpc": "NTPC.NS",
-    "tatamotors": "TATAMOTORS.NS",
-    "ongc": "ONGC.NS",
-    "sunpharma": "SUNPHARMA.NS",
-    "techm": "TECHM.NS",
-    "powergrid": "POWERGRID.NS",
-}
-
-start_date = "2024-01-01"
-end_date = "2025-05-28"
-
-for name, ticker in stock_tickers.items():
-    print(f"Fetching {ticker}...")
-    df = yf.download(ticker, start=start_date, end=end_date)
-    if not df.empty:
-        df.reset_index(inplace=True)
-        df.to_csv(f"{name}.csv", index=False)
-        print(f"✅ Saved: {name}.csv")
-    else:
-        print(f"⚠️ No data for {ticker}")
+"""
+Bring the price CSVs in data/ up to date from Yahoo Finance.
+
+Only bars after each CSV's last stored date are fetched, with a single
+multi-ticker download, and appended atomically. Stocks without a CSV (or
+with no bars yet) are fetched from --start.
+
+Usage:
+    python scripts/data_scrap.py [--stocks RELIANCE TCS] [--end 2025-06-30]
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.price_store import DATA_DIR
+from utils.price_update import DEFAULT_START, refresh_prices
+from utils.stocks import STOCK_LIST
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stocks", nargs="+", default=STOCK_LIST, help="Stock symbols (default: all)")
+    parser.add_argument("--end", default=None, help="Last date to fetch (default: today)")
+    parser.add_argument("--start", default=DEFAULT_START, help="First date for stocks with no stored bars")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    args = parser.parse_args()
+
+    print(f"Fetching missing bars for {len(args.stocks)} stocks...")
+    appended = refresh_prices(args.stocks, end=args.end, data_dir=args.data_dir, default_start=args.start)
+    for stock, rows in appended.items():
+        if rows:
+            print(f"✅ {stock}: {rows} new rows")
+        else:
+            print(f"⏭️  {stock}: up to date")
+
+
+if __name__ == "__main__":
+    main()
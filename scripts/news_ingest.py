@@ -0,0 +1,62 @@
+"""
+Fetch news for every supported stock concurrently into the local article store.
+
+analyze_sentiment reads the same store, so running this ahead of time (for
+example from cron before market open) means the dashboard never waits on
+NewsAPI for the ingested days. The daily sentiment features of the ingested
+tickers are rebuilt afterwards (skip with --no-features).
+
+Usage:
+    python scripts/news_ingest.py [--days 7] [--tickers RELIANCE TCS] [--concurrency 8] [--rate 5]
+"""
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import sentiment_features
+from utils.news_client import NEWS_API_KEY, NEWS_ENDPOINT
+from utils.news_ingest import ingest_news
+from utils.sentiment_cache import NEWS_DB_PATH, ArticleStore
+from utils.stocks import STOCK_LIST
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest NewsAPI articles for all stocks")
+    parser.add_argument("--tickers", nargs="+", default=STOCK_LIST)
+    parser.add_argument("--start", type=date.fromisoformat, help="First day (default: --days ago)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--days", type=int, default=7, help="Days back from --end when --start is omitted")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument("--rate", type=float, default=5.0, help="Maximum requests per second")
+    parser.add_argument("--max-articles", type=int, default=100, help="Article budget per query; larger ranges are split")
+    parser.add_argument("--db", default=NEWS_DB_PATH)
+    parser.add_argument("--endpoint", default=NEWS_ENDPOINT)
+    parser.add_argument("--no-features", action="store_true", help="Do not rebuild the daily sentiment features")
+    args = parser.parse_args()
+
+    start = args.start or args.end - timedelta(days=args.days)
+    store = ArticleStore(args.db)
+    summary = ingest_news(
+        [ticker.upper() for ticker in args.tickers], start, args.end,
+        store=store, api_key=NEWS_API_KEY, endpoint=args.endpoint,
+        concurrency=args.concurrency, rate=args.rate, max_articles=args.max_articles,
+    )
+
+    for ticker, articles in summary["articles"].items():
+        print(f"✅ {ticker}: {len(articles)} articles")
+    for ticker, error in summary["errors"].items():
+        print(f"⚠️ {ticker}: {error}")
+    print(f"📰 {summary['unique_urls']} unique articles, {summary['requests']} requests "
+          f"({summary['retries']} retries) in {summary['elapsed']:.2f}s")
+
+    if not args.no_features:
+        for ticker in summary["articles"]:
+            sentiment_features.build_daily_sentiment(ticker, store)
+        print(f"📊 Daily sentiment features rebuilt for {len(summary['articles'])} tickers")
+
+
+if __name__ == "__main__":
+    main()
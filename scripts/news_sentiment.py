@@ -1,13 +1,19 @@
 from newsapi import NewsApiClient
-from transformers import pipeline
 import pandas as pd
 from datetime import datetime
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.transformer_sentiment import get_scorer
 
 # 🔑 Replace with your actual key
 newsapi = NewsApiClient(api_key='YOUR_NEWSAPI_KEY')
 
-# Load sentiment classifier
-sentiment_pipeline = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
+# Sentiment classifier; the model is loaded on first use and scores all
+# headlines of a request in batches
+sentiment_scorer = get_scorer()
 
 def get_sentiment_news(stock_name, start_date, end_date):
     articles = newsapi.get_everything(
@@ -19,14 +25,13 @@ def get_sentiment_news(stock_name, start_date, end_date):
         page_size=20,
     )
 
-    news_data = []
-    for article in articles['articles']:
-        title = article['title']
-        content = f"{title} {article.get('description', '')}"
-        sentiment = sentiment_pipeline(content[:512])[0]  # cap length
+    contents = [f"{article['title']} {article.get('description', '')}" for article in articles['articles']]
+    sentiments = sentiment_scorer.predict(contents)
 
+    news_data = []
+    for article, sentiment in zip(articles['articles'], sentiments):
         news_data.append({
-            'Headline': title,
+            'Headline': article['title'],
             'Sentiment': sentiment['label'],
             'Score': round(sentiment['score'], 2),
             'URL': article['url']
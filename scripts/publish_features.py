@@ -0,0 +1,66 @@
+"""
+Publish every stock's feature matrix for the worker processes to share.
+
+Run it once before starting several app or API workers, or keep it running
+with ``--interval`` so matrices are republished whenever a CSV changes
+(workers use the stores for a stock until its matrix is current again):
+
+    python scripts/publish_features.py
+    python scripts/publish_features.py --interval 60
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_matrix, price_store
+
+
+def stale_stocks(data_dir, matrix_dir, force=False):
+    stocks = [os.path.splitext(os.path.basename(path))[0]
+              for path in sorted(glob.glob(os.path.join(data_dir, "*.csv")))]
+    if force:
+        return stocks
+    # A store rebuilt from a changed CSV no longer matches the manifest
+    return [stock for stock in stocks
+            if not price_store.is_fresh(stock, data_dir) or not feature_matrix.is_published(stock, matrix_dir)]
+
+
+def publish(stocks, matrix_dir):
+    started = time.perf_counter()
+    manifest, failures = feature_matrix.publish_all(stocks, matrix_dir)
+    for stock in stocks:
+        if stock in failures:
+            print(f"❌ {stock}: {failures[stock]}")
+        else:
+            entry = manifest["stocks"][stock.upper()]
+            print(f"✅ Published: {stock} ({entry['rows']} rows, {entry['nbytes'] / 1024:.0f} KB)")
+    print(f"{len(stocks) - len(failures)} published in {time.perf_counter() - started:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=price_store.DATA_DIR)
+    parser.add_argument("--matrix-dir", default=feature_matrix.MATRIX_DIR)
+    parser.add_argument("--force", action="store_true", help="Republish matrices that are already current")
+    parser.add_argument("--interval", type=float, default=None,
+                        help="Keep running and check for changed CSVs every this many seconds")
+    args = parser.parse_args()
+
+    stocks = stale_stocks(args.data_dir, args.matrix_dir, args.force)
+    if stocks:
+        publish(stocks, args.matrix_dir)
+    else:
+        print("⏭️  All matrices are up to date")
+    while args.interval:
+        time.sleep(args.interval)
+        stocks = stale_stocks(args.data_dir, args.matrix_dir)
+        if stocks:
+            publish(stocks, args.matrix_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,26 @@
 #!/usr/bin/env python3
 """
-Test script for sentiment analysis functionality
+Live check of the sentiment analysis against the real NewsAPI.
+
+Needs NEWS_API_KEY and network access, so it is a script rather than a
+test; the offline tests in testing/ replay recorded responses instead.
+
+Usage:
+    python scripts/sentiment_live_check.py
 """
 
 import sys
 import os
 from datetime import date, timedelta
 
-# Add the current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add the repository root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.sentiment_utils import analyze_sentiment, plot_sentiment
 import matplotlib.pyplot as plt
 
-def test_sentiment_analysis():
-    """Test the sentiment analysis functionality"""
+def check_sentiment_analysis():
+    """Check the sentiment analysis functionality"""
     
     print("🧪 Testing Sentiment Analysis...")
     print("=" * 50)
@@ -82,8 +88,8 @@ def test_sentiment_analysis():
         print(f"❌ Error during sentiment analysis: {e}")
         return False
 
-def test_api_connection():
-    """Test the News API connection"""
+def check_api_connection():
+    """Check the News API connection"""
     
     print("🌐 Testing News API Connection...")
     print("=" * 50)
@@ -131,12 +137,12 @@ if __name__ == "__main__":
     print()
     
     # Test 1: API Connection
-    api_success = test_api_connection()
+    api_success = check_api_connection()
     print()
     
     if api_success:
         # Test 2: Full Sentiment Analysis
-        sentiment_success = test_sentiment_analysis()
+        sentiment_success = check_sentiment_analysis()
         print()
         
         # Summary
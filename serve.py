@@ -0,0 +1,43 @@
+"""
+Serve price predictions and news sentiment over HTTP (see utils/service.py).
+
+Runs one uvicorn process so every model stays loaded once; CPU work is
+spread over ``--workers`` threads:
+
+    python serve.py
+    python serve.py --host 0.0.0.0 --port 8000 --workers 4 --max-pending 64
+    curl "http://localhost:8000/predict?stock=RELIANCE&start=2025-05-01&end=2025-05-29"
+"""
+import argparse
+import os
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from utils.service import SERVICE_MAX_PENDING, SERVICE_WORKERS
+from utils.stocks import STOCK_LIST
+
+# Keep every stock's model resident instead of the app's default of 8
+os.environ.setdefault("MODEL_CACHE_MAX_MODELS", str(len(STOCK_LIST)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS, help="Inference threads")
+    parser.add_argument("--max-pending", type=int, default=SERVICE_MAX_PENDING,
+                        help="Queued jobs before answering 503")
+    parser.add_argument("--no-warm", action="store_true", help="Load models on first use instead of at startup")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    from utils.service import create_app
+
+    app = create_app(max_workers=args.workers, max_pending=args.max_pending, warm=not args.no_warm)
+    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import app_cache
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(workspace):
+    app_cache.invalidate()
+    app_cache._stats.clear()
+    yield
+    app_cache.invalidate()
+
+
+def test_repeat_calls_hit_until_ticker_is_invalidated():
+    first = app_cache.cached_predict("RELIANCE", date(2025, 5, 20), date(2025, 5, 29))
+    second = app_cache.cached_predict("RELIANCE", date(2025, 5, 20), date(2025, 5, 29))
+    pd.testing.assert_frame_equal(first[0], second[0])
+
+    app_cache.invalidate("TCS")
+    app_cache.cached_predict("RELIANCE", date(2025, 5, 20), date(2025, 5, 29))
+    app_cache.invalidate("reliance")
+    app_cache.cached_predict("RELIANCE", date(2025, 5, 20), date(2025, 5, 29))
+
+    stats = app_cache.cache_stats()
+    assert stats["results"]["predict"]["calls"] == 4
+    assert stats["results"]["predict"]["computed"] == 2
+    assert stats["generations"] == {"TCS": 1, "RELIANCE": 1}
+
+
+def test_file_version_changes_with_file(tmp_path):
+    path = tmp_path / "prices.csv"
+    assert app_cache.file_version(str(path)) is None
+    path.write_text("Date,Close\n")
+    before = app_cache.file_version(str(path))
+    path.write_text("Date,Close\n2025-01-01,1.0\n")
+    assert app_cache.file_version(str(path)) != before
+
+
+def test_sentiment_messages_are_not_cached(monkeypatch):
+    calls = []
+
+    def fake_sentiment(stock, start_date, end_date, scorer):
+        calls.append(stock)
+        if len(calls) == 1:
+            return pd.DataFrame(), "⚠️ Network Error: timeout", pd.DataFrame()
+        df = pd.DataFrame({"Date": [pd.Timestamp("2025-05-20")], "Headline": ["Up"], "URL": [""],
+                           "Sentiment": ["POSITIVE"], "Score": [0.5]})
+        return df, "POSITIVE", df
+
+    monkeypatch.setattr(app_cache, "analyze_sentiment", fake_sentiment)
+    args = ("RELIANCE", date(2025, 5, 20), date(2025, 5, 29), "textblob")
+
+    assert app_cache.cached_sentiment(*args)[1] == "⚠️ Network Error: timeout"
+    assert app_cache.cached_sentiment(*args)[1] == "POSITIVE"
+    assert app_cache.cached_sentiment(*args)[1] == "POSITIVE"
+    assert len(calls) == 2
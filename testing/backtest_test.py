@@ -0,0 +1,55 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.backtest import backtest_stock, feature_matrix, run_backtest, walk_forward_splits
+from utils.model_utils import FEATURES, _feature_frame, load_price_data
+from utils import feature_store
+
+FAST = {'n_estimators': 20}
+
+pytestmark = pytest.mark.usefixtures("workspace")
+
+
+def test_expanding_and_rolling_splits():
+    assert walk_forward_splits(10, 4, 3) == [(0, 4, 7), (0, 7, 10)]
+    assert walk_forward_splits(10, 4, 3, mode="rolling") == [(0, 4, 7), (3, 7, 10)]
+    assert walk_forward_splits(11, 4, 3, mode="rolling", window=2) == [(2, 4, 7), (5, 7, 10), (8, 10, 11)]
+    assert walk_forward_splits(4, 4, 3) == []
+    with pytest.raises(ValueError):
+        walk_forward_splits(10, 4, 3, mode="sliding")
+
+
+def test_feature_matrix_matches_serving_features():
+    dates, X, y = feature_matrix("reliance")
+    df = load_price_data("reliance")
+    frame, _ = feature_store.compute_indicators(df['Close'].to_numpy())
+    expected = _feature_frame(df, frame).dropna()
+    assert X.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(X, expected[FEATURES].to_numpy())
+    np.testing.assert_array_equal(y, expected['Close'].to_numpy())
+    # Fold slices share the ticker's buffer instead of copying it
+    assert np.shares_memory(X[10:50], X)
+
+
+def test_backtest_stock_predicts_every_test_row():
+    summary, predictions = backtest_stock("reliance", initial=200, step=50, params=FAST)
+    _, _, y = feature_matrix("reliance")
+    assert summary['Folds'] == len(walk_forward_splits(len(y), 200, 50))
+    assert len(predictions) == summary['Test_Rows'] == len(y) - 200
+    assert predictions['Date'].is_monotonic_increasing
+    assert np.isfinite(predictions['Predicted']).all()
+    assert summary['MAE'] == pytest.approx(np.mean(np.abs(predictions['Predicted'] - predictions['Actual'])))
+
+
+def test_run_backtest_reports_failures():
+    metrics, predictions, failures, elapsed = run_backtest(
+        ["reliance", "tcs", "itc"], initial=200, step=50, params=FAST, max_workers=2)
+    assert list(metrics['Stock']) == ["RELIANCE", "TCS"]
+    assert set(predictions['Stock']) == {"RELIANCE", "TCS"}
+    assert "Not enough rows" in failures["ITC"]
+    assert elapsed > 0
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the tests.
+
+The app resolves data/ and models/ relative to the working directory.
+``workspace`` runs a test in a scratch copy of the repo's price CSVs and
+models, so stores, feature matrices and trained models written by the
+test never land in the checkout, and the tests pass from any directory.
+"""
+import glob
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+def copy_workspace(path):
+    """Copy data/*.csv and models/*.pkl into ``path``."""
+    for folder, pattern in (("data", "*.csv"), ("models", "*.pkl")):
+        os.makedirs(os.path.join(path, folder), exist_ok=True)
+        for source in glob.glob(os.path.join(ROOT, folder, pattern)):
+            shutil.copy(source, os.path.join(path, folder))
+    return path
+
+
+def _reset():
+    from utils import feature_matrix
+    from utils.model_utils import model_registry
+
+    feature_matrix.detach_all()
+    model_registry.invalidate()
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Scratch copy of data/ and models/ as the working directory."""
+    copy_workspace(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    _reset()
+    yield tmp_path
+    _reset()
+
+
+@pytest.fixture(scope="module")
+def module_workspace(tmp_path_factory):
+    """Like ``workspace``, shared by a module's expensive fixtures."""
+    path = copy_workspace(tmp_path_factory.mktemp("workspace"))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(path)
+        _reset()
+        yield path
+        _reset()
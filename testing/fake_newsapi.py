@@ -0,0 +1,191 @@
+"""
+Offline stand-ins for NewsAPI used by the tests and benchmarks.
+
+``FakeNewsAPIServer`` serves ``/v2/everything`` on localhost with generated,
+paginated articles; ``RecordedTransport`` replays recorded JSON responses
+through the ``NewsClient`` transport interface.
+"""
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_articles(query, start, end, per_day=3, shared_per_day=0):
+    """
+    Generate deterministic articles for every day in a range.
+    
+    ``shared_per_day`` market-wide stories per day get the same URL for every
+    query, to exercise deduplication across tickers.
+    """
+    start, end = date.fromisoformat(str(start)[:10]), date.fromisoformat(str(end)[:10])
+    ticker = query.split()[0].upper()
+    articles = []
+    day = start
+    while day <= end:
+        for i in range(per_day):
+            mood = ("surges on strong results", "falls after weak guidance", "holds steady")[i % 3]
+            articles.append({
+                "source": {"id": None, "name": "Fake Wire"},
+                "title": f"{ticker} {mood} ({day.isoformat()} #{i})",
+                "description": f"{ticker} coverage for {day.isoformat()}",
+                "url": f"https://news.example.com/{ticker.lower()}/{day.isoformat()}/{i}",
+                "publishedAt": f"{day.isoformat()}T{9 + i:02d}:00:00Z",
+            })
+        for i in range(shared_per_day):
+            articles.append({
+                "source": {"id": None, "name": "Fake Wire"},
+                "title": f"Sensex ends higher in broad rally ({day.isoformat()} #{i})",
+                "description": "Market wrap",
+                "url": f"https://news.example.com/markets/{day.isoformat()}/{i}",
+                "publishedAt": f"{day.isoformat()}T15:30:00Z",
+            })
+        day += timedelta(days=1)
+    return articles
+
+
+class FakeNewsAPIServer:
+    """
+    Local HTTP server mimicking NewsAPI's everything endpoint.
+    
+    Args:
+        per_day (int): Articles generated per day of the query range
+        shared_per_day (int): Market-wide articles per day shared by all queries
+        latency (float): Seconds to sleep before answering each request
+        fail_first (int): Number of initial requests answered with HTTP 429
+        retry_after (str): Retry-After header sent with each 429
+    """
+
+    def __init__(self, per_day=3, shared_per_day=0, latency=0.0, fail_first=0, retry_after="0"):
+        self.per_day = per_day
+        self.shared_per_day = shared_per_day
+        self.latency = latency
+        self.fail_first = fail_first
+        self.retry_after = retry_after
+        self.requests = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+                status, body = server.respond(query)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if status == 429:
+                    self.send_header("Retry-After", server.retry_after)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}/v2/everything"
+
+    def respond(self, query):
+        with self._lock:
+            self.requests.append(query)
+            failing = len(self.requests) <= self.fail_first
+        if self.latency:
+            time.sleep(self.latency)
+        if failing:
+            return 429, {"status": "error", "code": "rateLimited", "message": "Too many requests"}
+        if query.get("apiKey") in (None, "", "bad-key"):
+            return 401, {"status": "error", "code": "apiKeyInvalid", "message": "Your API key is invalid"}
+
+        articles = make_articles(query["q"], query["from"], query["to"], self.per_day, self.shared_per_day)
+        page, page_size = int(query.get("page", 1)), int(query.get("pageSize", 100))
+        chunk = articles[(page - 1) * page_size: page * page_size]
+        return 200, {"status": "ok", "totalResults": len(articles), "articles": chunk}
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class RecordedResponse:
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def json(self):
+        return self._body
+
+
+class RecordedTransport:
+    """
+    Transport replaying recorded responses in order.
+    
+    Args:
+        responses (list): (status_code, body) pairs or paths to JSON fixture
+            files holding ``{"status": ..., "body": ...}``
+    """
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(dict(params or {}))
+        entry = self._responses.pop(0)
+        if isinstance(entry, str):
+            with open(entry) as f:
+                recorded = json.load(f)
+            entry = (recorded["status"], recorded["body"])
+        return RecordedResponse(*entry)
+
+
+def load_recorded(path, end=None):
+    """
+    Load a recorded ``(status, body)`` response, optionally moved in time.
+    
+    Args:
+        path (str): JSON fixture holding ``{"status": ..., "body": ...}``
+        end (date): Day the newest article should fall on; every article's
+            publishedAt shifts by the same number of days, so replays stay
+            inside NewsAPI's rolling 30-day window
+    
+    Returns:
+        tuple: (status_code, body)
+    """
+    with open(path) as f:
+        recorded = json.load(f)
+    body = recorded["body"]
+    if end is not None and body.get("articles"):
+        newest = max(date.fromisoformat(a["publishedAt"][:10]) for a in body["articles"])
+        shift = end - newest
+        for article in body["articles"]:
+            day = date.fromisoformat(article["publishedAt"][:10]) + shift
+            article["publishedAt"] = day.isoformat() + article["publishedAt"][10:]
+    return recorded["status"], body
+
+
+class ReplayTransport:
+    """Transport answering every request with the same recorded response."""
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        return RecordedResponse(self.status_code, self.body)
@@ -0,0 +1,60 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_matrix
+from utils.model_utils import FEATURES, predict_prices, predict_range
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_publish_writes_float32_matrix_and_manifest(workspace):
+    manifest, failures = feature_matrix.publish_all(["RELIANCE", "NOSUCHSTOCK"], feature_matrix.MATRIX_DIR)
+
+    assert list(failures) == ["NOSUCHSTOCK"]
+    entry = manifest["stocks"]["RELIANCE"]
+    assert entry["columns"] == FEATURES and entry["dtype"] == "float32"
+    assert feature_matrix.read_manifest(feature_matrix.MATRIX_DIR)["stocks"].keys() == {"RELIANCE"}
+
+    matrix = feature_matrix.attach("RELIANCE")
+    assert matrix.features.dtype == np.float32
+    assert matrix.features.shape == (entry["rows"], len(FEATURES))
+    assert not matrix.features.flags.writeable
+    assert feature_matrix.attach("reliance") is matrix
+
+
+def test_matrix_predictions_match_stores(workspace):
+    from_stores = predict_range("RELIANCE", "2024-01-01", "2025-05-29", ohlc=True)
+    feature_matrix.publish_all(["RELIANCE"], feature_matrix.MATRIX_DIR)
+    assert feature_matrix.attach("RELIANCE") is not None
+
+    from_matrix = predict_range("RELIANCE", "2024-01-01", "2025-05-29", chunk_rows=40, ohlc=True)
+    pd.testing.assert_frame_equal(from_matrix, from_stores)
+    pred_df, actual_df = predict_prices("RELIANCE", "2024-01-01", "2025-05-29")
+    np.testing.assert_array_equal(pred_df['Close'], from_stores['Close_Predicted'])
+    np.testing.assert_array_equal(actual_df['Close'], from_stores['Close_Actual'])
+
+
+def test_changed_csv_falls_back_until_republished(workspace):
+    feature_matrix.publish_all(["RELIANCE"], feature_matrix.MATRIX_DIR)
+    rows = feature_matrix.attach("RELIANCE").entry["rows"]
+
+    with open(os.path.join("data", "reliance.csv")) as f:
+        last = f.read().strip().splitlines()[-1].split(",")
+    last[0] = "2025-06-02"
+    with open(os.path.join("data", "reliance.csv"), "a") as f:
+        f.write(",".join(last) + "\n")
+
+    assert feature_matrix.attach("RELIANCE") is None
+    combined = predict_range("RELIANCE", "2025-05-01", "2025-06-30")
+    assert combined['Date'].iloc[-1] == pd.Timestamp("2025-06-02")
+
+    feature_matrix.publish_all(["RELIANCE"], feature_matrix.MATRIX_DIR)
+    matrix = feature_matrix.attach("RELIANCE")
+    assert len(matrix) == rows + 1
+    pd.testing.assert_frame_equal(predict_range("RELIANCE", "2025-05-01", "2025-06-30"), combined)
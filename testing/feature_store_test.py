@@ -0,0 +1,96 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_store, price_store
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def _prices():
+    return price_store.read_price_csv(os.path.join(DATA_DIR, "reliance.csv"))
+
+
+def test_indicators_match_ta_exactly():
+    ta_momentum = pytest.importorskip("ta.momentum")
+    ta_trend = pytest.importorskip("ta.trend")
+    close = _prices()['Close']
+
+    indicators, _ = feature_store.compute_indicators(close)
+    macd = ta_trend.MACD(close=close)
+    expected = {
+        'SMA7': close.rolling(window=7).mean(),
+        'SMA21': close.rolling(window=21).mean(),
+        'RSI': ta_momentum.RSIIndicator(close=close).rsi(),
+        'MACD': macd.macd(),
+        'MACD_Signal': macd.macd_signal(),
+    }
+    for col, values in expected.items():
+        np.testing.assert_array_equal(indicators[col].to_numpy(), values.to_numpy(), err_msg=col)
+
+
+def test_incremental_update_matches_full_rebuild(tmp_path):
+    prices = _prices()
+    feature_dir = str(tmp_path)
+
+    feature_store.update_features("RELIANCE", prices.iloc[:250], feature_dir)
+    incremental = feature_store.update_features("RELIANCE", prices, feature_dir)
+    full, _ = feature_store.compute_indicators(prices['Close'])
+
+    pd.testing.assert_frame_equal(incremental[feature_store.INDICATOR_COLUMNS], full)
+
+
+def test_rewritten_history_triggers_rebuild(tmp_path):
+    prices = _prices()
+    feature_dir = str(tmp_path)
+    feature_store.update_features("RELIANCE", prices.iloc[:250], feature_dir)
+
+    shifted = prices.iloc[1:].reset_index(drop=True)
+    result = feature_store.update_features("RELIANCE", shifted, feature_dir)
+    full, _ = feature_store.compute_indicators(shifted['Close'])
+
+    pd.testing.assert_frame_equal(result[feature_store.INDICATOR_COLUMNS], full)
+
+
+def test_load_features_slices_date_range(tmp_path):
+    prices = _prices()
+    feature_store.update_features("RELIANCE", prices, str(tmp_path))
+
+    window = feature_store.load_features("RELIANCE", "2025-05-01", "2025-05-09", feature_dir=str(tmp_path))
+
+    assert window['Date'].min() >= pd.Timestamp("2025-05-01")
+    assert window['Date'].max() <= pd.Timestamp("2025-05-09")
+    assert len(window) == ((prices['Date'] >= "2025-05-01") & (prices['Date'] <= "2025-05-09")).sum()
+
+
+def test_batch_rebuild_matches_single_and_continues(tmp_path):
+    prices = _prices()
+    short = prices.iloc[:200].reset_index(drop=True)
+    feature_dir = str(tmp_path)
+
+    results = feature_store.update_features_many({"RELIANCE": prices, "SHORT": short}, feature_dir)
+    for stock, frame in (("RELIANCE", prices), ("SHORT", short)):
+        expected, _ = feature_store.compute_indicators(frame['Close'])
+        pd.testing.assert_frame_equal(results[stock][feature_store.INDICATOR_COLUMNS], expected)
+
+    # The per-ticker state saved by the batch continues correctly
+    continued = feature_store.update_features("SHORT", prices, feature_dir)
+    expected, _ = feature_store.compute_indicators(prices['Close'])
+    pd.testing.assert_frame_equal(continued[feature_store.INDICATOR_COLUMNS], expected)
+
+
+def test_load_state_uses_stored_state_and_matches_recompute(tmp_path):
+    prices = _prices()
+    feature_store.update_features("reliance", prices, str(tmp_path))
+
+    stored = feature_store.load_state("reliance", prices, str(tmp_path))
+    recomputed = feature_store.load_state("reliance", prices.iloc[:-1], str(tmp_path))
+    recomputed.update(prices['Close'].iloc[-1])
+
+    next_close = prices['Close'].iloc[-1] * 1.01
+    np.testing.assert_allclose(stored.update(next_close), recomputed.update(next_close))
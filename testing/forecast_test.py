@@ -0,0 +1,61 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.forecast import forecast_latency, forecast_prices
+from utils.indicators import compute_indicators
+from utils.model_utils import FEATURES, load_price_data, model_registry
+
+pytestmark = [pytest.mark.filterwarnings("ignore::UserWarning"), pytest.mark.usefixtures("workspace")]
+
+
+def test_first_step_uses_full_history_indicators():
+    forecast_df, actual_df = forecast_prices("RELIANCE", horizon=1)
+
+    df = load_price_data("RELIANCE")
+    close = df['Close'].to_numpy(dtype=np.float64)
+    indicators = compute_indicators(np.append(close, close[-1]))
+    tail = df.tail(22)
+    prev = tail['Close'].to_numpy()[:-1]
+    bars = tail.iloc[1:]
+    open_ = close[-1] * np.median(bars['Open'].to_numpy() / prev)
+    row = {
+        'Open': open_,
+        'High': open_ * np.median(bars['High'].to_numpy() / bars['Open'].to_numpy()),
+        'Low': open_ * np.median(bars['Low'].to_numpy() / bars['Open'].to_numpy()),
+        'Volume': bars['Volume'].mean(),
+    }
+    row.update({name: values[-1] for name, values in indicators.items()})
+    expected = model_registry.get("RELIANCE").predict(pd.DataFrame([row], columns=FEATURES))[0]
+
+    assert forecast_df['Close'].iloc[0] == pytest.approx(float(expected))
+    assert actual_df['Date'].iloc[-1] == df['Date'].iloc[-1]
+
+
+def test_forecast_dates_and_intervals():
+    forecast_latency.reset()
+    forecast_df, actual_df = forecast_prices("RELIANCE", horizon=10)
+
+    assert list(forecast_df['Horizon']) == list(range(1, 11))
+    assert forecast_df['Date'].iloc[0] > actual_df['Date'].iloc[-1]
+    assert (forecast_df['Date'].dt.dayofweek < 5).all()
+    assert (forecast_df['Lower'] < forecast_df['Close']).all()
+    assert (forecast_df['Close'] < forecast_df['Upper']).all()
+    assert np.all(np.diff(forecast_df['Upper'] - forecast_df['Lower']) > 0)
+    assert forecast_latency.stats()[10]['count'] == 1
+
+
+def test_compiled_backend_matches_xgboost():
+    xgb_df, _ = forecast_prices("RELIANCE", horizon=5, backend="xgboost")
+    compiled_df, _ = forecast_prices("RELIANCE", horizon=5, backend="compiled")
+    np.testing.assert_array_equal(xgb_df['Close'], compiled_df['Close'])
+
+
+def test_invalid_horizon_raises():
+    with pytest.raises(Exception, match="Horizon must be between"):
+        forecast_prices("RELIANCE", horizon=0)
@@ -0,0 +1,74 @@
+import glob
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import indicators, price_store
+
+ta_momentum = pytest.importorskip("ta.momentum")
+ta_trend = pytest.importorskip("ta.trend")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def _ta_reference(close):
+    close = pd.Series(close)
+    macd = ta_trend.MACD(close=close)
+    return {
+        'SMA7': close.rolling(window=7).mean().to_numpy(),
+        'SMA21': close.rolling(window=21).mean().to_numpy(),
+        'RSI': ta_momentum.RSIIndicator(close=close).rsi().to_numpy(),
+        'MACD': macd.macd().to_numpy(),
+        'MACD_Signal': macd.macd_signal().to_numpy(),
+    }
+
+
+def _closes():
+    closes = {}
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "*.csv"))):
+        df = price_store.read_price_csv(path)
+        if len(df):
+            closes[os.path.basename(path)] = df['Close'].to_numpy()
+    return closes
+
+
+def test_single_ticker_matches_ta():
+    close = _closes()["reliance.csv"]
+    result = indicators.compute_indicators(close)
+    for name, expected in _ta_reference(close).items():
+        np.testing.assert_array_equal(result[name], expected, err_msg=name)
+
+
+def test_batch_matches_ta_per_ticker():
+    closes = _closes()
+    names = list(closes)
+    batch = np.column_stack([closes[name] for name in names])
+
+    result = indicators.compute_indicators(batch)
+
+    for i, name in enumerate(names):
+        for indicator, expected in _ta_reference(closes[name]).items():
+            np.testing.assert_array_equal(result[indicator][:, i], expected, err_msg=f"{name} {indicator}")
+
+
+def test_left_padded_history_matches_unpadded():
+    close = _closes()["tcs.csv"]
+    short = close[100:]
+    padded = np.column_stack([close, np.concatenate([np.full(100, np.nan), short])])
+
+    result = indicators.compute_indicators(padded)
+
+    for indicator, expected in _ta_reference(short).items():
+        np.testing.assert_array_equal(result[indicator][100:, 1], expected, err_msg=indicator)
+        assert np.isnan(result[indicator][:100, 1]).all()
+
+
+def test_sma_helper():
+    close = np.arange(1.0, 11.0)
+    np.testing.assert_array_equal(indicators.sma(close, 3)[2:], np.arange(2.0, 10.0))
+    assert np.isnan(indicators.sma(close, 3)[:2]).all()
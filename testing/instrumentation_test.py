@@ -0,0 +1,104 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import instrumentation
+from utils.instrumentation import Recorder, span, traced
+
+
+@pytest.fixture(autouse=True)
+def recorder(monkeypatch, tmp_path):
+    fresh = Recorder(trace_file=str(tmp_path / "spans.jsonl"))
+    monkeypatch.setattr(instrumentation, "recorder", fresh)
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.enable()
+    yield fresh
+    instrumentation.enable(was_enabled)
+
+
+@traced("request")
+def _request():
+    with span("load"):
+        with span("parse"):
+            pass
+    with span("score"):
+        pass
+    return 42
+
+
+def test_nested_spans_form_one_trace(recorder, tmp_path):
+    assert _request() == 42
+
+    (trace,) = recorder.recent_traces()
+    assert trace["name"] == "request"
+    assert [child["path"] for child in trace["children"]] == ["request/load/parse", "request/load", "request/score"]
+    assert trace["ms"] >= max(child["ms"] for child in trace["children"])
+
+    with open(tmp_path / "spans.jsonl") as f:
+        assert [json.loads(line)["name"] for line in f] == ["request"]
+
+
+def test_disabled_spans_record_nothing(recorder):
+    instrumentation.enable(False)
+    assert span("load") is span("score")
+    assert _request() == 42
+    assert recorder.summary() == []
+    assert recorder.recent_traces() == []
+
+
+def test_thread_flag_records_only_that_thread(recorder):
+    import threading
+
+    instrumentation.enable(False)
+    instrumentation.enable_thread(session="a")
+    try:
+        other = threading.Thread(target=lambda: _request())
+        other.start()
+        other.join()
+        assert recorder.recent_traces() == []
+
+        _request()
+        assert [trace["name"] for trace in recorder.recent_traces()] == ["request"]
+        assert len(recorder.recent_traces(session="a")) == 1
+        assert recorder.recent_traces(session="b") == []
+    finally:
+        instrumentation.enable_thread(False)
+
+
+def test_failed_span_is_recorded_with_error(recorder):
+    with pytest.raises(KeyError):
+        with span("lookup"):
+            raise KeyError("missing")
+    (trace,) = recorder.recent_traces("lookup")
+    assert trace["error"] == "KeyError"
+
+
+def test_prometheus_text_aggregates_paths(recorder):
+    _request()
+    _request()
+    text = instrumentation.prometheus_text(prefix="app")
+
+    assert "# TYPE app_span_seconds summary" in text
+    assert 'app_span_seconds_count{span="request/load/parse"} 2' in text
+    counts = {row["span"]: row["count"] for row in recorder.summary()}
+    assert counts == {"request": 2, "request/load": 2, "request/load/parse": 2, "request/score": 2}
+
+
+def test_profiled_calls_write_one_dump_each(monkeypatch, tmp_path):
+    pstats = pytest.importorskip("pstats")
+    profile_dir = tmp_path / "profiles"
+    monkeypatch.setattr(instrumentation, "PERF_PROFILE_DIR", str(profile_dir))
+
+    @traced("work", profile_calls=True)
+    def work():
+        return sum(range(1000))
+
+    work()
+    work()
+    dumps = sorted(os.listdir(profile_dir))
+    assert len(dumps) == 2 and all(name.startswith("work-") and name.endswith(".prof") for name in dumps)
+    pstats.Stats(str(profile_dir / dumps[0]))
@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+
+from textblob import TextBlob
+from textblob.en import sentiment as pattern_sentiment
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.lexicon_sentiment import LexiconSentimentScorer, tokenize
+from utils.sentiment_utils import score_headlines
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sentiment_corpus.jsonl")
+
+
+def load_corpus():
+    with open(CORPUS, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_matches_recorded_textblob_polarity():
+    corpus = load_corpus()
+    scores = LexiconSentimentScorer().polarity([row["text"] for row in corpus])
+    assert scores == [row["polarity"] for row in corpus]
+
+
+def test_matches_live_textblob():
+    scorer = LexiconSentimentScorer()
+    for row in load_corpus():
+        assert scorer.score(row["text"]) == TextBlob(row["text"]).sentiment.polarity, row["text"]
+
+
+def test_tokenize_matches_pattern():
+    texts = [
+        "Dr. Reddy's shares tank... not good (!)",
+        'He said "terrible" :-( and left.\n\nNew paragraph :D',
+        "U.S. markets rally!!",
+        "",
+    ]
+    for text in texts:
+        expected = [w.lower() for w in " ".join(pattern_sentiment.tokenizer(text)).split()]
+        assert tokenize(text) == expected
+
+
+def test_score_headlines_lexicon_scorer():
+    headlines = ["Great results", "Not a good day", "Great results"]
+    assert score_headlines(headlines, "lexicon") == score_headlines(headlines, "textblob")
@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.backtest import feature_matrix
+from utils.model_utils import (FEATURES, ModelRegistry, _load_pickle, check_features, find_model_file,
+                               load_model_file, metadata_path, model_path, save_model)
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+
+
+@pytest.fixture(scope="module")
+def reliance_model():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return _load_pickle(os.path.join(MODELS_DIR, "reliance.pkl"))
+
+
+@pytest.fixture(scope="module")
+def features(module_workspace):
+    _, X, _ = feature_matrix("reliance")
+    return pd.DataFrame(X, columns=FEATURES)
+
+
+@pytest.mark.parametrize("fmt", ["ubj", "json"])
+def test_native_round_trip_predicts_identically(tmp_path, reliance_model, features, fmt):
+    path = save_model(reliance_model, "RELIANCE", str(tmp_path), fmt=fmt, version="v1", keep_other_formats=True)
+    assert path == model_path("reliance", str(tmp_path), fmt)
+    with open(metadata_path("reliance", str(tmp_path))) as f:
+        meta = json.load(f)
+    assert meta["features"] == FEATURES
+    assert meta["version"] == "v1"
+
+    loaded = load_model_file(path)
+    np.testing.assert_array_equal(loaded.predict(features), reliance_model.predict(features))
+
+
+def test_lookup_prefers_native_and_save_replaces_other_formats(tmp_path, reliance_model):
+    models_dir = str(tmp_path)
+    save_model(reliance_model, "reliance", models_dir, fmt="pkl")
+    assert find_model_file("reliance", models_dir).endswith(".pkl")
+
+    save_model(reliance_model, "reliance", models_dir, fmt="ubj", keep_other_formats=True)
+    assert find_model_file("reliance", models_dir).endswith(".ubj")
+    assert os.path.exists(model_path("reliance", models_dir, "pkl"))
+
+    registry = ModelRegistry(models_dir=models_dir)
+    assert registry.get("reliance").get_booster().feature_names == FEATURES
+
+    # The other native file goes; the pickle stays unless asked for
+    save_model(reliance_model, "reliance", models_dir, fmt="json")
+    assert sorted(os.listdir(models_dir)) == ["reliance.json", "reliance.meta.json", "reliance.pkl"]
+    assert find_model_file("reliance", models_dir).endswith(".json")
+
+    save_model(reliance_model, "reliance", models_dir, fmt="ubj", remove_pickle=True)
+    assert sorted(os.listdir(models_dir)) == ["reliance.meta.json", "reliance.ubj"]
+
+
+def test_feature_order_is_validated(tmp_path, reliance_model):
+    path = save_model(reliance_model, "reliance", str(tmp_path), fmt="ubj")
+    meta_file = metadata_path("reliance", str(tmp_path))
+    with open(meta_file) as f:
+        meta = json.load(f)
+    meta["features"] = list(reversed(FEATURES))
+    with open(meta_file, "w") as f:
+        json.dump(meta, f)
+    with pytest.raises(ValueError, match="do not match metadata"):
+        load_model_file(path)
+
+    os.remove(meta_file)
+    with pytest.raises(FileNotFoundError):
+        load_model_file(path)
+
+    model = load_model_file(save_model(reliance_model, "reliance", str(tmp_path), fmt="ubj"))
+    check_features(model, "RELIANCE")
+    model.get_booster().feature_names = list(reversed(FEATURES))
+    with pytest.raises(ValueError, match="supported: "):
+        check_features(model, "RELIANCE")
@@ -0,0 +1,75 @@
+import os
+import sys
+import pickle
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.model_utils import ModelRegistry
+
+
+def _write_model(models_dir, name, value, pad=0):
+    path = os.path.join(models_dir, f"{name}.pkl")
+    with open(path, "wb") as f:
+        pickle.dump({"value": value, "pad": b"x" * pad}, f)
+    return path
+
+
+def test_registry_hits_after_first_load(tmp_path):
+    _write_model(tmp_path, "reliance", 1)
+    registry = ModelRegistry(models_dir=str(tmp_path))
+
+    first = registry.get("RELIANCE")
+    second = registry.get("reliance")
+
+    assert first is second
+    stats = registry.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_registry_reloads_when_file_changes(tmp_path):
+    path = _write_model(tmp_path, "tcs", 1)
+    registry = ModelRegistry(models_dir=str(tmp_path))
+    assert registry.get("TCS")["value"] == 1
+
+    _write_model(tmp_path, "tcs", 2, pad=10)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert registry.get("TCS")["value"] == 2
+    assert registry.stats()["reloads"] == 1
+
+
+def test_registry_evicts_least_recently_used(tmp_path):
+    for name in ("a", "b", "c"):
+        _write_model(tmp_path, name, name)
+    registry = ModelRegistry(max_models=2, models_dir=str(tmp_path))
+
+    registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")
+
+    stats = registry.stats()
+    assert stats["models"] == ["a", "c"]
+    assert stats["evictions"] == 1
+
+
+def test_registry_respects_byte_budget(tmp_path):
+    size_a = os.path.getsize(_write_model(tmp_path, "a", 1, pad=1000))
+    _write_model(tmp_path, "b", 2, pad=1000)
+    registry = ModelRegistry(max_models=None, max_bytes=size_a + 10, models_dir=str(tmp_path))
+
+    registry.get("a")
+    registry.get("b")
+
+    assert registry.stats()["models"] == ["b"]
+
+
+def test_registry_missing_model(tmp_path):
+    registry = ModelRegistry(models_dir=str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        registry.get("INFY")
+
@@ -0,0 +1,69 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from testing.fake_newsapi import FakeNewsAPIServer, RecordedTransport
+from utils.news_client import NewsAPIError, NewsClient
+
+
+def test_paginates_up_to_article_budget():
+    with FakeNewsAPIServer(per_day=10) as server:
+        client = NewsClient(api_key="test", endpoint=server.endpoint, page_size=20, max_articles=70)
+        articles = client.everything("TCS stock", date(2025, 5, 1), date(2025, 5, 10))
+
+    assert len(articles) == 70
+    assert len({a["url"] for a in articles}) == 70
+    assert sorted(int(r["page"]) for r in server.requests) == [1, 2, 3, 4]
+    assert articles.total_results == 100 and articles.truncated
+    assert server.requests[0]["to"] == "2025-05-10T23:59:59"
+
+
+def test_no_budget_fetches_every_page():
+    with FakeNewsAPIServer(per_day=10) as server:
+        client = NewsClient(api_key="test", endpoint=server.endpoint, page_size=30, max_articles=None)
+        articles = client.everything("TCS stock", date(2025, 5, 1), date(2025, 5, 10))
+
+    assert len(articles) == 100 and not articles.truncated
+    assert sorted(int(r["page"]) for r in server.requests) == [1, 2, 3, 4]
+
+
+def test_budgets_below_one_are_rejected():
+    with pytest.raises(ValueError, match="at least 1"):
+        NewsClient(api_key="test", transport=object(), max_articles=0)
+    client = NewsClient(api_key="test", transport=object())
+    with pytest.raises(ValueError, match="at least 1"):
+        client.everything("TCS stock", date(2025, 5, 1), date(2025, 5, 1), max_articles=0)
+
+
+def test_retries_rate_limited_requests():
+    delays = []
+    with FakeNewsAPIServer(fail_first=2) as server:
+        client = NewsClient(api_key="test", endpoint=server.endpoint, sleep=delays.append)
+        articles = client.everything("INFY stock", date(2025, 5, 1), date(2025, 5, 2))
+
+    assert len(articles) == 6
+    assert client.stats() == {"requests": 3, "retries": 2}
+    assert delays == [0.0, 0.0]  # the fake server sends Retry-After: 0
+
+
+def test_exponential_backoff_without_retry_after():
+    transport = RecordedTransport([(503, {}), (503, {}), (200, {"totalResults": 0, "articles": []})])
+    delays = []
+    client = NewsClient(api_key="test", transport=transport, backoff=0.5, sleep=delays.append)
+
+    assert client.everything("SBIN stock", date(2025, 5, 1), date(2025, 5, 1)) == []
+    assert delays == [0.5, 1.0]
+
+
+def test_client_errors_are_not_retried():
+    transport = RecordedTransport([(401, {"message": "Your API key is invalid"})])
+    client = NewsClient(api_key="bad-key", transport=transport, sleep=lambda _: None)
+
+    with pytest.raises(NewsAPIError, match="invalid") as excinfo:
+        client.everything("LT stock", date(2025, 5, 1), date(2025, 5, 1))
+    assert excinfo.value.status_code == 401
+    assert len(transport.calls) == 1
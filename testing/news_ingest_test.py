@@ -0,0 +1,93 @@
+import asyncio
+import os
+import sqlite3
+import sys
+import time
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from testing.fake_newsapi import FakeNewsAPIServer
+from utils.news_ingest import AsyncNewsIngestor, TokenBucket, ingest_news
+from utils.sentiment_cache import ArticleStore, SentimentCache
+
+
+def test_ingest_dedupes_across_tickers_and_feeds_the_cache(tmp_path):
+    store = ArticleStore(str(tmp_path / "news.db"))
+    with FakeNewsAPIServer(per_day=2, shared_per_day=1, fail_first=1) as server:
+        summary = ingest_news(
+            ["TCS", "INFY", "WIPRO"], date(2025, 5, 1), date(2025, 5, 3), store=store,
+            api_key="test", endpoint=server.endpoint, rate=100, burst=10,
+        )
+
+    assert summary["errors"] == {}
+    assert summary["retries"] == 1
+    assert all(len(articles) == 9 for articles in summary["articles"].values())
+    # 3 tickers x 3 days x 2 own stories + 3 shared market wraps
+    assert summary["unique_urls"] == 21
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 21
+
+    def fail(*args):
+        raise AssertionError("ingested days should not be refetched")
+
+    cache = SentimentCache(store=store)
+    articles = cache.get_articles("INFY", date(2025, 5, 1), date(2025, 5, 3), fail)
+    assert len(articles) == 9
+
+
+def test_ingest_reports_per_ticker_errors():
+    with FakeNewsAPIServer() as server:
+        summary = ingest_news(["TCS"], date(2025, 5, 1), date(2025, 5, 1), api_key="bad-key",
+                              endpoint=server.endpoint)
+
+    assert "invalid" in summary["errors"]["TCS"]
+    assert summary["articles"] == {}
+
+
+def test_truncated_ranges_are_split_and_stored_per_part(tmp_path):
+    store = ArticleStore(str(tmp_path / "news.db"))
+    with FakeNewsAPIServer(per_day=3) as server:
+        summary = ingest_news(["TCS"], date(2025, 5, 1), date(2025, 5, 4), store=store, api_key="test",
+                              endpoint=server.endpoint, rate=100, burst=10, max_articles=5)
+
+    # 12 articles > 5: halves of 6 still do not fit, single days of 3 do
+    assert len(summary["articles"]["TCS"]) == 12
+    assert sorted((r["from"], r["to"]) for r in server.requests)[0] == ("2025-05-01", "2025-05-01T23:59:59")
+    assert len(server.requests) == 7
+    assert all(store.get_day("TCS", date(2025, 5, d))[2] for d in range(1, 5))
+
+
+def test_days_over_budget_are_stored_incomplete(tmp_path):
+    store = ArticleStore(str(tmp_path / "news.db"))
+    with FakeNewsAPIServer(per_day=4) as server:
+        ingest_news(["TCS"], date(2025, 5, 1), date(2025, 5, 2), store=store, api_key="test",
+                    endpoint=server.endpoint, rate=100, burst=10, max_articles=3)
+
+    articles, _, complete = store.get_day("TCS", date(2025, 5, 2))
+    assert len(articles) == 3 and not complete
+
+
+def test_retry_after_dates_and_long_waits_are_bounded():
+    ingestor = AsyncNewsIngestor(backoff=0.5, max_backoff=2.0)
+    assert ingestor._delay(0, "3600") == 2.0
+    assert ingestor._delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 1.0
+
+    with FakeNewsAPIServer(fail_first=1, retry_after="Wed, 21 Oct 2015 07:28:00 GMT") as server:
+        summary = ingest_news(["TCS"], date(2025, 5, 1), date(2025, 5, 1), api_key="test",
+                              endpoint=server.endpoint, backoff=0.01)
+
+    assert summary["errors"] == {}
+    assert summary["retries"] == 1
+
+
+def test_token_bucket_limits_rate():
+    async def run():
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # The first token is available immediately, the other five take 20 ms each
+    assert asyncio.run(run()) >= 0.09
@@ -0,0 +1,136 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.plotting_utils import (WEBGL_MIN_POINTS, downsample, lttb_indices, plot_candlestick, plot_ohlc,
+                                  plot_sentiment, resample_ohlc)
+
+
+def _prices(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        'Date': pd.bdate_range("1990-01-01", periods=n),
+        'Open': close * 0.999,
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close_Actual': close,
+        'Close_Predicted': close * 1.002,
+    })
+
+
+def _reference_lttb(x, y, n_out):
+    # Straightforward transcription of Steinarsson's algorithm
+    n = len(y)
+    every = (n - 2) / (n_out - 2)
+    a, kept = 0, [0]
+    for i in range(n_out - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        if i == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_hi = min(int((i + 2) * every) + 1, n)
+            next_x, next_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(np.argmax(area))
+        kept.append(a)
+    return np.array(kept + [n - 1])
+
+
+@pytest.mark.parametrize("n", [3000, 100000])
+@pytest.mark.parametrize("n_out", [3, 17, 500])
+def test_lttb_matches_reference(n, n_out):
+    x = np.arange(n, dtype=np.float64)
+    y = np.random.default_rng(1).normal(size=n).cumsum()
+    np.testing.assert_array_equal(lttb_indices(x, y, n_out), _reference_lttb(x, y, n_out))
+
+
+def test_lttb_keeps_spikes_and_endpoints():
+    df = _prices(20000)
+    df.loc[7777, 'Close_Actual'] *= 3
+    df.loc[12345, 'Close_Actual'] /= 3
+    kept = lttb_indices(df['Date'].to_numpy(), df['Close_Actual'].to_numpy(), 400)
+
+    assert len(kept) == 400
+    assert kept[0] == 0 and kept[-1] == len(df) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert 7777 in kept and 12345 in kept
+    assert 7777 not in downsample(df, 400).index
+    assert list(lttb_indices(np.arange(5), np.arange(5.0), 10)) == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        lttb_indices(np.arange(5), np.arange(5.0), 2)
+
+
+def test_downsample_with_column_uses_lttb():
+    df = _prices(5000)
+    df.loc[2500, 'Close_Actual'] *= 3
+    thinned = downsample(df, 300, y='Close_Actual')
+
+    assert len(thinned) == 300
+    assert df['Close_Actual'].max() == thinned['Close_Actual'].max()
+
+
+def test_line_plot_traces_share_downsampled_dates():
+    df = _prices(5000)
+    df['Close_Predicted'] = df['Close_Actual'].iloc[::-1].to_numpy()
+    fig = plot_candlestick(df, max_points=300)
+
+    assert len(fig.data[0].x) == 300
+    assert list(fig.data[0].x) == list(fig.data[1].x)
+
+
+def test_resample_ohlc_merges_bars():
+    df = _prices(1000).rename(columns={'Close_Actual': 'Close'})
+    bars = resample_ohlc(df, 100)
+
+    assert len(bars) == 100
+    assert bars['Date'].iloc[0] == df['Date'].iloc[0]
+    assert bars['Open'].iloc[0] == df['Open'].iloc[0]
+    assert bars['High'].iloc[0] == df['High'].iloc[:10].max()
+    assert bars['Low'].iloc[-1] == df['Low'].iloc[-10:].min()
+    assert bars['Close'].iloc[-1] == df['Close'].iloc[-1]
+    assert bars['High'].max() == df['High'].max()
+    assert resample_ohlc(df, 5000) is df
+
+
+def test_long_series_use_webgl():
+    short = plot_candlestick(_prices(50))
+    long = plot_candlestick(_prices(20000), max_points=WEBGL_MIN_POINTS + 1)
+
+    assert [trace.type for trace in short.data] == ['scatter', 'scatter']
+    assert short.data[0].mode == 'lines+markers'
+    assert [trace.type for trace in long.data] == ['scattergl', 'scattergl']
+    assert long.data[0].mode == 'lines'
+    assert len(long.data[0].x) == WEBGL_MIN_POINTS + 1
+
+
+def test_plot_ohlc_draws_candles_and_prediction():
+    df = _prices(5000)
+    fig = plot_ohlc(df, max_points=250)
+
+    assert [trace.type for trace in fig.data] == ['candlestick', 'scatter']
+    assert len(fig.data[0].x) == 250
+    assert max(fig.data[0].high) == df['High'].max()
+    assert len(fig.data[1].y) == 250
+
+    missing = plot_ohlc(df[['Date', 'Close_Actual', 'Close_Predicted']])
+    assert len(missing.data) == 0
+    assert "Missing columns" in missing.layout.annotations[0].text
+
+
+def test_plot_sentiment_downsamples_long_timelines():
+    days = pd.date_range("2015-01-01", periods=3000)
+    df = pd.DataFrame({
+        'Date': np.repeat(days, 2),
+        'Sentiment': np.tile(['POSITIVE', 'NEGATIVE'], len(days)),
+        'Score': 0.0,
+    })
+    fig = plot_sentiment(df, max_points=500)
+
+    assert [len(trace.x) for trace in fig.data] == [500, 500]
+    assert fig.data[0].name == 'POSITIVE (3000 total)'
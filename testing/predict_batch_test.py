@@ -0,0 +1,25 @@
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.model_utils import predict_prices, predict_prices_batch
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_predict_prices_batch_matches_single_stock_predictions(workspace):
+    result, failures = predict_prices_batch(["RELIANCE", "NOSUCHSTOCK"], date(2025, 5, 1), date(2025, 5, 20))
+
+    assert set(result['Stock']) == {"RELIANCE"}
+    assert list(result.columns) == ['Stock', 'Date', 'Actual', 'Predicted', 'Error']
+    assert list(failures) == ["NOSUCHSTOCK"]
+
+    pred_df, actual_df = predict_prices("RELIANCE", date(2025, 5, 1), date(2025, 5, 20))
+    assert list(result['Date']) == list(pred_df['Date'])
+    np.testing.assert_array_equal(result['Predicted'].to_numpy(), pred_df['Close'].to_numpy())
+    np.testing.assert_array_equal(result['Actual'].to_numpy(), actual_df['Close'].to_numpy())
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_store, model_utils
+from utils.model_utils import iter_predictions, load_price_data, predict_prices, predict_range
+from utils.plotting_utils import downsample, plot_candlestick
+
+pytestmark = [pytest.mark.filterwarnings("ignore::UserWarning"), pytest.mark.usefixtures("workspace")]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 37, 10000])
+def test_predict_range_matches_predict_prices(chunk_rows):
+    combined = predict_range("RELIANCE", "2024-01-01", "2025-05-29", chunk_rows=chunk_rows)
+    pred_df, actual_df = predict_prices("RELIANCE", "2024-01-01", "2025-05-29")
+
+    assert list(combined.columns) == ['Date', 'Close_Actual', 'Close_Predicted']
+    assert combined['Date'].tolist() == pred_df['Date'].tolist()
+    np.testing.assert_array_equal(combined['Close_Actual'], actual_df['Close'])
+    np.testing.assert_array_equal(combined['Close_Predicted'], pred_df['Close'])
+
+
+def test_predict_range_with_ohlc_columns():
+    combined = predict_range("RELIANCE", "2025-05-01", "2025-05-29", ohlc=True)
+    prices = load_price_data("RELIANCE").set_index('Date').loc[combined['Date']]
+
+    assert list(combined.columns) == ['Date', 'Open', 'High', 'Low', 'Close_Actual', 'Close_Predicted']
+    np.testing.assert_array_equal(combined['High'], prices['High'])
+
+
+def test_iter_predictions_yields_bounded_chunks():
+    chunks = list(iter_predictions("RELIANCE", "2024-06-01", "2025-05-29", chunk_rows=50))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    dates = pd.concat([chunk['Date'] for chunk in chunks])
+    assert dates.is_monotonic_increasing and dates.is_unique
+
+
+def test_iter_predictions_without_writable_stores(monkeypatch):
+    monkeypatch.setattr(model_utils, "_open_stores", lambda stock: None)
+    streamed = pd.concat(iter_predictions("RELIANCE", "2025-01-01", "2025-05-29", chunk_rows=20), ignore_index=True)
+
+    expected = predict_range("RELIANCE", "2025-01-01", "2025-05-29")
+    pd.testing.assert_frame_equal(streamed, expected)
+
+
+def test_predict_range_reports_empty_range():
+    with pytest.raises(Exception, match="No data available for the specified date range"):
+        predict_range("RELIANCE", "1990-01-01", "1990-12-31")
+
+
+def test_feature_store_is_current():
+    dates = load_price_data("RELIANCE")['Date']
+    predict_range("RELIANCE", "2025-05-01", "2025-05-29")
+
+    assert feature_store.is_current("RELIANCE", dates)
+    assert not feature_store.is_current("RELIANCE", dates[:-1])
+
+
+def test_downsample_keeps_endpoints_and_budget():
+    df = pd.DataFrame({'Date': pd.bdate_range("2015-01-01", periods=5000), 'Close_Actual': np.arange(5000.0)})
+    df['Close_Predicted'] = df['Close_Actual']
+
+    thinned = downsample(df, 300)
+    assert len(thinned) == 300
+    assert thinned['Date'].iloc[0] == df['Date'].iloc[0]
+    assert thinned['Date'].iloc[-1] == df['Date'].iloc[-1]
+    short = df.head(10)
+    assert downsample(short, 300) is short
+    assert len(plot_candlestick(df, max_points=300).data[0].x) == 300
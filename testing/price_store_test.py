@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import price_store
+from utils.model_utils import load_price_data
+
+CSV = """Date,Close,High,Low,Open,Volume
+,TEST.NS,TEST.NS,TEST.NS,TEST.NS,TEST.NS
+2024-01-03,12.0,13.0,11.0,11.5,300
+2024-01-01,10.0,11.0,9.0,9.5,100
+2024-01-02,11.0,12.0,10.0,10.5,200
+"""
+
+
+def _write_csv(data_dir, text=CSV):
+    path = os.path.join(data_dir, "test.csv")
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+
+def test_read_price_csv_drops_ticker_row_and_sorts(tmp_path):
+    df = price_store.read_price_csv(_write_csv(tmp_path))
+
+    assert list(df.columns) == ['Date'] + price_store.PRICE_COLUMNS
+    assert df['Close'].tolist() == [10.0, 11.0, 12.0]
+    assert df['Date'].is_monotonic_increasing
+
+
+def test_store_round_trip_and_date_slice(tmp_path):
+    _write_csv(tmp_path)
+    store_dir = os.path.join(tmp_path, "store")
+    price_store.ingest_csv("TEST", str(tmp_path), store_dir)
+
+    assert price_store.is_fresh("TEST", str(tmp_path), store_dir)
+    df = price_store.load_store("TEST", columns=['Close'], start="2024-01-02", end="2024-01-02", store_dir=store_dir)
+    assert list(df.columns) == ['Date', 'Close']
+    assert df['Close'].tolist() == [11.0]
+
+
+def test_loader_falls_back_to_csv_when_store_is_stale(tmp_path):
+    path = _write_csv(tmp_path)
+    store_dir = os.path.join(tmp_path, "store")
+    price_store.ingest_csv("TEST", str(tmp_path), store_dir)
+
+    _write_csv(tmp_path, CSV + "2024-01-04,13.0,14.0,12.0,12.5,400\n")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert not price_store.is_fresh("TEST", str(tmp_path), store_dir)
+
+    df = load_price_data("TEST", columns=['Close'], data_dir=str(tmp_path), store_dir=store_dir)
+    assert df['Close'].tolist() == [10.0, 11.0, 12.0, 13.0]
+    # The fallback refreshes the store for the next request
+    assert price_store.is_fresh("TEST", str(tmp_path), store_dir)
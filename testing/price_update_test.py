@@ -0,0 +1,103 @@
+import os
+import shutil
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.price_store import read_price_csv
+from utils.price_update import last_stored_date, read_bars, refresh_prices
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+class StubDownloader:
+    """Serves yfinance-shaped multi-ticker frames from an in-memory bar set."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = []
+
+    def __call__(self, tickers, start, end):
+        self.calls.append((list(tickers), start, end))
+        frames = {}
+        for ticker in tickers:
+            df = self.bars[ticker]
+            frames[ticker] = df[(df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))]
+        out = pd.concat(frames, axis=1)
+        out.index.name = 'Date'
+        return out
+
+
+def make_bars(start, end, base):
+    dates = pd.bdate_range(start, end)
+    close = base + np.arange(len(dates)) * 0.25
+    return pd.DataFrame({
+        'Close': close, 'High': close + 1, 'Low': close - 1, 'Open': close + 0.5,
+        'Volume': np.arange(len(dates)) + 1000,
+    }, index=dates)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name in ("reliance.csv", "tcs.csv"):
+        shutil.copy(os.path.join(DATA_DIR, name), tmp_path / name)
+    return str(tmp_path)
+
+
+def test_fetches_only_missing_bars_in_one_call(data_dir):
+    reliance_before = open(os.path.join(data_dir, "reliance.csv")).read().splitlines()
+    last = last_stored_date(os.path.join(data_dir, "reliance.csv"))
+    stub = StubDownloader({
+        "RELIANCE.NS": make_bars("2024-01-01", "2025-06-13", 1400.0),
+        "TCS.NS": make_bars("2024-01-01", "2025-06-13", 3400.0),
+        "INFY.NS": make_bars("2024-01-01", "2025-06-13", 1500.0),
+    })
+
+    appended = refresh_prices(["RELIANCE", "TCS", "INFY"], end=date(2025, 6, 13), data_dir=data_dir,
+                              download=stub, default_start="2025-06-02")
+
+    assert len(stub.calls) == 1
+    tickers, start, end = stub.calls[0]
+    assert tickers == ["RELIANCE.NS", "TCS.NS", "INFY.NS"]
+    tcs_last = last_stored_date(os.path.join(data_dir, "tcs.csv"))
+    assert start == min(last, tcs_last) + pd.Timedelta(days=1)
+    assert end == date(2025, 6, 14)
+
+    expected_new = len(pd.bdate_range(pd.Timestamp(last) + pd.Timedelta(days=1), "2025-06-13"))
+    assert appended["RELIANCE"] == expected_new
+    assert appended["INFY"] == len(pd.bdate_range("2025-06-02", "2025-06-13"))
+
+    # Existing rows are kept verbatim; the junk ticker row is gone
+    reliance_after = open(os.path.join(data_dir, "reliance.csv")).read().splitlines()
+    assert reliance_after[0] == reliance_before[0]
+    assert reliance_after[1:len(reliance_before) - 1] == reliance_before[2:]
+    assert len(read_bars(os.path.join(data_dir, "reliance.csv"))) == len(reliance_after) - 1
+
+    df = read_price_csv(os.path.join(data_dir, "reliance.csv"))
+    assert df['Date'].is_monotonic_increasing and df['Date'].is_unique
+    assert last_stored_date(os.path.join(data_dir, "reliance.csv")) == date(2025, 6, 13)
+    assert not [name for name in os.listdir(data_dir) if ".tmp-" in name]
+
+
+def test_up_to_date_stocks_are_not_downloaded(data_dir):
+    stub = StubDownloader({"RELIANCE.NS": make_bars("2024-01-01", "2025-06-13", 1400.0)})
+    end = last_stored_date(os.path.join(data_dir, "reliance.csv"))
+    assert refresh_prices(["RELIANCE"], end=end, data_dir=data_dir, download=stub) == {"RELIANCE": 0}
+    assert stub.calls == []
+
+
+def test_download_errors_leave_files_untouched(data_dir):
+    path = os.path.join(data_dir, "reliance.csv")
+    before = open(path).read()
+
+    def failing(tickers, start, end):
+        raise ConnectionError("offline")
+
+    with pytest.raises(Exception, match="Error downloading prices: offline"):
+        refresh_prices(["RELIANCE"], end=date(2025, 6, 13), data_dir=data_dir, download=failing)
+    assert open(path).read() == before
@@ -0,0 +1,129 @@
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.news_client import ArticleList
+from utils.sentiment_cache import ArticleStore, SentimentCache
+
+
+class FakeNews:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((start, end))
+        articles = []
+        for day in range(start.day, end.day + 1):
+            articles.append({
+                "title": f"{ticker} news {day}",
+                "url": f"https://example.com/{ticker}/{day}",
+                "publishedAt": f"2025-05-{day:02d}T09:00:00Z",
+            })
+        return articles
+
+
+class BudgetedNews(FakeNews):
+    """Returns at most ``budget`` of ``per_day`` articles a day, like a capped NewsAPI query."""
+
+    def __init__(self, per_day, budget):
+        super().__init__()
+        self.per_day = per_day
+        self.budget = budget
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((start, end))
+        articles = [{
+            "title": f"{ticker} news {day}.{n}",
+            "url": f"https://example.com/{ticker}/{day}/{n}",
+            "publishedAt": f"2025-05-{day:02d}T09:00:00Z",
+        } for day in range(start.day, end.day + 1) for n in range(self.per_day)]
+        return ArticleList(articles[:self.budget], len(articles))
+
+
+def _clock(*args):
+    return lambda: datetime(*args).timestamp()
+
+
+def test_overlapping_ranges_fetch_only_missing_days(tmp_path):
+    fetch = FakeNews()
+    cache = SentimentCache(store=ArticleStore(str(tmp_path / "news.db")), clock=_clock(2025, 6, 1))
+
+    first = cache.get_articles("RELIANCE", date(2025, 5, 1), date(2025, 5, 5), fetch)
+    second = cache.get_articles("RELIANCE", date(2025, 5, 3), date(2025, 5, 8), fetch)
+
+    assert len(first) == 5
+    assert [a["title"] for a in second] == [f"RELIANCE news {d}" for d in range(3, 9)]
+    assert fetch.calls == [(date(2025, 5, 1), date(2025, 5, 5)), (date(2025, 5, 6), date(2025, 5, 8))]
+    assert cache.stats()["memory_hits"] == 3
+
+
+def test_disk_tier_survives_new_process(tmp_path):
+    path = str(tmp_path / "news.db")
+    fetch = FakeNews()
+    SentimentCache(store=ArticleStore(path), clock=_clock(2025, 6, 1)).get_articles(
+        "TCS", date(2025, 5, 1), date(2025, 5, 2), fetch)
+
+    cache = SentimentCache(store=ArticleStore(path), clock=_clock(2025, 6, 1))
+    articles = cache.get_articles("TCS", date(2025, 5, 1), date(2025, 5, 2), fetch)
+
+    assert len(articles) == 2
+    assert len(fetch.calls) == 1
+    assert cache.stats()["disk_hits"] == 2
+
+
+def test_todays_news_expires_but_past_days_do_not():
+    now = [datetime(2025, 5, 10, 12, 0).timestamp()]
+    fetch = FakeNews()
+    cache = SentimentCache(today_ttl=60, clock=lambda: now[0])
+
+    cache.get_articles("INFY", date(2025, 5, 1), date(2025, 5, 10), fetch)
+    now[0] += 120
+    cache.get_articles("INFY", date(2025, 5, 1), date(2025, 5, 10), fetch)
+
+    # Only the same-day entry was refetched
+    assert fetch.calls[1] == (date(2025, 5, 10), date(2025, 5, 10))
+    assert cache.stats()["expired"] == 1
+
+
+def test_articles_shared_across_tickers_are_stored_once(tmp_path):
+    store = ArticleStore(str(tmp_path / "news.db"))
+    article = {"title": "Markets rally", "url": "https://example.com/rally", "publishedAt": "2025-05-01T00:00:00Z"}
+    store.put_day("TCS", date(2025, 5, 1), [article], 0.0)
+    store.put_day("INFY", date(2025, 5, 1), [article], 0.0)
+
+    import sqlite3
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 1
+    assert store.get_day("INFY", date(2025, 5, 1))[0] == [article]
+
+
+def test_truncated_spans_are_split_until_they_fit(tmp_path):
+    fetch = BudgetedNews(per_day=3, budget=6)
+    store = ArticleStore(str(tmp_path / "news.db"))
+    cache = SentimentCache(store=store, clock=_clock(2025, 6, 1))
+
+    articles = cache.get_articles("SBIN", date(2025, 5, 1), date(2025, 5, 4), fetch)
+
+    assert len(articles) == 12
+    assert fetch.calls == [(date(2025, 5, 1), date(2025, 5, 4)),
+                           (date(2025, 5, 1), date(2025, 5, 2)), (date(2025, 5, 3), date(2025, 5, 4))]
+    assert store.get_day("SBIN", date(2025, 5, 1))[2] is True
+
+
+def test_truncated_days_are_incomplete_and_expire(tmp_path):
+    now = [datetime(2025, 6, 1).timestamp()]
+    fetch = BudgetedNews(per_day=5, budget=2)
+    store = ArticleStore(str(tmp_path / "news.db"))
+    cache = SentimentCache(store=store, truncated_ttl=60, clock=lambda: now[0])
+
+    cache.get_articles("SBIN", date(2025, 5, 1), date(2025, 5, 2), fetch)
+    assert fetch.calls[1:] == [(date(2025, 5, 1), date(2025, 5, 1)), (date(2025, 5, 2), date(2025, 5, 2))]
+    articles, _, complete = store.get_day("SBIN", date(2025, 5, 1))
+    assert len(articles) == 2 and not complete
+
+    # A past day that was cut short is refetched once its TTL runs out
+    now[0] += 120
+    cache.get_articles("SBIN", date(2025, 5, 1), date(2025, 5, 2), fetch)
+    assert fetch.calls[3:] == fetch.calls[:3]
@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_matrix, sentiment_features
+from utils.forecast import forecast_prices
+from utils.model_utils import FEATURES, metadata_path, model_registry, predict_features, predict_range
+from utils.sentiment_cache import ArticleStore
+from utils.sentiment_features import SENTIMENT_FEATURES, align, build_daily_sentiment
+from utils.training import train_stock
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def _article(day, title, n):
+    return {"url": f"https://news.example/{day}/{n}", "publishedAt": f"{day}T09:00:00Z", "title": title}
+
+
+def _fill_store(store):
+    # 2025-05-24/25 is a weekend; 2025-05-30 is after the last trading day in the CSV
+    news = {
+        date(2025, 5, 22): ["Reliance posts great results", "Excellent quarter for Reliance"],
+        date(2025, 5, 24): ["Terrible outlook for refiners"],
+        date(2025, 5, 25): ["Reliance shares trade"],
+        date(2025, 5, 27): [],
+        date(2025, 5, 30): ["Great news"],
+    }
+    store.put_days("RELIANCE", {day: [_article(day, title, n) for n, title in enumerate(titles)]
+                                for day, titles in news.items()}, 0.0)
+
+
+@pytest.fixture
+def news(workspace):
+    store = ArticleStore(str(workspace / "news.db"))
+    _fill_store(store)
+    sentiment_features.clear_cache()
+    yield store
+    sentiment_features.clear_cache()
+
+
+def test_daily_aggregates_from_article_store(news):
+    daily = build_daily_sentiment("RELIANCE", news, scorer="lexicon")
+
+    assert [str(day.date()) for day in daily['Date']] == [
+        "2025-05-22", "2025-05-24", "2025-05-25", "2025-05-27", "2025-05-30"]
+    assert list(daily['News_Volume']) == [2, 1, 1, 0, 1]
+    assert list(daily['Sent_Pos']) == [2, 0, 0, 0, 1]
+    assert list(daily['Sent_Neg']) == [0, 1, 0, 0, 0]
+    assert daily['Score_Sum'].iloc[3] == 0
+    pd.testing.assert_frame_equal(sentiment_features.load_daily("RELIANCE"), daily)
+    assert sentiment_features.read_meta("RELIANCE")["articles"] == 5
+
+
+def test_invalidated_news_is_not_scored(news):
+    news.invalidate("RELIANCE")
+    assert news.get_ticker_days("RELIANCE") == {}
+
+    daily = build_daily_sentiment("RELIANCE", news, scorer="lexicon")
+    assert daily.empty
+    assert sentiment_features.read_meta("RELIANCE")["articles"] == 0
+
+
+def test_align_moves_non_trading_days_forward(news):
+    daily = build_daily_sentiment("RELIANCE", news, scorer="lexicon")
+    dates = pd.to_datetime(["2025-05-22", "2025-05-23", "2025-05-26", "2025-05-27", "2025-05-28"])
+    aligned = align(dates, daily)
+
+    assert list(aligned.columns) == SENTIMENT_FEATURES
+    assert list(aligned['News_Volume']) == [2, 0, 2, 0, 0]
+    assert list(aligned['Sent_Neg']) == [0, 0, 1, 0, 0]
+    # The weekend's two headlines are averaged on Monday; 05-30 is not traded yet
+    assert aligned['Sent_Mean'].iloc[2] == pytest.approx(daily['Score_Sum'].iloc[1:3].sum() / 2)
+    assert aligned['Sent_Mean'].iloc[1] == 0
+    assert (align(dates, None).to_numpy() == 0).all()
+
+
+def test_sentiment_model_declares_and_uses_features(news):
+    build_daily_sentiment("RELIANCE", news, scorer="lexicon")
+    entry = train_stock("RELIANCE", "test", params={'n_estimators': 20}, models_dir="models", sentiment=True)
+
+    assert entry["features"] == FEATURES + SENTIMENT_FEATURES
+    with open(metadata_path("RELIANCE", "models")) as f:
+        assert json.load(f)["features"] == FEATURES + SENTIMENT_FEATURES
+
+    combined = predict_range("RELIANCE", "2025-05-01", "2025-05-29")
+    model = model_registry.get("RELIANCE")
+    df = pd.read_csv(os.path.join("data", "reliance.csv"), skiprows=[1], parse_dates=['Date'])
+    aligned = sentiment_features.aligned_features("RELIANCE", df['Date'])
+    assert aligned.loc[df['Date'] == "2025-05-26", 'News_Volume'].item() == 2
+
+    # Published matrices carry the sentiment columns; predictions do not change
+    feature_matrix.publish_all(["RELIANCE"], feature_matrix.MATRIX_DIR)
+    matrix = feature_matrix.attach("RELIANCE")
+    assert matrix.columns == FEATURES + SENTIMENT_FEATURES
+    pd.testing.assert_frame_equal(predict_range("RELIANCE", "2025-05-01", "2025-05-29"), combined)
+    last = matrix.features[-1:]
+    assert predict_features(model, last)[0] == combined['Close_Predicted'].iloc[-1]
+
+    forecast_df, _ = forecast_prices("RELIANCE", horizon=5)
+    assert np.isfinite(forecast_df['Close']).all()
+
+
+def test_new_news_makes_matrix_stale(news):
+    build_daily_sentiment("RELIANCE", news, scorer="lexicon")
+    before = predict_range("RELIANCE", "2025-05-01", "2025-05-29")
+    feature_matrix.publish_all(["RELIANCE"], feature_matrix.MATRIX_DIR)
+    # Technical models read the leading FEATURES columns of the wider matrix
+    assert feature_matrix.attach("RELIANCE").columns[:len(FEATURES)] == FEATURES
+    pd.testing.assert_frame_equal(predict_range("RELIANCE", "2025-05-01", "2025-05-29"), before)
+
+    news.put_day("RELIANCE", date(2025, 5, 28), [_article("2025-05-28", "Bad day", 0)], 0.0)
+    build_daily_sentiment("RELIANCE", news, scorer="lexicon")
+    assert feature_matrix.attach("RELIANCE") is None
+    assert not feature_matrix.is_published("RELIANCE")
@@ -1,4 +1,49 @@
+import os
+import sys
 from datetime import date, timedelta
-df, top_news = analyze_sentiment("RELIANCE", date.today() - timedelta(days=10), date.today())
-print(df.head())
-print("Top news:", top_news)
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from testing.fake_newsapi import ReplayTransport, load_recorded
+from utils import sentiment_utils
+from utils.news_client import NewsClient
+from utils.sentiment_cache import SentimentCache
+
+RECORDED = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "newsapi", "reliance_everything.json")
+
+
+@pytest.fixture
+def recorded_news(monkeypatch):
+    transport = ReplayTransport(*load_recorded(RECORDED, end=date.today()))
+    monkeypatch.setattr(sentiment_utils, "news_client", NewsClient(api_key="test", transport=transport))
+    monkeypatch.setattr(sentiment_utils, "sentiment_cache", SentimentCache(store=None))
+    return transport
+
+
+@pytest.mark.parametrize("scorer", ["textblob", "lexicon"])
+def test_analyze_sentiment_labels_recorded_headlines(recorded_news, scorer):
+    df, summary, top_news_df = sentiment_utils.analyze_sentiment(
+        "RELIANCE", date.today() - timedelta(days=6), date.today(), scorer=scorer)
+
+    assert len(df) == 100
+    assert list(df.columns) == ["Date", "Headline", "URL", "Sentiment", "Score"]
+    assert set(df["Sentiment"]) <= {"POSITIVE", "NEGATIVE", "NEUTRAL"}
+    assert (df.loc[df["Score"] > 0.1, "Sentiment"] == "POSITIVE").all()
+    assert (df.loc[df["Score"] < -0.1, "Sentiment"] == "NEGATIVE").all()
+    positive, negative = (df["Sentiment"] == "POSITIVE").sum(), (df["Sentiment"] == "NEGATIVE").sum()
+    expected = "POSITIVE" if positive > negative else "NEGATIVE" if negative > positive else "NEUTRAL"
+    assert summary == expected
+    assert len(top_news_df) == 5
+    assert top_news_df["Score"].abs().tolist() == sorted(df["Score"].abs(), reverse=True)[:5]
+    assert recorded_news.calls == 1
+
+
+def test_analyze_sentiment_rejects_ranges_beyond_free_tier(recorded_news):
+    df, message, top_news_df = sentiment_utils.analyze_sentiment(
+        "RELIANCE", date.today() - timedelta(days=45), date.today())
+
+    assert df.empty and top_news_df.empty
+    assert "30 days" in message
+    assert recorded_news.calls == 0
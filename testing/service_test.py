@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import service
+
+pytest.importorskip("starlette")
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+async def _send(app, path, query=""):
+    """Send one GET through the ASGI interface and return (status, body bytes)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+             "headers": [], "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80), "root_path": ""}
+    await app(scope, receive, send)
+    status = next(m["status"] for m in messages if m["type"] == "http.response.start")
+    return status, b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+
+
+async def _get(app, path, query=""):
+    status, body = await _send(app, path, query)
+    return status, json.loads(body)
+
+
+def test_identical_inflight_requests_share_one_computation():
+    calls = []
+    release = threading.Event()
+
+    def slow(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    async def scenario():
+        executor = service.BoundedExecutor(max_workers=2, max_pending=8)
+        coalescer = service.Coalescer()
+        tasks = [asyncio.ensure_future(coalescer.run(("k", 1), lambda: executor.run(slow, 1))) for _ in range(5)]
+        other = asyncio.ensure_future(coalescer.run(("k", 2), lambda: executor.run(slow, 2)))
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks, other)
+        # Finished work is not cached: the next request computes again
+        again = await coalescer.run(("k", 1), lambda: executor.run(slow, 1))
+        executor.shutdown()
+        return results, again, coalescer
+
+    results, again, coalescer = asyncio.run(scenario())
+    assert results == [2, 2, 2, 2, 2, 4]
+    assert again == 2
+    assert sorted(calls) == [1, 1, 2]
+    assert (coalescer.started, coalescer.coalesced, len(coalescer)) == (3, 4, 0)
+
+
+def test_executor_rejects_beyond_max_pending():
+    release = threading.Event()
+
+    async def scenario():
+        executor = service.BoundedExecutor(max_workers=1, max_pending=2)
+        running = [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        with pytest.raises(service.ServiceBusy):
+            await executor.run(release.wait, 5)
+        release.set()
+        await asyncio.gather(*running)
+        executor.shutdown()
+        return executor
+
+    executor = asyncio.run(scenario())
+    assert executor.rejected == 1
+    assert executor.pending == 0
+
+
+def test_predict_endpoint_matches_predict_prices(workspace):
+    from utils.model_utils import predict_prices
+
+    app = service.create_app(max_workers=2, warm=False)
+    status, body = asyncio.run(_get(app, "/predict", "stock=reliance&start=2025-05-20&end=2025-05-29"))
+    pred_df, actual_df = predict_prices("RELIANCE", "2025-05-20", "2025-05-29")
+
+    assert status == 200
+    assert body["stock"] == "RELIANCE"
+    assert [row["date"] for row in body["predictions"]] == [str(d)[:10] for d in pred_df['Date']]
+    assert [row["predicted"] for row in body["predictions"]] == [float(v) for v in pred_df['Close']]
+    assert [row["actual"] for row in body["predictions"]] == [float(v) for v in actual_df['Close']]
+
+
+def test_request_validation_errors():
+    app = service.create_app(warm=False)
+
+    async def scenario():
+        return [
+            await _get(app, "/predict", "stock=NOPE&start=2025-05-20&end=2025-05-29"),
+            await _get(app, "/predict", "stock=TCS&start=2025-05-29&end=2025-05-20"),
+            await _get(app, "/predict", "stock=TCS&start=yesterday&end=2025-05-20"),
+            await _get(app, "/sentiment", "stock=TCS&start=2025-05-20&end=2025-05-29&scorer=vader"),
+            await _get(app, "/health"),
+        ]
+
+    responses = asyncio.run(scenario())
+    assert [status for status, _ in responses] == [404, 400, 400, 400, 200]
+    assert responses[-1][1]["errors"] == 4
+
+
+def test_compute_errors_map_to_status_codes(workspace, monkeypatch):
+    # The workspace has every price CSV but only the RELIANCE model
+    app = service.create_app(max_workers=2, warm=False)
+
+    async def scenario():
+        return [
+            await _get(app, "/predict", "stock=TCS&start=2025-05-20&end=2025-05-29"),
+            await _get(app, "/predict", "stock=RELIANCE&start=1990-01-01&end=1990-12-31"),
+        ]
+
+    assert [status for status, _ in asyncio.run(scenario())] == [404, 422]
+
+    def broken(*args):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(service, "predict_payload", broken)
+    status, body = asyncio.run(_get(app, "/predict", "stock=RELIANCE&start=2025-05-20&end=2025-05-29"))
+    assert status == 500 and body["error"] == "bug"
+
+
+def test_metrics_endpoint_exports_prometheus_text():
+    app = service.create_app(warm=False)
+
+    async def scenario():
+        await _get(app, "/predict", "stock=NOPE&start=2025-05-20&end=2025-05-29")
+        return await _send(app, "/metrics")
+
+    status, body = asyncio.run(scenario())
+    text = body.decode()
+    assert status == 200
+    assert "stock_insights_requests_total 1" in text
+    assert "stock_insights_request_errors_total 1" in text
+    assert "# TYPE stock_insights_span_seconds summary" in text
@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.backtest import feature_matrix
+from utils.model_utils import FEATURES, ModelRegistry
+from utils.training import manifest_path, read_manifest, train_all
+
+pytestmark = pytest.mark.usefixtures("workspace")
+
+
+def test_train_all_writes_models_and_manifest(tmp_path):
+    models_dir = str(tmp_path / "trained")
+    manifest = train_all(["RELIANCE", "TCS", "ITC"], params={'n_estimators': 20}, max_workers=2,
+                         models_dir=models_dir, version="test-1")
+
+    assert sorted(manifest["models"]) == ["RELIANCE", "TCS"]
+    assert "ITC" in manifest["failures"]
+    assert manifest["features"] == FEATURES
+    with open(manifest_path(models_dir)) as f:
+        assert json.load(f) == manifest
+
+    entry = manifest["models"]["RELIANCE"]
+    assert entry["version"] == "test-1"
+    assert entry["params"]["n_estimators"] == 20
+    assert set(entry["metrics"]) >= {"MAE", "RMSE", "R2"}
+    assert not [name for name in os.listdir(models_dir) if ".tmp-" in name]
+
+    # The serving path loads the artifact and predicts from a FEATURES frame
+    model = ModelRegistry(models_dir=models_dir).get("reliance")
+    _, X, _ = feature_matrix("reliance")
+    with open(os.path.join(models_dir, entry["file"]), "rb") as f:
+        assert entry["bytes"] == len(f.read())
+    predictions = model.predict(pd.DataFrame(X, columns=FEATURES))
+    assert np.isfinite(predictions).all()
+
+
+def test_retraining_one_stock_keeps_other_entries(tmp_path):
+    models_dir = str(tmp_path / "trained")
+    train_all(["RELIANCE", "TCS"], params={'n_estimators': 5}, max_workers=1, models_dir=models_dir, version="v1")
+    train_all(["TCS"], params={'n_estimators': 5}, max_workers=1, models_dir=models_dir, version="v2")
+
+    manifest = read_manifest(models_dir)
+    assert manifest["version"] == "v2"
+    assert manifest["models"]["RELIANCE"]["version"] == "v1"
+    assert manifest["models"]["TCS"]["version"] == "v2"
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sentiment_utils import SCORERS, score_headlines
+from utils.transformer_sentiment import TransformerSentimentScorer
+
+
+class CountingScorer(TransformerSentimentScorer):
+    """Scorer with the model replaced by a keyword rule, recording batches."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    def _score(self, texts):
+        self.batches.append(list(texts))
+        return [
+            {"label": "POSITIVE", "score": 0.9, "polarity": 0.8} if "up" in text
+            else {"label": "NEGATIVE", "score": 0.7, "polarity": -0.4}
+            for text in texts
+        ]
+
+
+def test_predict_scores_unique_texts_once():
+    scorer = CountingScorer()
+    results = scorer.predict(["shares up", "shares down", "shares up"])
+    assert [r["label"] for r in results] == ["POSITIVE", "NEGATIVE", "POSITIVE"]
+    assert scorer.batches == [["shares up", "shares down"]]
+
+    assert scorer.polarity(["shares down", "shares up"]) == [-0.4, 0.8]
+    assert len(scorer.batches) == 1
+    assert scorer.stats() == {"scored": 2, "cache_hits": 2, "cached": 2}
+
+
+def test_cache_is_bounded():
+    scorer = CountingScorer(cache_size=2)
+    scorer.predict(["a up", "b up", "c up"])
+    scorer.predict(["a up"])
+    assert len(scorer.batches) == 2
+    assert scorer.stats()["cached"] == 2
+
+
+def test_score_headlines_selects_scorer():
+    assert set(SCORERS) >= {"textblob", "transformer"}
+    scores = score_headlines(["Great results", "Terrible losses"], "textblob")
+    assert scores[0] > 0.1 and scores[1] < -0.1
+    assert score_headlines([], "transformer") == []
+    with pytest.raises(ValueError):
+        score_headlines(["Great results"], "unknown")
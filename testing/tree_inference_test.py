@@ -0,0 +1,67 @@
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from xgboost import XGBClassifier, XGBRegressor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.backtest import feature_matrix
+from utils.model_utils import FEATURES, load_model, predict_features
+from utils.tree_inference import CompiledEnsemble, compile_model
+
+
+@pytest.fixture(scope="module")
+def reliance(module_workspace):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model = load_model("reliance")
+    _, X, y = feature_matrix("reliance")
+    return model, X, y
+
+
+def perturbed(X, n=2000, missing=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = X[rng.integers(0, len(X), n)] * rng.uniform(0.8, 1.2, (n, X.shape[1]))
+    rows[rng.random(rows.shape) < missing] = np.nan
+    return rows
+
+
+@pytest.mark.parametrize("missing", [0.0, 0.1])
+def test_matches_booster_exactly(reliance, missing):
+    model, X, _ = reliance
+    compiled = CompiledEnsemble.from_booster(model)
+    for rows in (X, perturbed(X, missing=missing), X[:1], X[:22]):
+        expected = model.predict(pd.DataFrame(rows, columns=FEATURES))
+        np.testing.assert_array_equal(compiled.predict(rows), expected)
+    assert compiled.predict(X[:0]).shape == (0,)
+
+
+def test_matches_freshly_trained_model(reliance):
+    _, X, y = reliance
+    model = XGBRegressor(n_estimators=30, max_depth=4, learning_rate=0.3, subsample=0.8, random_state=1)
+    train = perturbed(X, n=400, missing=0.05, seed=1)
+    model.fit(train, np.nan_to_num(train[:, 0]) * 1.01)
+    rows = perturbed(X, missing=0.05, seed=2)
+    np.testing.assert_array_equal(CompiledEnsemble.from_booster(model.get_booster()).predict(rows), model.predict(rows))
+
+
+def test_predict_features_backends_agree(reliance):
+    model, X, _ = reliance
+    frame = pd.DataFrame(X[:22], columns=FEATURES)
+    expected = predict_features(model, frame, backend="xgboost")
+    np.testing.assert_array_equal(predict_features(model, frame, backend="compiled"), expected)
+    np.testing.assert_array_equal(predict_features(model, frame, backend="auto"), expected)
+    assert compile_model(model) is compile_model(model)
+    with pytest.raises(ValueError):
+        predict_features(model, frame, backend="gpu")
+
+
+def test_rejects_unsupported_objective(reliance):
+    _, X, _ = reliance
+    model = XGBClassifier(n_estimators=2).fit(X[:50], (np.arange(50) % 2))
+    with pytest.raises(ValueError, match="Unsupported objective"):
+        CompiledEnsemble.from_booster(model)
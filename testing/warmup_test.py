@@ -0,0 +1,84 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import warmup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_app_modules_do_not_import_heavy_dependencies():
+    code = (
+        "import json, sys\n"
+        "import utils.app_cache, utils.plotting_utils, utils.sentiment_utils, utils.forecast, utils.warmup\n"
+        "print(json.dumps([m for m in ('matplotlib', 'textblob', 'nltk', 'xgboost', 'transformers', 'torch')"
+        " if m in sys.modules]))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout) == []
+
+
+def test_scorer_and_matplotlib_plot_import_on_first_use():
+    code = (
+        "import json, sys\n"
+        "import pandas as pd\n"
+        "from utils.sentiment_utils import plot_sentiment, score_headlines\n"
+        "score_headlines(['Shares rally'], 'textblob')\n"
+        "plot_sentiment(pd.DataFrame())\n"
+        "print(json.dumps(['textblob' in sys.modules, 'matplotlib' in sys.modules]))\n"
+    )
+    env = {**os.environ, "MPLBACKEND": "Agg"}
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True,
+                            check=True)
+    assert json.loads(result.stdout) == [True, True]
+
+
+def test_article_store_opens_on_first_use(tmp_path):
+    code = (
+        "import os\n"
+        "from utils.sentiment_utils import sentiment_cache\n"
+        "assert not os.path.exists(os.path.join('data', 'news.db'))\n"
+        "assert sentiment_cache.store is sentiment_cache.store\n"
+        "assert os.path.exists(os.path.join('data', 'news.db'))\n"
+    )
+    env = {key: value for key, value in os.environ.items() if key != "NEWS_DB_PATH"}
+    env["PYTHONPATH"] = ROOT
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True)
+
+
+def test_warm_up_loads_models_and_reports_failures(workspace):
+    from utils.model_utils import model_registry
+
+    failures = warmup.warm_up(["RELIANCE", "NOSUCHSTOCK"])
+    assert list(failures) == ["NOSUCHSTOCK"]
+    assert "reliance" in model_registry.stats()["models"]
+
+
+def test_warm_up_stops_at_max_models(workspace):
+    assert warmup.warm_up(["RELIANCE", "NOSUCHSTOCK"], max_models=1) == {}
+
+
+def test_background_warm_up_runs_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(warmup, "_thread", None)
+    monkeypatch.setattr(warmup, "APP_WARMUP", True)
+    monkeypatch.setattr(warmup, "warm_up", lambda stocks, max_models: calls.append(max_models) or {})
+
+    thread = warmup.start_background_warm_up(max_models=3)
+    assert warmup.start_background_warm_up() is thread
+    thread.join(timeout=10)
+    assert calls == [3]
+    assert warmup.status()["state"] == "done"
+
+
+def test_background_warm_up_disabled(monkeypatch):
+    monkeypatch.setattr(warmup, "_thread", None)
+    monkeypatch.setattr(warmup, "APP_WARMUP", False)
+    assert warmup.start_background_warm_up() is None
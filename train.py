@@ -0,0 +1,58 @@
+"""
+Train the XGBoost price model for every stock and write models/manifest.json.
+
+Stocks train in parallel worker processes with XGBoost threads capped per
+worker. Runs headless on CPU, e.g. in CI:
+
+    python train.py
+    python train.py --stocks RELIANCE TCS --workers 2 --models-dir build/models
+"""
+import argparse
+import os
+import sys
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from utils.model_utils import MODEL_FORMATS, MODELS_DIR
+from utils.price_store import DATA_DIR
+from utils.stocks import STOCK_LIST
+from utils.training import DEFAULT_FORMAT, manifest_path, train_all
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stocks", nargs="+", default=STOCK_LIST, help="Stock symbols (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--n-estimators", type=int, default=None, help="Override the number of trees")
+    parser.add_argument("--models-dir", default=MODELS_DIR)
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--version", default=None, help="Version tag (default: UTC timestamp)")
+    parser.add_argument("--format", choices=MODEL_FORMATS, default=DEFAULT_FORMAT,
+                        help="Model file format (native ubj/json, or pickle)")
+    parser.add_argument("--sentiment", action="store_true",
+                        help="Also train on daily news sentiment (scripts/build_sentiment_features.py)")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if any stock fails")
+    args = parser.parse_args()
+
+    params = {"n_estimators": args.n_estimators} if args.n_estimators else None
+    manifest = train_all(args.stocks, params=params, max_workers=args.workers, models_dir=args.models_dir,
+                         data_dir=args.data_dir, version=args.version, fmt=args.format, sentiment=args.sentiment)
+
+    print(f"Version {manifest['version']}: {manifest['workers']} workers x {manifest['threads_per_worker']} threads, "
+          f"{manifest['wall_seconds']:.1f}s")
+    for stock in args.stocks:
+        entry = manifest["models"].get(stock.upper())
+        if stock.upper() in manifest["failures"]:
+            print(f"⚠️ {stock.upper()}: {manifest['failures'][stock.upper()]}")
+        elif entry:
+            metrics = entry["metrics"]
+            print(f"✅ {stock.upper()}: MAE {metrics['MAE']:.2f}, RMSE {metrics['RMSE']:.2f}, "
+                  f"R² {metrics['R2']:.2f} ({entry['fit_seconds']:.2f}s)")
+    print(f"📄 Manifest: {manifest_path(args.models_dir)}")
+
+    if args.strict and manifest["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
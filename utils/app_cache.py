@@ -0,0 +1,192 @@
+"""
+Streamlit caching for the app's predictions, forecasts and sentiment.
+
+Results are cached with ``st.cache_data`` under the inputs plus a version
+of what they were computed from: the price CSV and model file (mtime and
+size) and a per-ticker generation. Updating a CSV or retraining a model
+therefore misses the cache on its own, and ``invalidate`` bumps the
+ticker's generation so its old entries are never returned again (Streamlit
+can only clear a cached function as a whole). Models themselves are not
+wrapped in ``st.cache_resource``: ``model_registry`` already keeps them in
+memory for the whole process and reloads them when the file changes.
+"""
+import os
+import threading
+import time
+
+import streamlit as st
+
+from utils import price_store
+from utils.forecast import forecast_prices
+from utils.model_utils import (PREDICT_CHUNK_ROWS, find_model_file, model_registry, predict_prices, predict_prices_batch,
+                               predict_range)
+from utils.sentiment_utils import analyze_sentiment, sentiment_cache
+
+CACHE_MAX_ENTRIES = int(os.getenv("APP_CACHE_MAX_ENTRIES", "256"))
+# Today's news keeps changing, so sentiment expires like the article cache
+SENTIMENT_TTL = float(os.getenv("NEWS_CACHE_TODAY_TTL", 15 * 60))
+
+_lock = threading.Lock()
+_generations = {}
+_stats = {}
+
+
+class _Uncached(Exception):
+    """Carries a result out of a cached function without caching it."""
+
+    def __init__(self, result):
+        super().__init__("uncached result")
+        self.result = result
+
+
+def file_version(path):
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st_result = os.stat(path)
+    except OSError:
+        return None
+    return st_result.st_mtime_ns, st_result.st_size
+
+
+def generation(stock):
+    """Return the ticker's invalidation counter."""
+    with _lock:
+        return _generations.get(stock.upper(), 0)
+
+
+def price_version(stock):
+    """Cache version of a stock's price-based results."""
+    model_file = find_model_file(stock)
+    return (
+        file_version(price_store.csv_path(stock)),
+        file_version(model_file) if model_file else None,
+        generation(stock),
+    )
+
+
+def _count(name, computed=False, seconds=0.0):
+    with _lock:
+        entry = _stats.setdefault(name, {"calls": 0, "computed": 0, "compute_seconds": 0.0})
+        if computed:
+            entry["computed"] += 1
+            entry["compute_seconds"] += seconds
+        else:
+            entry["calls"] += 1
+
+
+def _timed(name, fn, *args):
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        _count(name, computed=True, seconds=time.perf_counter() - started)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _predict(stock, start_date, end_date, version):
+    return _timed("predict", predict_prices, stock, start_date, end_date)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _predict_range(stock, start_date, end_date, version):
+    return _timed("predict_range", predict_range, stock, start_date, end_date, PREDICT_CHUNK_ROWS, True)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _forecast(stock, horizon, version):
+    return _timed("forecast", forecast_prices, stock, horizon)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _predict_batch(stocks, start_date, end_date, versions):
+    return _timed("predict_all", predict_prices_batch, list(stocks), start_date, end_date)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=SENTIMENT_TTL, show_spinner=False)
+def _sentiment(stock, start_date, end_date, scorer, version):
+    sent_df, summary, top_news_df = _timed("sentiment", analyze_sentiment, stock, start_date, end_date, scorer)
+    if sent_df.empty:
+        # Errors and empty ranges come back as messages; retry them next time
+        raise _Uncached((sent_df, summary, top_news_df))
+    return sent_df, summary, top_news_df
+
+
+def cached_predict(stock, start_date, end_date):
+    """Cached ``predict_prices``."""
+    _count("predict")
+    return _predict(stock, start_date, end_date, price_version(stock))
+
+
+def cached_predict_range(stock, start_date, end_date):
+    """Cached ``predict_range``, with the Open, High and Low columns."""
+    _count("predict_range")
+    return _predict_range(stock, start_date, end_date, price_version(stock))
+
+
+def cached_forecast(stock, horizon):
+    """Cached ``forecast_prices``."""
+    _count("forecast")
+    return _forecast(stock, horizon, price_version(stock))
+
+
+def cached_predict_batch(stocks, start_date, end_date):
+    """Cached ``predict_prices_batch``."""
+    _count("predict_all")
+    stocks = tuple(stocks)
+    return _predict_batch(stocks, start_date, end_date, tuple(price_version(stock) for stock in stocks))
+
+
+def cached_sentiment(stock, start_date, end_date, scorer):
+    """Cached ``analyze_sentiment``."""
+    _count("sentiment")
+    try:
+        return _sentiment(stock, start_date, end_date, scorer, generation(stock))
+    except _Uncached as e:
+        return e.result
+
+
+def invalidate(stock=None, news=False):
+    """
+    Drop cached results for one ticker, or for every ticker.
+    
+    Args:
+        stock (str): Stock symbol, or None for everything
+        news (bool): Also forget stored articles, so NewsAPI is queried again
+    """
+    if stock is None:
+        for fn in (_predict, _predict_range, _forecast, _predict_batch, _sentiment):
+            fn.clear()
+        with _lock:
+            _generations.clear()
+    else:
+        with _lock:
+            _generations[stock.upper()] = _generations.get(stock.upper(), 0) + 1
+    model_registry.invalidate(stock)
+    if news:
+        sentiment_cache.invalidate(stock)
+
+
+def cache_stats():
+    """
+    Return cache counters for the stats panel.
+    
+    Returns:
+        dict: Per cached function: calls, computations, hits, hit rate and
+              compute time; plus the model registry and news cache stats
+    """
+    with _lock:
+        results = {}
+        for name, entry in sorted(_stats.items()):
+            hits = max(entry["calls"] - entry["computed"], 0)
+            results[name] = {
+                **entry,
+                "hits": hits,
+                "hit_rate": hits / entry["calls"] if entry["calls"] else 0.0,
+            }
+        generations = dict(_generations)
+    return {
+        "results": results,
+        "generations": generations,
+        "models": model_registry.stats(),
+        "news": sentiment_cache.stats(),
+    }
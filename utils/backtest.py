@@ -0,0 +1,219 @@
+"""
+Walk-forward backtesting of the per-stock XGBoost models.
+
+For every fold the model is retrained on the rows before the fold (all of
+them for an expanding window, the last ``window`` for a rolling one) and
+predicts the next ``step`` rows. The feature matrix is built once per stock
+and folds take slices of it, which are NumPy views rather than copies.
+Stocks run in parallel in a process pool, one stock per task, with
+XGBoost's threads split between the workers.
+"""
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from utils import price_store, sentiment_features
+from utils.indicators import compute_indicators
+from utils.model_utils import FEATURES, MODEL_PARAMS, load_price_data
+from utils.sentiment_features import SENTIMENT_FEATURES
+
+MODES = ("expanding", "rolling")
+
+
+def available_stocks(data_dir=price_store.DATA_DIR):
+    """Return the stock names of every CSV in the data directory."""
+    return [os.path.splitext(os.path.basename(path))[0] for path in sorted(glob.glob(os.path.join(data_dir, "*.csv")))]
+
+
+def feature_names(sentiment=False):
+    """Return the model inputs, with or without the daily sentiment features."""
+    return FEATURES + SENTIMENT_FEATURES if sentiment else list(FEATURES)
+
+
+def feature_matrix(stock, data_dir=price_store.DATA_DIR, store_dir=price_store.STORE_DIR, sentiment=False):
+    """
+    Build the model inputs for a stock once.
+    
+    Args:
+        stock (str): Stock symbol
+        data_dir (str): Directory holding the raw CSVs
+        store_dir (str): Directory holding the columnar stores
+        sentiment (bool): Append the SENTIMENT_FEATURES columns
+    
+    Returns:
+        tuple: (dates, X, y) as NumPy arrays, rows with incomplete
+               indicators dropped; X is C-contiguous with
+               ``feature_names(sentiment)`` columns
+    """
+    df = load_price_data(stock, data_dir=data_dir, store_dir=store_dir)
+    columns = {col: df[col].to_numpy(dtype=np.float64) for col in ['Open', 'High', 'Low', 'Volume']}
+    columns.update(compute_indicators(df['Close'].to_numpy(dtype=np.float64)))
+    if sentiment:
+        aligned = sentiment_features.aligned_features(stock, df['Date'])
+        columns.update({col: aligned[col].to_numpy() for col in SENTIMENT_FEATURES})
+    X = np.column_stack([columns[col] for col in feature_names(sentiment)])
+    complete = ~np.isnan(X).any(axis=1)
+    return (
+        df['Date'].to_numpy()[complete],
+        np.ascontiguousarray(X[complete]),
+        df['Close'].to_numpy(dtype=np.float64)[complete],
+    )
+
+
+def walk_forward_splits(n_rows, initial, step, mode="expanding", window=None):
+    """
+    Generate (train_start, train_end, test_end) row bounds for each fold.
+    
+    Args:
+        n_rows (int): Number of rows available
+        initial (int): Rows in the first training window
+        step (int): Rows predicted per fold (and retrain interval)
+        mode (str): "expanding" keeps every earlier row, "rolling" keeps the
+                    last ``window`` rows
+        window (int): Rolling window length (default: ``initial``)
+    
+    Returns:
+        list: Fold bounds; train rows are [train_start, train_end) and test
+              rows are [train_end, test_end)
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown backtest mode: {mode}")
+    if initial < 1 or step < 1:
+        raise ValueError("initial and step must be positive")
+    window = window or initial
+    splits = []
+    train_end = initial
+    while train_end < n_rows:
+        train_start = 0 if mode == "expanding" else max(0, train_end - window)
+        test_end = min(train_end + step, n_rows)
+        splits.append((train_start, train_end, test_end))
+        train_end = test_end
+    return splits
+
+
+def _metrics(actual, predicted):
+    error = predicted - actual
+    ss_tot = np.sum((actual - actual.mean()) ** 2)
+    return {
+        'MAE': float(np.mean(np.abs(error))),
+        'RMSE': float(np.sqrt(np.mean(error ** 2))),
+        'R2': float(1 - np.sum(error ** 2) / ss_tot) if ss_tot > 0 else float('nan'),
+        'MAPE': float(np.mean(np.abs(error) / np.abs(actual)) * 100),
+        'Bias': float(np.mean(error)),
+    }
+
+
+def backtest_stock(stock, initial=250, step=21, mode="expanding", window=None, params=None, n_jobs=1,
+                   data_dir=price_store.DATA_DIR, store_dir=price_store.STORE_DIR, sentiment=False):
+    """
+    Walk-forward backtest of one stock.
+    
+    Args:
+        stock (str): Stock symbol
+        initial (int): Rows in the first training window
+        step (int): Rows predicted per fold
+        mode (str): "expanding" or "rolling"
+        window (int): Rolling window length (default: ``initial``)
+        params (dict): XGBRegressor parameters (default: MODEL_PARAMS)
+        n_jobs (int): XGBoost threads
+        data_dir (str): Directory holding the raw CSVs
+        store_dir (str): Directory holding the columnar stores
+        sentiment (bool): Also train on the daily sentiment features
+    
+    Returns:
+        tuple: (summary dict with metrics and timings, DataFrame of
+               out-of-sample predictions)
+    """
+    from xgboost import XGBRegressor
+
+    started = time.perf_counter()
+    dates, X, y = feature_matrix(stock, data_dir, store_dir, sentiment)
+    feature_time = time.perf_counter() - started
+
+    splits = walk_forward_splits(len(y), initial, step, mode, window)
+    if not splits:
+        raise ValueError(f"Not enough rows for a backtest: {len(y)} rows, {initial} needed for training")
+
+    predicted = np.empty(len(y) - splits[0][1])
+    fit_time = predict_time = 0.0
+    offset = splits[0][1]
+    for train_start, train_end, test_end in splits:
+        model = XGBRegressor(**{**MODEL_PARAMS, **(params or {}), 'n_jobs': n_jobs})
+        t0 = time.perf_counter()
+        model.fit(X[train_start:train_end], y[train_start:train_end])
+        t1 = time.perf_counter()
+        predicted[train_end - offset:test_end - offset] = model.predict(X[train_end:test_end])
+        fit_time += t1 - t0
+        predict_time += time.perf_counter() - t1
+
+    actual = y[offset:]
+    summary = {'Stock': stock.upper(), 'Folds': len(splits), 'Train_Rows': splits[-1][1] - splits[-1][0],
+               'Test_Rows': len(actual)}
+    summary.update(_metrics(actual, predicted))
+    summary.update({
+        'Feature_s': feature_time,
+        'Fit_s': fit_time,
+        'Predict_s': predict_time,
+        'Total_s': time.perf_counter() - started,
+    })
+    predictions = pd.DataFrame({
+        'Stock': stock.upper(),
+        'Date': dates[offset:],
+        'Actual': actual,
+        'Predicted': predicted,
+    })
+    return summary, predictions
+
+
+def run_backtest(stocks=None, initial=250, step=21, mode="expanding", window=None, params=None, max_workers=None,
+                 data_dir=price_store.DATA_DIR, store_dir=price_store.STORE_DIR, sentiment=False):
+    """
+    Backtest several stocks in parallel, one stock per worker process.
+    
+    Args:
+        stocks (list): Stock symbols (default: every CSV in ``data_dir``)
+        max_workers (int): Worker processes (default: CPU count, capped at the
+                           number of stocks)
+        Other arguments are passed to ``backtest_stock``.
+    
+    Returns:
+        tuple: (metrics DataFrame, predictions DataFrame, failures dict
+               mapping stock to error message, wall-clock seconds)
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown backtest mode: {mode}")
+    stocks = list(stocks or available_stocks(data_dir))
+    cpus = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers or cpus, len(stocks) or 1))
+    # Split XGBoost's threads between the workers instead of oversubscribing
+    n_jobs = max(1, cpus // max_workers)
+
+    started = time.perf_counter()
+    summaries, predictions, failures = [], [], {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(backtest_stock, stock, initial, step, mode, window, params, n_jobs, data_dir, store_dir,
+                        sentiment): stock
+            for stock in stocks
+        }
+        for future in as_completed(futures):
+            stock = futures[future]
+            try:
+                summary, frame = future.result()
+            except Exception as e:
+                failures[stock.upper()] = str(e)
+                continue
+            summaries.append(summary)
+            predictions.append(frame)
+    elapsed = time.perf_counter() - started
+
+    metrics = pd.DataFrame(summaries)
+    if not metrics.empty:
+        metrics = metrics.sort_values('Stock').reset_index(drop=True)
+    predictions = pd.concat(predictions, ignore_index=True) if predictions else pd.DataFrame(
+        columns=['Stock', 'Date', 'Actual', 'Predicted'])
+    return metrics, predictions, failures, elapsed
@@ -0,0 +1,249 @@
+"""
+Read-only feature matrices shared by every worker process.
+
+A loader (``scripts/publish_features.py``) writes, per stock, the model
+inputs of every predictable day as one float32 matrix in FEATURES order,
+plus the dates and the OHLC prices, as ``.npy`` files. It lists them in
+``manifest.json``. Workers memory-map the files read-only, so the pages are
+held once in the OS page cache however many Streamlit or ASGI processes
+serve predictions. A prediction then slices rows out of the map instead of
+loading the price CSV and indicators into DataFrames of its own. XGBoost
+(and the compiled tree walker) compare features in float32, so the
+predictions are the same.
+
+Stocks with a daily sentiment store (see sentiment_features) also get the
+SENTIMENT_FEATURES columns after FEATURES, so models trained with and
+without sentiment read the same matrix. A matrix is only used while it
+matches the stock's current price and sentiment stores; after the CSV or
+the news changes, predictions fall back to the stores until the loader
+publishes again.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import feature_store, price_store, sentiment_features
+
+MATRIX_DIR = os.getenv("FEATURE_MATRIX_DIR", os.path.join(price_store.DATA_DIR, "matrix"))
+MATRIX_VERSION = 1
+MANIFEST = "manifest.json"
+OHLC_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+_lock = threading.Lock()
+_manifests = {}  # matrix_dir -> (manifest mtime_ns, manifest)
+_attached = {}  # (matrix_dir, stock) -> FeatureMatrix
+
+
+def _source(stock):
+    """Identity of the price store a matrix is built from, or None."""
+    meta = price_store.read_meta(stock)
+    if meta is None:
+        return None
+    return {"rows": meta.get("rows"), "source_mtime_ns": meta.get("source_mtime_ns"),
+            "source_size": meta.get("source_size"), "sentiment": sentiment_features.signature(stock)}
+
+
+def _write(path, dates, features, prices):
+    parent = os.path.dirname(path) or "."
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    np.save(os.path.join(tmp_path, "Date.npy"), dates)
+    np.save(os.path.join(tmp_path, "features.npy"), features)
+    np.save(os.path.join(tmp_path, "prices.npy"), prices)
+
+    old_path = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.rename(path, old_path)
+    os.rename(tmp_path, path)
+    # Workers that still map the old files keep reading them until they reattach
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def publish(stock, matrix_dir=MATRIX_DIR):
+    """
+    Write a stock's feature matrix (without updating the manifest).
+    
+    Args:
+        stock (str): Stock symbol
+        matrix_dir (str): Directory holding the matrices and the manifest
+    
+    Returns:
+        dict: The manifest entry for the stock
+    """
+    from utils.model_utils import FEATURES, load_price_data
+
+    prices = load_price_data(stock)
+    indicators = feature_store.update_features(stock, prices)
+    parts = [prices, indicators[feature_store.INDICATOR_COLUMNS]]
+    columns = list(FEATURES)
+    if sentiment_features.load_daily(stock) is not None:
+        parts.append(sentiment_features.aligned_features(stock, prices['Date']))
+        columns += sentiment_features.SENTIMENT_FEATURES
+    df = pd.concat(parts, axis=1).dropna()
+    if df.empty:
+        raise ValueError(f"No predictable rows for {stock}")
+
+    dates = df['Date'].to_numpy(dtype="datetime64[ns]")
+    features = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float32))
+    ohlc = np.ascontiguousarray(df[OHLC_COLUMNS].to_numpy(dtype=np.float64))
+    _write(os.path.join(matrix_dir, stock.lower()), dates, features, ohlc)
+    return {
+        "path": stock.lower(),
+        "rows": int(len(df)),
+        "columns": columns,
+        "dtype": "float32",
+        "first_date": str(pd.Timestamp(dates[0])),
+        "last_date": str(pd.Timestamp(dates[-1])),
+        "nbytes": int(features.nbytes + ohlc.nbytes + dates.nbytes),
+        "source": _source(stock),
+        "published_at": time.time(),
+    }
+
+
+def publish_all(stocks, matrix_dir=MATRIX_DIR):
+    """
+    Publish several stocks' matrices and write the manifest.
+    
+    Entries of stocks not in ``stocks`` are kept.
+    
+    Args:
+        stocks (list): Stock symbols
+        matrix_dir (str): Directory holding the matrices and the manifest
+    
+    Returns:
+        tuple: (manifest dict, dict mapping failed stocks to their error message)
+    """
+    # Copy, since read_manifest hands out the cached manifest
+    current = read_manifest(matrix_dir) or {"stocks": {}}
+    manifest = {"version": MATRIX_VERSION, "stocks": dict(current["stocks"])}
+    failures = {}
+    for stock in stocks:
+        try:
+            manifest["stocks"][stock.upper()] = publish(stock, matrix_dir)
+        except Exception as e:
+            failures[stock] = str(e)
+
+    os.makedirs(matrix_dir, exist_ok=True)
+    tmp_path = os.path.join(matrix_dir, f"{MANIFEST}.tmp-{os.getpid()}")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(matrix_dir, MANIFEST))
+    return manifest, failures
+
+
+def read_manifest(matrix_dir=MATRIX_DIR):
+    """Return the manifest, or None if nothing has been published."""
+    path = os.path.join(matrix_dir, MANIFEST)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    with _lock:
+        cached = _manifests.get(matrix_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MATRIX_VERSION:
+        return None
+    with _lock:
+        _manifests[matrix_dir] = (mtime, manifest)
+    return manifest
+
+
+class FeatureMatrix:
+    """
+    Read-only memory-mapped view of one published stock.
+    
+    Attributes:
+        dates (ndarray): datetime64[ns] date of every row
+        columns (list): Feature names of the matrix columns
+        features (ndarray): float32 rows x columns model inputs
+        prices (ndarray): float64 rows x OHLC_COLUMNS prices
+    """
+
+    def __init__(self, path, entry):
+        self.entry = entry
+        self.columns = list(entry["columns"])
+        self.dates = np.load(os.path.join(path, "Date.npy"), mmap_mode="r")
+        self.features = np.load(os.path.join(path, "features.npy"), mmap_mode="r")
+        self.prices = np.load(os.path.join(path, "prices.npy"), mmap_mode="r")
+        if not (len(self.dates) == len(self.features) == len(self.prices) == entry["rows"]):
+            raise ValueError(f"Feature matrix at {path} does not match its manifest entry")
+
+    def __len__(self):
+        return len(self.dates)
+
+    def rows(self, start_date, end_date):
+        """Return the (lo, hi) row slice of a date range."""
+        lo = int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start_date), "ns"), side="left"))
+        hi = int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end_date), "ns"), side="right"))
+        return lo, hi
+
+
+def _current_entry(stock, matrix_dir):
+    from utils.model_utils import FEATURES
+
+    manifest = read_manifest(matrix_dir)
+    if manifest is None:
+        return None
+    entry = manifest["stocks"].get(stock.upper())
+    if entry is None or entry.get("columns", [])[:len(FEATURES)] != FEATURES:
+        return None
+    if not price_store.is_fresh(stock) or entry.get("source") != _source(stock):
+        return None
+    return entry
+
+
+def is_published(stock, matrix_dir=MATRIX_DIR):
+    """Check whether the stock has a matrix matching its current prices."""
+    return _current_entry(stock, matrix_dir) is not None
+
+
+def attach(stock, matrix_dir=MATRIX_DIR):
+    """
+    Return the stock's published matrix if it matches the current prices.
+    
+    Args:
+        stock (str): Stock symbol
+        matrix_dir (str): Directory holding the matrices and the manifest
+    
+    Returns:
+        FeatureMatrix: The attached matrix, or None when there is no
+                       current one (callers then use the stores)
+    """
+    entry = _current_entry(stock, matrix_dir)
+    if entry is None:
+        return None
+
+    key = (matrix_dir, stock.upper())
+    with _lock:
+        matrix = _attached.get(key)
+        if matrix is not None and matrix.entry is entry:
+            return matrix
+    try:
+        matrix = FeatureMatrix(os.path.join(matrix_dir, entry["path"]), entry)
+    except (OSError, ValueError):
+        # Being republished right now; the stores answer this request
+        return None
+    with _lock:
+        _attached[key] = matrix
+    return matrix
+
+
+def detach_all():
+    """Forget attached matrices and cached manifests."""
+    with _lock:
+        _attached.clear()
+        _manifests.clear()
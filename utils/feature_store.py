@@ -0,0 +1,225 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from utils import indicators, price_store
+
+FEATURE_DIR = os.path.join(price_store.DATA_DIR, "features")
+INDICATOR_COLUMNS = indicators.INDICATOR_COLUMNS
+FEATURE_VERSION = 2
+
+
+def compute_indicators(close, state=None):
+    """
+    Run closes through an indicator state.
+    
+    Args:
+        close (array-like): Closing prices in date order
+        state (IndicatorState): State to continue from, or None to start fresh
+    
+    Returns:
+        tuple: (DataFrame of INDICATOR_COLUMNS, IndicatorState after the last bar)
+    """
+    values, state = indicators.compute_indicators_with_state(np.asarray(close, dtype=np.float64), state)
+    return pd.DataFrame(values, columns=INDICATOR_COLUMNS), state
+
+
+def feature_path(stock, feature_dir=FEATURE_DIR):
+    """Return the directory holding the indicator columns for a stock."""
+    return os.path.join(feature_dir, stock.lower())
+
+
+def _read_meta(path):
+    try:
+        with open(os.path.join(path, "features.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path, dates, frame, state):
+    parent = os.path.dirname(path) or "."
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    np.save(os.path.join(tmp_path, "Date.npy"), np.asarray(dates, dtype="datetime64[ns]"))
+    for col in INDICATOR_COLUMNS:
+        np.save(os.path.join(tmp_path, f"{col}.npy"), frame[col].to_numpy(dtype=np.float64))
+    meta = {
+        "version": FEATURE_VERSION,
+        "rows": int(len(dates)),
+        "last_date": str(pd.Timestamp(dates[-1])) if len(dates) else None,
+        "state": state.to_dict(),
+    }
+    with open(os.path.join(tmp_path, "features.json"), "w") as f:
+        json.dump(meta, f)
+
+    old_path = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.rename(path, old_path)
+    os.rename(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def _load_columns(path, columns, lo=0, hi=None, mmap=True):
+    mmap_mode = "r" if mmap else None
+    data = {}
+    for col in ['Date'] + list(columns):
+        data[col] = np.asarray(np.load(os.path.join(path, f"{col}.npy"), mmap_mode=mmap_mode)[lo:hi])
+    return pd.DataFrame(data)
+
+
+def update_features(stock, prices, feature_dir=FEATURE_DIR):
+    """
+    Bring a stock's stored indicators up to date with its price history.
+    
+    When the stored features cover a prefix of ``prices`` (same row count and
+    last date as recorded), only the new bars are run through the saved
+    indicator state. Any other change to the history triggers a full rebuild.
+    
+    Args:
+        stock (str): Stock symbol
+        prices (DataFrame): Date-sorted frame with Date and Close columns
+        feature_dir (str): Directory holding the feature stores
+    
+    Returns:
+        DataFrame: Date plus INDICATOR_COLUMNS, aligned row-for-row with prices
+    """
+    path = feature_path(stock, feature_dir)
+    dates = prices['Date'].to_numpy(dtype="datetime64[ns]")
+    closes = prices['Close'].to_numpy(dtype=np.float64)
+    rows, meta = _stored_rows(path, dates)
+    is_prefix = rows is not None
+
+    if is_prefix and rows == len(dates):
+        return _load_columns(path, INDICATOR_COLUMNS)
+
+    if is_prefix:
+        state = indicators.IndicatorState.from_dict(meta["state"])
+        new_indicators, state = compute_indicators(closes[rows:], state)
+        stored = _load_columns(path, INDICATOR_COLUMNS, mmap=False).drop(columns='Date')
+        frame = pd.concat([stored, new_indicators], ignore_index=True)
+    else:
+        frame, state = compute_indicators(closes)
+
+    return _save(path, dates, frame, state)
+
+
+def load_state(stock, prices, feature_dir=FEATURE_DIR):
+    """
+    Return the indicator state after the last bar of ``prices``.
+    
+    Uses the state saved with the stored features when they cover exactly
+    ``prices``, so nothing is recomputed; otherwise runs the full history.
+    
+    Args:
+        stock (str): Stock symbol
+        prices (DataFrame): Date-sorted frame with Date and Close columns
+        feature_dir (str): Directory holding the feature stores
+    
+    Returns:
+        IndicatorState: State ready to be advanced by further bars
+    """
+    dates = prices['Date'].to_numpy(dtype="datetime64[ns]")
+    rows, meta = _stored_rows(feature_path(stock, feature_dir), dates)
+    if rows is not None and rows == len(dates):
+        return indicators.IndicatorState.from_dict(meta["state"])
+    _, state = compute_indicators(prices['Close'].to_numpy(dtype=np.float64))
+    return state
+
+
+def is_current(stock, dates, feature_dir=FEATURE_DIR):
+    """Check whether the stored features cover exactly ``dates``."""
+    rows, _ = _stored_rows(feature_path(stock, feature_dir), np.asarray(dates, dtype="datetime64[ns]"))
+    return rows is not None and rows == len(dates)
+
+
+def _stored_rows(path, dates):
+    """Return how many leading rows of ``dates`` the stored features cover."""
+    meta = _read_meta(path)
+    if meta is None or meta.get("version") != FEATURE_VERSION:
+        return None, None
+    rows = meta["rows"]
+    if rows > len(dates) or (rows and str(pd.Timestamp(dates[rows - 1])) != meta["last_date"]):
+        return None, None
+    return rows, meta
+
+
+def _save(path, dates, frame, state):
+    try:
+        _write(path, dates, frame, state)
+    except OSError:
+        # A read-only deployment still gets correct (unsaved) features
+        pass
+    frame.insert(0, 'Date', dates)
+    return frame
+
+
+def update_features_many(prices_by_stock, feature_dir=FEATURE_DIR):
+    """
+    Bring several stocks' stored indicators up to date at once.
+    
+    Stocks whose stores are current or only need new bars appended go
+    through ``update_features``; the ones needing a full rebuild are
+    left-padded onto a shared date axis and computed in a single batch.
+    
+    Args:
+        prices_by_stock (dict): Stock symbol -> date-sorted price frame
+        feature_dir (str): Directory holding the feature stores
+    
+    Returns:
+        dict: Stock symbol -> frame of Date plus INDICATOR_COLUMNS
+    """
+    results = {}
+    rebuild = []
+    for stock, prices in prices_by_stock.items():
+        dates = prices['Date'].to_numpy(dtype="datetime64[ns]")
+        rows, _ = _stored_rows(feature_path(stock, feature_dir), dates)
+        if rows is None:
+            rebuild.append(stock)
+        else:
+            results[stock] = update_features(stock, prices, feature_dir)
+
+    if rebuild:
+        length = max(len(prices_by_stock[stock]) for stock in rebuild)
+        batch = np.full((length, len(rebuild)), np.nan)
+        for i, stock in enumerate(rebuild):
+            closes = prices_by_stock[stock]['Close'].to_numpy(dtype=np.float64)
+            batch[length - len(closes):, i] = closes
+        values, state = indicators.compute_indicators_with_state(batch)
+
+        for i, stock in enumerate(rebuild):
+            prices = prices_by_stock[stock]
+            n = len(prices)
+            frame = pd.DataFrame({col: values[col][length - n:, i] for col in INDICATOR_COLUMNS})
+            dates = prices['Date'].to_numpy(dtype="datetime64[ns]")
+            results[stock] = _save(feature_path(stock, feature_dir), dates, frame, state.select(i))
+    return results
+
+
+def load_features(stock, start=None, end=None, columns=None, feature_dir=FEATURE_DIR):
+    """
+    Slice stored indicators for a date range without loading the full history.
+    
+    Args:
+        stock (str): Stock symbol
+        start (date): First date to include, or None
+        end (date): Last date to include, or None
+        columns (list): Indicator columns to load (default: all)
+        feature_dir (str): Directory holding the feature stores
+    
+    Returns:
+        DataFrame: Date plus the requested indicator columns
+    """
+    path = feature_path(stock, feature_dir)
+    if _read_meta(path) is None:
+        raise FileNotFoundError(f"Feature store not found: {path}")
+    dates = np.load(os.path.join(path, "Date.npy"), mmap_mode="r")
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "ns"), side="left"))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "ns"), side="right"))
+    return _load_columns(path, columns or INDICATOR_COLUMNS, lo, hi)
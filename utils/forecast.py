@@ -0,0 +1,175 @@
+"""
+Recursive multi-day close forecasts from the per-stock models.
+
+The models predict a day's close from that day's Open, High, Low, Volume
+and indicators, so future days need those inputs too. Each step builds a
+synthetic bar from the previous (predicted) close: Open, High and Low use
+the stock's recent median gap and intraday range, Volume its recent mean.
+The indicators come from the stored IndicatorState, advanced one bar per
+step, instead of being recomputed over the whole history. The predicted
+close then becomes the next step's previous close.
+
+Intervals widen with the square root of the horizon, using the recent
+volatility of daily log returns.
+"""
+import threading
+import time
+from collections import OrderedDict
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from utils import feature_store
+from utils.instrumentation import span, traced
+from utils.model_utils import check_features, load_price_data, model_registry, predict_features
+from utils.sentiment_features import SENTIMENT_FEATURES
+
+FORECAST_HORIZONS = [1, 5, 10, 20]
+MAX_HORIZON = 60
+INTERVAL_LEVEL = 0.9
+# Trading days of history used for the synthetic bars and the volatility
+BAR_SHAPE_WINDOW = 21
+VOLATILITY_WINDOW = 63
+
+
+class ForecastLatency:
+    """
+    Latency samples of forecast calls, grouped by horizon.
+    
+    Args:
+        max_samples (int): Samples kept per horizon
+    """
+
+    def __init__(self, max_samples=500):
+        self.max_samples = max_samples
+        self._samples = OrderedDict()  # horizon -> [(total, per-step), ...]
+        self._lock = threading.Lock()
+
+    def record(self, horizon, total, steps):
+        with self._lock:
+            samples = self._samples.setdefault(horizon, [])
+            samples.append((total, sum(steps) / len(steps)))
+            del samples[:-self.max_samples]
+
+    def stats(self):
+        """
+        Return latency statistics per horizon.
+        
+        Returns:
+            dict: horizon -> count, mean/p50/p95 call latency and mean
+                  per-step latency, in milliseconds
+        """
+        with self._lock:
+            result = {}
+            for horizon, samples in sorted(self._samples.items()):
+                totals = np.array([s[0] for s in samples]) * 1000
+                result[horizon] = {
+                    "count": len(samples),
+                    "mean_ms": float(totals.mean()),
+                    "p50_ms": float(np.percentile(totals, 50)),
+                    "p95_ms": float(np.percentile(totals, 95)),
+                    "step_ms": float(np.mean([s[1] for s in samples]) * 1000),
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+forecast_latency = ForecastLatency()
+
+
+def _bar_shape(df):
+    """Median open gap and intraday range, and mean volume, of recent bars."""
+    recent = df.tail(BAR_SHAPE_WINDOW + 1)
+    prev_close = recent['Close'].to_numpy()[:-1]
+    bars = recent.iloc[1:]
+    return {
+        'gap': float(np.median(bars['Open'].to_numpy() / prev_close)),
+        'high': float(np.median(bars['High'].to_numpy() / bars['Open'].to_numpy())),
+        'low': float(np.median(bars['Low'].to_numpy() / bars['Open'].to_numpy())),
+        'volume': float(bars['Volume'].mean()),
+    }
+
+
+@traced("forecast_prices", profile_calls=True)
+def forecast_prices(stock, horizon=5, level=INTERVAL_LEVEL, backend=None):
+    """
+    Forecast the next ``horizon`` trading days' closes for a stock.
+    
+    Args:
+        stock (str): Stock symbol
+        horizon (int): Number of trading days to forecast
+        level (float): Coverage of the forecast interval
+        backend (str): Inference backend (see model_utils.INFERENCE_BACKENDS)
+    
+    Returns:
+        tuple: (forecast_df with Date, Horizon, Close, Lower, Upper columns;
+                actual_df with the last stored Date/Close bars)
+    """
+    try:
+        if not 1 <= int(horizon) <= MAX_HORIZON:
+            raise ValueError(f"Horizon must be between 1 and {MAX_HORIZON} days")
+        horizon = int(horizon)
+        started = time.perf_counter()
+
+        with span("load_prices"):
+            df = load_price_data(stock)
+        if len(df) < BAR_SHAPE_WINDOW + 1:
+            raise ValueError("Not enough price history to forecast")
+        with span("indicators"):
+            feature_store.update_features(stock, df)
+            state = feature_store.load_state(stock, df)
+
+        with span("model_load"):
+            model = model_registry.get(stock)
+        features = check_features(model, stock)
+        shape = _bar_shape(df)
+
+        closes = df['Close'].to_numpy(dtype=np.float64)
+        returns = np.diff(np.log(closes[-(VOLATILITY_WINDOW + 1):]))
+        sigma = float(np.std(returns, ddof=1)) if len(returns) > 1 else 0.0
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+
+        prev_close = closes[-1]
+        forecasts, steps = [], []
+        with span("recursion"):
+            for _ in range(horizon):
+                step_started = time.perf_counter()
+                # Indicators for the new day, provisionally closing at the last close
+                probe = state.select(0)
+                sma7, sma21, rsi, macd, signal = (float(v[0]) for v in probe.update(prev_close))
+                open_ = prev_close * shape['gap']
+                row = {
+                    'Open': open_, 'High': open_ * shape['high'], 'Low': open_ * shape['low'],
+                    'Volume': shape['volume'], 'RSI': rsi, 'MACD': macd, 'MACD_Signal': signal,
+                    'SMA7': sma7, 'SMA21': sma21,
+                }
+                # No news has been published about future days yet
+                row.update({col: 0.0 for col in SENTIMENT_FEATURES})
+                predicted = float(predict_features(model, pd.DataFrame([row], columns=features), backend)[0])
+                # Commit the predicted close to the state for the next step
+                state.update(predicted)
+                forecasts.append(predicted)
+                prev_close = predicted
+                steps.append(time.perf_counter() - step_started)
+
+        h = np.arange(1, horizon + 1)
+        width = np.exp(z * sigma * np.sqrt(h))
+        forecast = np.array(forecasts)
+        dates = pd.bdate_range(df['Date'].iloc[-1] + pd.offsets.BDay(1), periods=horizon)
+        forecast_df = pd.DataFrame({
+            'Date': dates,
+            'Horizon': h,
+            'Close': forecast,
+            'Lower': forecast / width,
+            'Upper': forecast * width,
+        })
+        actual_df = df[['Date', 'Close']].tail(max(30, horizon)).reset_index(drop=True)
+
+        forecast_latency.record(horizon, time.perf_counter() - started, steps)
+        return forecast_df, actual_df
+
+    except Exception as e:
+        raise Exception(f"Error forecasting prices for {stock}: {str(e)}")
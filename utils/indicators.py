@@ -0,0 +1,381 @@
+"""
+NumPy technical-indicator engine shared by training and serving.
+
+Every function accepts closes as a 1-D array (one ticker) or a 2-D array of
+shape (n_days, n_tickers) and computes all tickers in one pass over time.
+The recurrences are the ones pandas uses for ``rolling(window).mean()`` and
+``ewm(..., adjust=False).mean()``, which is what ``ta`` builds RSI and MACD
+on, so the output is bit-for-bit identical to the features the models were
+trained with. Shorter histories can be left-padded with NaN.
+"""
+import numpy as np
+
+INDICATOR_COLUMNS = ['SMA7', 'SMA21', 'RSI', 'MACD', 'MACD_Signal']
+
+SMA_FAST = 7
+SMA_SLOW = 21
+RSI_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+
+def _ffill(values, initial):
+    """Forward-fill NaNs down the rows of a 2-D array, seeded with ``initial``."""
+    filled = np.vstack([initial[None, :], values])
+    valid = filled == filled
+    idx = np.where(valid, np.arange(len(filled))[:, None], 0)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    return filled[idx, np.arange(filled.shape[1])][1:]
+
+
+class RollingMean:
+    """
+    Fixed-window mean over a vector of tickers.
+    
+    Keeps the same running sum, Kahan compensation terms and special cases
+    as pandas' rolling mean, so results can be continued bar by bar.
+    """
+
+    def __init__(self, window, width=1):
+        self.window = window
+        self.history = np.full((window, width), np.nan)  # last `window` values, oldest first
+        self.nobs = np.zeros(width, dtype=np.int64)
+        self.neg_ct = np.zeros(width, dtype=np.int64)
+        self.sum_x = np.zeros(width)
+        self.compensation_add = np.zeros(width)
+        self.compensation_remove = np.zeros(width)
+        self.num_consecutive_same_value = np.zeros(width, dtype=np.int64)
+        self.prev_value = np.full(width, np.nan)
+
+    def update(self, val):
+        """Advance by one bar and return the means for it."""
+        return self.update_many(np.asarray(val, dtype=np.float64).reshape(1, -1))[0]
+
+    def update_many(self, vals):
+        """
+        Advance by several bars.
+        
+        Args:
+            vals (ndarray): Values of shape (n_bars, n_tickers)
+        
+        Returns:
+            ndarray: Rolling means of shape (n_bars, n_tickers)
+        """
+        n = len(vals)
+        if n == 0:
+            return np.empty_like(vals)
+        # Value leaving the window at each step (NaN while the window fills)
+        removed = np.vstack([self.history, vals])[:n]
+        obs_add = vals == vals
+        obs_rem = removed == removed
+
+        nobs = self.nobs + np.cumsum(obs_add.astype(np.int64) - obs_rem, axis=0)
+        neg_ct = self.neg_ct + np.cumsum(
+            (obs_add & np.signbit(vals)).astype(np.int64) - (obs_rem & np.signbit(removed)), axis=0
+        )
+
+        sums = np.empty_like(vals)
+        consecutive = np.empty(vals.shape, dtype=np.int64)
+        prevs = np.empty_like(vals)
+        sum_x, comp_add, comp_rem = self.sum_x, self.compensation_add, self.compensation_remove
+        count, prev = self.num_consecutive_same_value, self.prev_value
+
+        if obs_add.all() and obs_rem.all():
+            for t in range(n):
+                y = -removed[t] - comp_rem
+                s = sum_x + y
+                comp_rem = s - sum_x - y
+                sum_x = s
+                y = vals[t] - comp_add
+                s = sum_x + y
+                comp_add = s - sum_x - y
+                sum_x = s
+                count = np.where(vals[t] == prev, count + 1, 1)
+                prev = vals[t]
+                sums[t], consecutive[t], prevs[t] = sum_x, count, prev
+        else:
+            for t in range(n):
+                rem, val = obs_rem[t], obs_add[t]
+                y = -removed[t] - comp_rem
+                s = sum_x + y
+                comp_rem = np.where(rem, s - sum_x - y, comp_rem)
+                sum_x = np.where(rem, s, sum_x)
+                y = vals[t] - comp_add
+                s = sum_x + y
+                comp_add = np.where(val, s - sum_x - y, comp_add)
+                sum_x = np.where(val, s, sum_x)
+                count = np.where(val, np.where(vals[t] == prev, count + 1, 1), count)
+                prev = np.where(val, vals[t], prev)
+                sums[t], consecutive[t], prevs[t] = sum_x, count, prev
+
+        self.sum_x, self.compensation_add, self.compensation_remove = sum_x, comp_add, comp_rem
+        self.num_consecutive_same_value, self.prev_value = count, prev
+        self.nobs, self.neg_ct = nobs[-1].copy(), neg_ct[-1].copy()
+        self.history = np.vstack([self.history, vals])[-self.window:]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = sums / nobs
+        same = consecutive >= nobs
+        result = np.where(same, prevs, result)
+        result = np.where(~same & (neg_ct == 0) & (result < 0), 0.0, result)
+        result = np.where(~same & (neg_ct == nobs) & (result > 0), 0.0, result)
+        return np.where((nobs >= self.window) & (nobs > 0), result, np.nan)
+
+    def to_dict(self):
+        return {name: value.tolist() if isinstance(value, np.ndarray) else value
+                for name, value in self.__dict__.items()}
+
+    def select(self, index):
+        """Return a single-ticker copy of this state for column ``index``."""
+        obj = RollingMean(self.window)
+        for name, value in self.__dict__.items():
+            if isinstance(value, np.ndarray):
+                setattr(obj, name, value[..., index:index + 1].copy())
+        return obj
+
+    @classmethod
+    def from_dict(cls, state):
+        obj = cls(state["window"], len(state["nobs"]))
+        for name, value in state.items():
+            current = getattr(obj, name)
+            setattr(obj, name, np.array(value, dtype=current.dtype) if isinstance(current, np.ndarray) else value)
+        return obj
+
+
+class Ewm:
+    """
+    Exponentially weighted mean (``adjust=False``) over a vector of tickers.
+    
+    The smoothing factor is derived from ``span`` or ``alpha`` the way pandas
+    does it, and leading NaNs are skipped rather than treated as zeros.
+    """
+
+    def __init__(self, min_periods, span=None, alpha=None, width=1):
+        com = (span - 1) / 2.0 if span is not None else (1.0 - alpha) / alpha
+        alpha_ = 1.0 / (1.0 + com)
+        self.min_periods = max(min_periods, 1)
+        self.old_wt_factor = 1.0 - alpha_
+        self.new_wt = alpha_
+        self.old_wt = np.ones(width)
+        self.weighted = np.full(width, np.nan)
+        self.nobs = np.zeros(width, dtype=np.int64)
+
+    def update(self, cur):
+        """Advance by one bar and return the means for it."""
+        return self.update_many(np.asarray(cur, dtype=np.float64).reshape(1, -1))[0]
+
+    def update_many(self, values):
+        """
+        Advance by several bars.
+        
+        Args:
+            values (ndarray): Values of shape (n_bars, n_tickers)
+        
+        Returns:
+            ndarray: Weighted means of shape (n_bars, n_tickers)
+        """
+        n = len(values)
+        if n == 0:
+            return np.empty_like(values)
+        obs = values == values
+        nobs = self.nobs + np.cumsum(obs, axis=0)
+        out = np.empty_like(values)
+        factor, new_wt = self.old_wt_factor, self.new_wt
+        weighted, old_wt = self.weighted, self.old_wt
+
+        # Once every ticker has started and nothing further is missing,
+        # old_wt is reset to 1 before each decay and the update simplifies
+        first_obs = np.where(obs.any(axis=0), obs.argmax(axis=0), n)
+        started_at = np.where(weighted == weighted, 0, first_obs + 1)
+        steady = min(int(started_at.max()), n)
+        if steady < n and not (obs[max(steady - 1, 0):].all() and (steady > 0 or (old_wt == 1.0).all())):
+            steady = n
+
+        for t in range(steady):
+            cur, is_obs = values[t], obs[t]
+            started = weighted == weighted
+            old_wt = np.where(started, old_wt * factor, old_wt)
+            blended = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+            weighted = np.where(started & is_obs & (weighted != cur), blended, weighted)
+            old_wt = np.where(started & is_obs, 1.0, old_wt)
+            weighted = np.where(~started & is_obs, cur, weighted)
+            out[t] = weighted
+
+        denominator = factor + new_wt
+        for t in range(steady, n):
+            cur = values[t]
+            blended = (factor * weighted + new_wt * cur) / denominator
+            weighted = np.where(weighted != cur, blended, weighted)
+            out[t] = weighted
+
+        self.weighted, self.old_wt = weighted, old_wt
+        self.nobs = nobs[-1].copy()
+        return np.where(nobs >= self.min_periods, out, np.nan)
+
+    def to_dict(self):
+        return {name: value.tolist() if isinstance(value, np.ndarray) else value
+                for name, value in self.__dict__.items()}
+
+    def select(self, index):
+        """Return a single-ticker copy of this state for column ``index``."""
+        obj = Ewm.__new__(Ewm)
+        obj.__dict__.update(self.__dict__)
+        for name in ("old_wt", "weighted", "nobs"):
+            setattr(obj, name, getattr(self, name)[index:index + 1].copy())
+        return obj
+
+    @classmethod
+    def from_dict(cls, state):
+        obj = cls.__new__(cls)
+        obj.__dict__.update(state)
+        obj.old_wt = np.array(state["old_wt"], dtype=np.float64)
+        obj.weighted = np.array(state["weighted"], dtype=np.float64)
+        obj.nobs = np.array(state["nobs"], dtype=np.int64)
+        return obj
+
+
+class IndicatorState:
+    """
+    Carried-over state for SMA7, SMA21, RSI and MACD/MACD_Signal.
+    
+    Feeding bars through ``update``/``update_many`` gives the same values as
+    computing over the whole history, so appending new bars costs O(new rows).
+    
+    Args:
+        width (int): Number of tickers advanced together
+    """
+
+    def __init__(self, width=1):
+        self.width = width
+        self.sma_fast = RollingMean(SMA_FAST, width)
+        self.sma_slow = RollingMean(SMA_SLOW, width)
+        self.rsi_up = Ewm(RSI_WINDOW, alpha=1 / RSI_WINDOW, width=width)
+        self.rsi_down = Ewm(RSI_WINDOW, alpha=1 / RSI_WINDOW, width=width)
+        self.ema_fast = Ewm(MACD_FAST, span=MACD_FAST, width=width)
+        self.ema_slow = Ewm(MACD_SLOW, span=MACD_SLOW, width=width)
+        self.macd_signal = Ewm(MACD_SIGNAL, span=MACD_SIGNAL, width=width)
+        self.prev_close = np.full(width, np.nan)
+
+    def update(self, close):
+        """
+        Advance every indicator by one bar.
+        
+        Args:
+            close (array): Closing prices of the new bar, one per ticker
+        
+        Returns:
+            tuple: (SMA7, SMA21, RSI, MACD, MACD_Signal) arrays
+        """
+        close = np.broadcast_to(np.asarray(close, dtype=np.float64), (self.width,))
+        return tuple(values[0] for values in self.update_many(close.reshape(1, -1)))
+
+    def update_many(self, close):
+        """
+        Advance every indicator by several bars.
+        
+        Args:
+            close (ndarray): Closing prices of shape (n_bars, n_tickers)
+        
+        Returns:
+            tuple: (SMA7, SMA21, RSI, MACD, MACD_Signal) arrays of the same shape
+        """
+        sma7 = self.sma_fast.update_many(close)
+        sma21 = self.sma_slow.update_many(close)
+
+        # ta maps the undefined first difference to a zero move; padding
+        # before a ticker's first bar stays missing instead
+        observed = close == close
+        prev = _ffill(close, self.prev_close)
+        diff = close - np.vstack([self.prev_close[None, :], prev[:-1]])
+        if len(close):
+            self.prev_close = prev[-1].copy()
+        up = np.where(observed, np.where(diff > 0, diff, 0.0), np.nan)
+        down = np.where(observed, np.where(diff < 0, -diff, -0.0), np.nan)
+        ema_up = self.rsi_up.update_many(up)
+        ema_down = self.rsi_down.update_many(down)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rsi = np.where(ema_down == 0, 100.0, 100 - (100 / (1 + ema_up / ema_down)))
+
+        macd = self.ema_fast.update_many(close) - self.ema_slow.update_many(close)
+        signal = self.macd_signal.update_many(macd)
+        return sma7, sma21, rsi, macd, signal
+
+    def select(self, index):
+        """Return a single-ticker copy of this state for column ``index``."""
+        obj = IndicatorState(1)
+        for name, value in self.__dict__.items():
+            if name not in ("width", "prev_close"):
+                setattr(obj, name, value.select(index))
+        obj.prev_close = self.prev_close[index:index + 1].copy()
+        return obj
+
+    def to_dict(self):
+        state = {name: value.to_dict() for name, value in self.__dict__.items()
+                 if name not in ("width", "prev_close")}
+        state["width"] = self.width
+        state["prev_close"] = self.prev_close.tolist()
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        obj = cls(state["width"])
+        for name in ("sma_fast", "sma_slow"):
+            setattr(obj, name, RollingMean.from_dict(state[name]))
+        for name in ("rsi_up", "rsi_down", "ema_fast", "ema_slow", "macd_signal"):
+            setattr(obj, name, Ewm.from_dict(state[name]))
+        obj.prev_close = np.array(state["prev_close"], dtype=np.float64)
+        return obj
+
+
+def compute_indicators(close, state=None):
+    """
+    Compute all indicators for one or many tickers.
+    
+    Args:
+        close (array): Closes of shape (n_days,) or (n_days, n_tickers)
+        state (IndicatorState): State to continue from, or None to start fresh
+    
+    Returns:
+        dict: Indicator name -> array with the same shape as ``close``
+    """
+    indicators, _ = compute_indicators_with_state(close, state)
+    return indicators
+
+
+def compute_indicators_with_state(close, state=None):
+    """
+    Like ``compute_indicators`` but also return the state after the last bar.
+    
+    Returns:
+        tuple: (dict of indicator arrays, IndicatorState)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    close2d = close.reshape(-1, 1) if close.ndim == 1 else close
+    if state is None:
+        state = IndicatorState(close2d.shape[1])
+    values = state.update_many(close2d)
+    return {name: value.reshape(close.shape) for name, value in zip(INDICATOR_COLUMNS, values)}, state
+
+
+def sma(close, window):
+    """Simple moving average with the given window over 1-D or 2-D closes."""
+    close = np.asarray(close, dtype=np.float64)
+    close2d = close.reshape(-1, 1) if close.ndim == 1 else close
+    return RollingMean(window, close2d.shape[1]).update_many(close2d).reshape(close.shape)
+
+
+def rsi(close):
+    """Wilder RSI (14) over 1-D or 2-D closes."""
+    return compute_indicators(close)['RSI']
+
+
+def macd(close):
+    """
+    EMA-based MACD (12/26) and its 9-period signal line.
+    
+    Returns:
+        tuple: (macd, signal) arrays with the same shape as ``close``
+    """
+    indicators = compute_indicators(close)
+    return indicators['MACD'], indicators['MACD_Signal']
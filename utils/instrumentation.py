@@ -0,0 +1,313 @@
+"""
+Lightweight timing spans for the prediction and sentiment hot paths.
+
+    with span("indicators"):
+        ...
+
+    @traced("predict_prices", profile_calls=True)
+    def predict_prices(...):
+        ...
+
+Spans are off unless ``PERF_TRACE=1`` (or ``enable()`` is called) for the
+whole process, or ``enable_thread()`` turns them on for the calling thread
+(one app session's script run); a disabled span is two flag checks
+returning a shared no-op context.
+Enabled spans record wall time and the change in resident memory, nest
+(``predict_prices/indicators``) and are aggregated per path for
+``prometheus_text()``. Every finished top-level span is kept with its
+children for the app's performance panel and, when ``PERF_TRACE_FILE`` is
+set, appended to that file as JSON lines.
+
+With ``PERF_PROFILE_DIR`` set, every call of a function traced with
+``profile_calls=True`` also writes a cProfile dump (or a pyinstrument HTML
+report with ``PERF_PROFILER=pyinstrument``) to that directory.
+"""
+import contextlib
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+PERF_TRACE = os.getenv("PERF_TRACE", "0") == "1"
+PERF_TRACE_FILE = os.getenv("PERF_TRACE_FILE")
+PERF_PROFILE_DIR = os.getenv("PERF_PROFILE_DIR")
+PERF_PROFILER = os.getenv("PERF_PROFILER", "cprofile")
+PROFILERS = ("cprofile", "pyinstrument")
+MAX_TRACES = 50
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_NOOP = contextlib.nullcontext()
+
+
+def rss_bytes():
+    """Return the process's resident memory in bytes, or None if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Recorder:
+    """
+    Collects finished spans.
+    
+    Args:
+        max_traces (int): Top-level spans kept for ``recent_traces``
+        trace_file (str): JSON-lines file every top-level span is appended to
+    """
+
+    def __init__(self, max_traces=MAX_TRACES, trace_file=None):
+        self.trace_file = trace_file
+        self._totals = {}  # path -> [count, seconds, max seconds, rss delta]
+        self._traces = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+
+    def record(self, path, seconds, rss_delta):
+        with self._lock:
+            totals = self._totals.setdefault(path, [0, 0.0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] = max(totals[2], seconds)
+            totals[3] += rss_delta or 0
+
+    def finish_trace(self, trace):
+        with self._lock:
+            self._traces.append(trace)
+            if self.trace_file:
+                with open(self.trace_file, "a") as f:
+                    f.write(json.dumps(trace) + "\n")
+
+    def summary(self):
+        """
+        Return aggregated span statistics.
+        
+        Returns:
+            list: One dict per span path with count, total/mean/max
+                  milliseconds and mean memory delta in bytes
+        """
+        with self._lock:
+            return [
+                {
+                    "span": path,
+                    "count": count,
+                    "total_ms": seconds * 1000,
+                    "mean_ms": seconds / count * 1000,
+                    "max_ms": max_seconds * 1000,
+                    "mean_rss_delta": rss / count,
+                }
+                for path, (count, seconds, max_seconds, rss) in sorted(self._totals.items())
+            ]
+
+    def recent_traces(self, name=None, session=None):
+        """Return finished top-level spans, newest first, optionally by name or session."""
+        with self._lock:
+            traces = list(self._traces)
+        return [trace for trace in reversed(traces)
+                if (name is None or trace["name"] == name) and (session is None or trace.get("session") == session)]
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+            self._traces.clear()
+
+
+recorder = Recorder(trace_file=PERF_TRACE_FILE)
+_enabled = PERF_TRACE
+_local = threading.local()
+
+
+def enable(flag=True):
+    """Turn span recording on or off for the whole process."""
+    global _enabled
+    _enabled = bool(flag)
+
+
+def enable_thread(flag=True, session=None):
+    """
+    Turn span recording on or off for the calling thread, on top of ``enable``.
+    
+    Args:
+        flag (bool): Record spans started on this thread
+        session (str): Tag for the top-level spans this thread finishes, so
+                       ``recent_traces`` can pick one app session's requests
+    """
+    _local.enabled = bool(flag)
+    _local.session = session
+
+
+def is_enabled():
+    """True if spans started on the calling thread are recorded."""
+    return _enabled or getattr(_local, "enabled", False)
+
+
+class _Span:
+    __slots__ = ("name", "path", "started", "rss", "record")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.path = f"{stack[-1].path}/{self.name}" if stack else self.name
+        self.record = {"name": self.name, "path": self.path, "start": time.time(), "children": []}
+        stack.append(self)
+        self.rss = rss_bytes()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.started
+        rss = rss_bytes()
+        rss_delta = rss - self.rss if rss is not None and self.rss is not None else None
+        stack = _local.stack
+        stack.pop()
+
+        record = self.record
+        record.update({"ms": seconds * 1000, "rss_delta": rss_delta, "error": exc_type.__name__ if exc_type else None})
+        recorder.record(self.path, seconds, rss_delta)
+        if stack:
+            # Nested spans are listed flat, in completion order, under the
+            # top-level span; their paths keep the hierarchy
+            del record["children"]
+            stack[0].record["children"].append(record)
+        else:
+            record["session"] = getattr(_local, "session", None)
+            recorder.finish_trace(record)
+        return False
+
+
+def span(name):
+    """
+    Time a block as a named stage.
+    
+    Args:
+        name (str): Stage name; nested spans are recorded as parent/child
+    
+    Returns:
+        A context manager (a shared no-op one when recording is off)
+    """
+    if not _enabled and not getattr(_local, "enabled", False):
+        return _NOOP
+    return _Span(name)
+
+
+@contextlib.contextmanager
+def profile(name, profile_dir=None, profiler=None):
+    """
+    Profile a block and write the dump to ``profile_dir``.
+    
+    Args:
+        name (str): Prefix of the dump file name
+        profile_dir (str): Output directory (default: PERF_PROFILE_DIR)
+        profiler (str): "cprofile" or "pyinstrument" (default: PERF_PROFILER)
+    """
+    profile_dir = profile_dir or PERF_PROFILE_DIR
+    profiler = profiler or PERF_PROFILER
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler: {profiler}")
+    os.makedirs(profile_dir, exist_ok=True)
+    stem = os.path.join(profile_dir, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}-{time.time_ns()}-{threading.get_ident()}")
+
+    if profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        prof = Profiler()
+        prof.start()
+        try:
+            yield
+        finally:
+            prof.stop()
+            with open(f"{stem}.html", "w") as f:
+                f.write(prof.output_html())
+    else:
+        import cProfile
+
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:
+            # Another profiler is active on this thread (a nested profiled call)
+            yield
+            return
+        try:
+            yield
+        finally:
+            prof.disable()
+            prof.dump_stats(f"{stem}.prof")
+
+
+def traced(name=None, profile_calls=False):
+    """
+    Decorator recording every call of a function as a span.
+    
+    Args:
+        name (str): Span name (default: the function's name)
+        profile_calls (bool): Also write a profile per call when
+                              PERF_PROFILE_DIR is set
+    
+    Returns:
+        callable: The decorator
+    """
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if profile_calls and PERF_PROFILE_DIR:
+                with profile(span_name):
+                    if not is_enabled():
+                        return fn(*args, **kwargs)
+                    with _Span(span_name):
+                        return fn(*args, **kwargs)
+            if not _enabled and not getattr(_local, "enabled", False):
+                return fn(*args, **kwargs)
+            with _Span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text(prefix="stock_insights"):
+    """
+    Render the span totals in the Prometheus text exposition format.
+    
+    Args:
+        prefix (str): Metric name prefix
+    
+    Returns:
+        str: ``<prefix>_span_seconds`` summary (count and sum), the maximum
+             and the summed memory delta per span path
+    """
+    rows = recorder.summary()
+    lines = [
+        f"# HELP {prefix}_span_seconds Time spent in instrumented stages.",
+        f"# TYPE {prefix}_span_seconds summary",
+    ]
+    for row in rows:
+        labels = f'{{span="{_label(row["span"])}"}}'
+        lines.append(f"{prefix}_span_seconds_count{labels} {row['count']}")
+        lines.append(f"{prefix}_span_seconds_sum{labels} {row['total_ms'] / 1000:.6f}")
+    lines += [
+        f"# HELP {prefix}_span_max_seconds Slowest call of each stage.",
+        f"# TYPE {prefix}_span_max_seconds gauge",
+    ]
+    for row in rows:
+        lines.append(f'{prefix}_span_max_seconds{{span="{_label(row["span"])}"}} {row["max_ms"] / 1000:.6f}')
+    lines += [
+        f"# HELP {prefix}_span_rss_delta_bytes Summed change in resident memory across calls of each stage.",
+        f"# TYPE {prefix}_span_rss_delta_bytes gauge",
+    ]
+    for row in rows:
+        total = row["mean_rss_delta"] * row["count"]
+        lines.append(f'{prefix}_span_rss_delta_bytes{{span="{_label(row["span"])}"}} {total:.0f}')
+    return "\n".join(lines) + "\n"
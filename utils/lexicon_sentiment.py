@@ -0,0 +1,243 @@
+"""
+Bulk headline polarity with TextBlob's pattern lexicon.
+
+``TextBlob(text).sentiment.polarity`` builds a blob per headline and looks
+every token up through pattern's lazily-loaded lexicon dict, whose
+``__contains__``/``__getitem__`` go through a Python-level wrapper. This
+module loads the same lexicon once into a flat ``{word: (polarity,
+intensity, is_adverb)}`` dict and reimplements pattern's tokenizer and
+assessment rules on top of it, so the scores are identical to TextBlob's.
+"""
+import re
+import threading
+
+from textblob._text import (
+    ABBREVIATIONS,
+    EMOTICONS,
+    EOS,
+    PUNCTUATION,
+    RE_ABBR1,
+    RE_ABBR2,
+    RE_ABBR3,
+    RE_EMOTICONS,
+    RE_SARCASM,
+    TOKEN,
+    replacements,
+)
+
+NEGATIONS = frozenset(("no", "not", "n't", "never"))
+
+_CONTRACTIONS = re.compile("|".join(re.escape(contraction) for contraction in replacements))
+_LEADING = tuple(PUNCTUATION.replace(".", ""))
+_TRAILING = _LEADING + (".",)
+_LEADING_CHARS = frozenset(_LEADING)
+_TRAILING_CHARS = frozenset(_TRAILING)
+_SENTENCE_END = ("...", ".", "!", "?", EOS)
+_SENTENCE_TAIL = ("'", '"', "”", "’", "...", ".", "!", "?", ")", EOS)
+_QUOTES = str.maketrans({"“": " “ ", "”": " ” ", "‘": " ‘ ", "’": " ’ ", "'": " ' ", '"': ' " '})
+_WHITESPACE = re.compile(r"\s+")
+_LINEBREAK = re.compile(r"\n{2,}")
+
+
+def _is_abbreviation(token):
+    return (
+        token in ABBREVIATIONS
+        or RE_ABBR1.match(token) is not None
+        or RE_ABBR2.match(token) is not None
+        or RE_ABBR3.match(token) is not None
+    )
+
+
+def tokenize(text):
+    """
+    Split text into lower-case tokens exactly as pattern's sentiment does.
+    
+    Args:
+        text (str): Text to tokenize
+    
+    Returns:
+        list: Tokens
+    """
+    string = _CONTRACTIONS.sub(lambda m: replacements[m.group(0)], str(text))
+    string = string.translate(_QUOTES).replace("\r\n", "\n")
+    string = _LINEBREAK.sub(" %s " % EOS, string)
+    string = _WHITESPACE.sub(" ", string)
+
+    tokens = []
+    for t in TOKEN.findall(string + " "):
+        # Plain words need none of the punctuation handling below
+        if t[0] not in _LEADING_CHARS and t[-1] not in _TRAILING_CHARS:
+            tokens.append(t)
+            continue
+        tail = []
+        while t.startswith(_LEADING) and t not in replacements:
+            tokens.append(t[0])
+            t = t[1:]
+        while t.endswith(_TRAILING) and t not in replacements:
+            if t.endswith(_LEADING):
+                tail.append(t[-1])
+                t = t[:-1]
+            if t.endswith("..."):
+                tail.append("...")
+                t = t[:-3].rstrip(".")
+            if t.endswith("."):
+                if _is_abbreviation(t):
+                    break
+                tail.append(t[-1])
+                t = t[:-1]
+        if t != "":
+            tokens.append(t)
+        tokens.extend(reversed(tail))
+
+    sentences, i, j = [[]], 0, 0
+    while j < len(tokens):
+        if tokens[j] in _SENTENCE_END:
+            # Handle citations, trailing parenthesis, repeated punctuation (!?)
+            while j < len(tokens) and tokens[j] in _SENTENCE_TAIL:
+                if tokens[j] in ("'", '"') and sentences[-1].count(tokens[j]) % 2 == 0:
+                    break
+                j += 1
+            sentences[-1].extend(t for t in tokens[i:j] if t != EOS)
+            sentences.append([])
+            i = j
+        j += 1
+    sentences[-1].extend(tokens[i:j])
+
+    words = []
+    for sentence in sentences:
+        if sentence:
+            sentence = RE_SARCASM.sub("(!)", " ".join(sentence))
+            sentence = RE_EMOTICONS.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), sentence)
+            words.extend(sentence.lower().split())
+    return words
+
+
+def load_lexicon():
+    """
+    Load TextBlob's English sentiment lexicon into a flat dict.
+    
+    Returns:
+        dict: ``{word: (polarity, intensity, is_adverb)}`` using the
+              part-of-speech averaged scores pattern uses for raw text
+    """
+    from textblob.en import sentiment
+
+    # Any lookup makes the lazy dict load the XML lexicon
+    "good" in sentiment
+    return {
+        word: (tags[None][0], tags[None][2], "RB" in tags)
+        for word, tags in dict.items(sentiment)
+    }
+
+
+def _emoticons():
+    # First matching mood wins, as in pattern's scan over EMOTICONS
+    scores = {}
+    for (_, polarity), faces in EMOTICONS.items():
+        for face in faces:
+            scores.setdefault(face.lower(), polarity)
+    return scores
+
+
+class LexiconSentimentScorer:
+    """
+    TextBlob-compatible polarity scorer over a preloaded lexicon.
+    
+    Args:
+        lexicon (dict): Lexicon from ``load_lexicon``, or None to load it on
+            first use
+    """
+
+    def __init__(self, lexicon=None):
+        self._lexicon = lexicon
+        self._emoticons = _emoticons()
+        self._lock = threading.Lock()
+
+    @property
+    def lexicon(self):
+        if self._lexicon is None:
+            with self._lock:
+                if self._lexicon is None:
+                    self._lexicon = load_lexicon()
+        return self._lexicon
+
+    def score(self, text):
+        """
+        Return the polarity of one text, equal to TextBlob's.
+        
+        Args:
+            text (str): Text to score
+        
+        Returns:
+            float: Polarity in [-1, 1]
+        """
+        lexicon = self.lexicon
+        emoticons = self._emoticons
+        # Each assessment is [polarity, intensity, negated]
+        assessments = []
+        m = None  # preceding modifier word
+        n = None  # preceding negation
+        for w in tokenize(text):
+            entry = lexicon.get(w)
+            if entry is not None:
+                p, i, is_adverb = entry
+                if m is None:
+                    assessments.append([p, i, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(p * last[1], +1.0))
+                    last[1] = i
+                if n is not None:
+                    last = assessments[-1]
+                    last[1] = 1.0 / last[1]
+                    last[2] = True
+                m = w if is_adverb else None
+                n = w if w in NEGATIONS else None
+            else:
+                if w in NEGATIONS:
+                    n = w
+                elif n and len(w.strip("'")) > 1:
+                    n = None
+                if n is not None and m is not None and m.endswith("ly"):
+                    assessments[-1][2] = True
+                    n = None
+                elif m and len(w) > 2:
+                    m = None
+                if w == "!" and assessments:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(last[0] * 1.25, +1.0))
+                if w == "(!)":
+                    assessments.append([0.0, 1.0, False])
+                if w.isalpha() is False and len(w) <= 5 and w not in PUNCTUATION:
+                    polarity = emoticons.get(w)
+                    if polarity is not None:
+                        assessments.append([polarity, 1.0, False])
+
+        total = 0
+        for p, _, negated in assessments:
+            total += p * -0.5 if negated else p
+        return total / float(len(assessments) or 1)
+
+    def polarity(self, texts):
+        """
+        Score a list of texts.
+        
+        Args:
+            texts (list): Strings to score
+        
+        Returns:
+            list: Polarity of each text
+        """
+        scores = {}
+        for text in texts:
+            if text not in scores:
+                scores[text] = self.score(text)
+        return [scores[text] for text in texts]
+
+
+_default_scorer = LexiconSentimentScorer()
+
+
+def get_scorer():
+    """Return the process-wide lexicon scorer."""
+    return _default_scorer
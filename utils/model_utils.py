@@ -1,30 +1,459 @@
+import json
+import numpy as np
 import pandas as pd
 import pickle
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
+from utils import feature_matrix, feature_store, price_store, sentiment_features
+from utils.instrumentation import span, traced
+from utils.sentiment_features import SENTIMENT_FEATURES
+
+MODELS_DIR = "models"
+FEATURES = ['Open', 'High', 'Low', 'Volume', 'RSI', 'MACD', 'MACD_Signal', 'SMA7', 'SMA21']
+# Models trained with daily news sentiment (train.py --sentiment) take these
+# after FEATURES; the feature names saved with the model tell them apart
+FEATURE_SETS = (FEATURES, FEATURES + SENTIMENT_FEATURES)
+# XGBRegressor settings used by the training notebooks
+MODEL_PARAMS = {'n_estimators': 500, 'learning_rate': 0.05, 'max_depth': 6, 'subsample': 0.9}
+
+# Native XGBoost formats are tried before pickle when looking up a model
+NATIVE_FORMATS = ('ubj', 'json')
+MODEL_FORMATS = NATIVE_FORMATS + ('pkl',)
+MODEL_FORMAT_VERSION = 1
+
+# "xgboost" predicts with the booster, "compiled" with the NumPy tree walker
+# in utils/tree_inference.py (identical output), "auto" picks the walker for
+# batches of at most COMPILED_MAX_ROWS rows, where the booster's per-call
+# overhead dominates
+INFERENCE_BACKENDS = ('xgboost', 'compiled', 'auto')
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "xgboost")
+COMPILED_MAX_ROWS = 1000
+# Rows predicted per chunk by iter_predictions
+PREDICT_CHUNK_ROWS = int(os.getenv("PREDICT_CHUNK_ROWS", "2048"))
+
+def model_path(stock_name, models_dir=MODELS_DIR, fmt='pkl'):
+    """
+    Return the path of the specified stock's model file.
+    
+    Args:
+        stock_name (str): Name of the stock
+        models_dir (str): Directory holding the model files
+        fmt (str): File format, one of MODEL_FORMATS
+    
+    Returns:
+        str: Path to the model file
+    """
+    return os.path.join(models_dir, f"{stock_name.lower()}.{fmt}")
+
+def metadata_path(stock_name, models_dir=MODELS_DIR):
+    """Return the path of the metadata sidecar for a native-format model."""
+    return os.path.join(models_dir, f"{stock_name.lower()}.meta.json")
+
+def find_model_file(stock_name, models_dir=MODELS_DIR):
+    """
+    Return the stock's model file, preferring native formats over pickle.
+    
+    Returns:
+        str: Path to the model file, or None if there is none
+    """
+    for fmt in MODEL_FORMATS:
+        path = model_path(stock_name, models_dir, fmt)
+        if os.path.exists(path):
+            return path
+    return None
+
+def _load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+def _load_native(path):
+    """
+    Load an XGBoost JSON/UBJ model and check it against its metadata sidecar.
+    
+    Unlike unpickling, this never executes code from the file.
+    """
+    from xgboost import XGBRegressor
+
+    meta_path = os.path.join(os.path.dirname(path), os.path.basename(path).rsplit('.', 1)[0] + ".meta.json")
+    if not os.path.exists(meta_path):
+        raise FileNotFoundError(f"Model metadata not found: {meta_path}")
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta.get("format_version") != MODEL_FORMAT_VERSION:
+        raise ValueError(f"Unsupported model format version: {meta.get('format_version')}")
+
+    model = XGBRegressor()
+    model.load_model(path)
+    booster = model.get_booster()
+    if booster.feature_names is None:
+        booster.feature_names = list(meta["features"])
+    elif list(booster.feature_names) != list(meta["features"]):
+        raise ValueError(f"Model features {booster.feature_names} do not match metadata {meta['features']}")
+    return model
+
+def load_model_file(path):
+    """
+    Load a model file in any of MODEL_FORMATS, chosen by extension.
+    
+    Args:
+        path (str): Path to the model file
+    
+    Returns:
+        model: The loaded machine learning model
+    """
+    if path.rsplit('.', 1)[-1] in NATIVE_FORMATS:
+        return _load_native(path)
+    return _load_pickle(path)
+
+def save_model(model, stock_name, models_dir=MODELS_DIR, fmt='ubj', version=None, keep_other_formats=False,
+               remove_pickle=False):
+    """
+    Save a trained model, with a metadata sidecar for native formats.
+    
+    Files are written under temporary names and renamed into place, sidecar
+    first, so a reader never pairs a new model with stale metadata. Native
+    model files of the stock in the other native format, which an earlier
+    save wrote, are removed so lookups resolve to the new one, unless
+    ``keep_other_formats`` is set. A pickle is only removed with
+    ``remove_pickle``; lookups already prefer native files over it.
+    
+    Args:
+        model: Trained XGBRegressor
+        stock_name (str): Name of the stock
+        models_dir (str): Directory holding the model files
+        fmt (str): File format, one of MODEL_FORMATS
+        version (str): Model version recorded in the sidecar
+        keep_other_formats (bool): Leave the stock's other saved model files alone
+        remove_pickle (bool): Also remove the stock's pickle after saving a
+            native file
+    
+    Returns:
+        str: Path of the written model file
+    """
+    if fmt not in MODEL_FORMATS:
+        raise ValueError(f"Unknown model format: {fmt}")
+    os.makedirs(models_dir, exist_ok=True)
+    path = model_path(stock_name, models_dir, fmt)
+    tmp_path = f"{path}.tmp-{os.getpid()}.{fmt}"
+
+    if fmt in NATIVE_FORMATS:
+        import xgboost
+
+        booster = model.get_booster()
+        features = list(booster.feature_names or FEATURES)
+        meta = {
+            "format_version": MODEL_FORMAT_VERSION,
+            "format": fmt,
+            "features": features,
+            "target": "Close",
+            "version": version,
+            "xgboost": xgboost.__version__,
+        }
+        meta_path = metadata_path(stock_name, models_dir)
+        meta_tmp_path = f"{meta_path}.tmp-{os.getpid()}"
+        # Write both files before replacing either; the sidecar goes first
+        # so the new model never appears next to the old feature list
+        model.save_model(tmp_path)
+        with open(meta_tmp_path, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(meta_tmp_path, meta_path)
+    else:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(model, f)
+    os.replace(tmp_path, path)
+
+    if not keep_other_formats:
+        for other in NATIVE_FORMATS:
+            if other != fmt and os.path.exists(model_path(stock_name, models_dir, other)):
+                os.remove(model_path(stock_name, models_dir, other))
+        if fmt not in NATIVE_FORMATS and os.path.exists(metadata_path(stock_name, models_dir)):
+            os.remove(metadata_path(stock_name, models_dir))
+    if remove_pickle and fmt in NATIVE_FORMATS and os.path.exists(model_path(stock_name, models_dir, 'pkl')):
+        os.remove(model_path(stock_name, models_dir, 'pkl'))
+    return path
+
+def check_features(model, stock_name):
+    """
+    Check that a model was trained on one of FEATURE_SETS in the same order.
+    
+    Args:
+        model: Loaded model
+        stock_name (str): Name of the stock, for the error message
+    
+    Returns:
+        list: The model's input columns (FEATURES for models saved without
+              feature names)
+    """
+    booster = model.get_booster() if hasattr(model, "get_booster") else None
+    names = getattr(booster, "feature_names", None)
+    if names is None:
+        return FEATURES
+    if list(names) not in FEATURE_SETS:
+        raise ValueError(f"Model for {stock_name} expects features {list(names)}, supported: {FEATURE_SETS}")
+    return list(names)
+
 def load_model(stock_name):
     """
     Load a trained model for the specified stock.
     
+    Native XGBoost files (``.ubj``/``.json`` plus ``.meta.json``) are used
+    when present, otherwise the pickle.
+    
     Args:
         stock_name (str): Name of the stock
     
     Returns:
         model: The loaded machine learning model
     """
-    model_path = f"models/{stock_name.lower()}.pkl"
+    path = find_model_file(stock_name)
     
-    if not os.path.exists(model_path):
-        raise FileNotFoundError(f"Model file not found: {model_path}")
+    if path is None:
+        raise FileNotFoundError(f"Model file not found: {model_path(stock_name)}")
     
     try:
-        with open(model_path, "rb") as f:
-            model = pickle.load(f)
-        return model
+        return load_model_file(path)
     except Exception as e:
         raise Exception(f"Error loading model for {stock_name}: {str(e)}")
 
+class ModelRegistry:
+    """
+    In-memory cache of loaded models shared by every caller in the process.
+    
+    Entries are keyed by ticker and remember the (mtime, size) signature of
+    the file they were loaded from, so a model is reloaded automatically
+    when the file on disk changes or a file in a preferred format appears.
+    Least recently used entries are evicted once either ``max_models`` or
+    ``max_bytes`` (measured as on-disk file size) is exceeded.
+    
+    Args:
+        max_models (int): Maximum number of models kept in memory, or None
+        max_bytes (int): Maximum total size of cached model files, or None
+        models_dir (str): Directory holding the model files
+        loader (callable): Function that loads a model from a file path
+    """
+
+    def __init__(self, max_models=8, max_bytes=None, models_dir=MODELS_DIR, loader=load_model_file):
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.models_dir = models_dir
+        self._loader = loader
+        self._entries = OrderedDict()  # ticker -> (signature, nbytes, model)
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.evictions = 0
+        self.load_time = 0.0
+
+    def _signature(self, path):
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size)
+
+    def get(self, stock_name):
+        """
+        Return the model for a stock, loading it from disk on a miss.
+        
+        Args:
+            stock_name (str): Name of the stock
+        
+        Returns:
+            model: The loaded machine learning model
+        """
+        key = stock_name.lower()
+        path = find_model_file(key, self.models_dir)
+        if path is None:
+            raise FileNotFoundError(f"Model file not found: {model_path(key, self.models_dir)}")
+        signature = self._signature(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so different tickers load in parallel,
+        # while concurrent misses for the same ticker only load it once.
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == signature:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                stale = entry is not None
+
+            start = time.perf_counter()
+            try:
+                model = self._loader(path)
+            except Exception as e:
+                raise Exception(f"Error loading model for {stock_name}: {str(e)}")
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self.misses += 1
+                self.load_time += elapsed
+                if stale:
+                    self.reloads += 1
+                self._entries[key] = (signature, signature[2], model)
+                self._entries.move_to_end(key)
+                self._evict()
+            return model
+
+    def _evict(self):
+        # Never evict the entry that was just inserted
+        while len(self._entries) > 1 and (
+            (self.max_models is not None and len(self._entries) > self.max_models)
+            or (self.max_bytes is not None and self.cached_bytes() > self.max_bytes)
+        ):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def cached_bytes(self):
+        """Return the total on-disk size of the cached models."""
+        return sum(entry[1] for entry in self._entries.values())
+
+    def invalidate(self, stock_name=None):
+        """
+        Drop one cached model, or all of them when no stock is given.
+        
+        Args:
+            stock_name (str): Name of the stock, or None to clear everything
+        """
+        with self._lock:
+            if stock_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(stock_name.lower(), None)
+
+    def stats(self):
+        """
+        Return cache counters.
+        
+        Returns:
+            dict: Hit/miss/reload/eviction counts, load time and cache size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "load_time": self.load_time,
+                "models": list(self._entries),
+                "cached_bytes": self.cached_bytes(),
+            }
+
+# Shared by every session in the Streamlit process
+model_registry = ModelRegistry(
+    max_models=int(os.getenv("MODEL_CACHE_MAX_MODELS", "8")),
+    max_bytes=int(os.getenv("MODEL_CACHE_MAX_BYTES", "0")) or None,
+)
+
+def load_price_data(stock, columns=None, data_dir=price_store.DATA_DIR, store_dir=price_store.STORE_DIR):
+    """
+    Load typed, date-sorted price data for a stock.
+    
+    Reads the memory-mapped columnar store when it is up to date with the CSV
+    and falls back to parsing the CSV otherwise, refreshing the store on the
+    way so the next call takes the fast path.
+    
+    Args:
+        stock (str): Stock symbol
+        columns (list): Price columns to load (default: Open, High, Low, Close, Volume)
+        data_dir (str): Directory holding the raw CSVs
+        store_dir (str): Directory holding the columnar stores
+    
+    Returns:
+        DataFrame: Date plus the requested columns
+    """
+    if columns is None:
+        columns = price_store.PRICE_COLUMNS
+
+    if price_store.is_fresh(stock, data_dir, store_dir):
+        with span("load_store"):
+            return price_store.load_store(stock, columns=columns, store_dir=store_dir)
+
+    data_path = price_store.csv_path(stock, data_dir)
+    if not os.path.exists(data_path):
+        raise FileNotFoundError(f"Data file not found: {data_path}")
+
+    df = price_store.read_price_csv(data_path)
+    try:
+        with span("write_store"):
+            price_store.write_store(df, price_store.store_path(stock, store_dir), source=data_path)
+    except OSError:
+        # A read-only deployment can still serve from the CSV
+        pass
+    return df[['Date'] + list(columns)]
+
+def _feature_frame(df, indicators):
+    """Join stored indicators onto a price frame and validate the feature set."""
+    df = pd.concat([df, indicators[feature_store.INDICATOR_COLUMNS]], axis=1)
+    
+    if not df[feature_store.INDICATOR_COLUMNS].notna().all(axis=1).any():
+        raise ValueError("No data available after preprocessing")
+    
+    # Check if all required features are available
+    missing_features = [f for f in FEATURES if f not in df.columns]
+    if missing_features:
+        raise ValueError(f"Missing features: {missing_features}")
+    return df
+
+def _predict_range(stock, df, start_date, end_date):
+    """Run the stock's model over the rows of ``df`` inside the date range."""
+    # Load model
+    with span("model_load"):
+        model = model_registry.get(stock)
+    features = check_features(model, stock)
+    if features != FEATURES:
+        with span("sentiment"):
+            aligned = sentiment_features.aligned_features(stock, df['Date'])
+        df = pd.concat([df, aligned.set_axis(df.index)], axis=1)
+
+    # Filter data for prediction period
+    predict_df = df[(df['Date'] >= pd.to_datetime(start_date)) & 
+                   (df['Date'] <= pd.to_datetime(end_date))].dropna()
+    
+    if predict_df.empty:
+        raise ValueError(f"No data available for the specified date range: {start_date} to {end_date}")
+
+    # Make predictions
+    with span("inference"):
+        predict_df['Predicted_Close'] = predict_features(model, predict_df[features])
+    return predict_df
+
+def predict_features(model, features, backend=None):
+    """
+    Run a model over a feature frame with the selected inference backend.
+    
+    Args:
+        model: Loaded model
+        features (DataFrame): Rows with the model's feature columns in order
+                              (or an array of them)
+        backend (str): One of INFERENCE_BACKENDS (default: INFERENCE_BACKEND)
+    
+    Returns:
+        ndarray: Predictions
+    """
+    backend = backend or INFERENCE_BACKEND
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend}")
+    if backend == 'compiled' or (backend == 'auto' and len(features) <= COMPILED_MAX_ROWS):
+        from utils.tree_inference import compile_model
+        return compile_model(model).predict(np.asarray(features))
+    return model.predict(features)
+
+@traced("predict_prices", profile_calls=True)
 def predict_prices(stock, start_date, end_date):
     """
     Predict stock prices for the given date range.
@@ -38,81 +467,229 @@ def predict_prices(stock, start_date, end_date):
         tuple: (predicted_df, actual_df)
     """
     try:
-        # Load data
-        data_path = f"data/{stock.lower()}.csv"
-        if not os.path.exists(data_path):
-            raise FileNotFoundError(f"Data file not found: {data_path}")
-        
-        df = pd.read_csv(data_path)
-        
-        # Convert all required numeric columns and drop NaNs
-        numeric_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        # Drop rows with NaN values in any of the required columns
-        df = df.dropna(subset=numeric_columns)
-        
-        # Check if we have enough data
-        if len(df) == 0:
-            raise ValueError("No valid numeric data found in the CSV file")
-        
-        df['Date'] = pd.to_datetime(df['Date'])
-        df = df.sort_values('Date')
+        # Streamed from the published feature matrix or the stores; no
+        # full-history frame is built
+        combined = _collect_predictions(stock, start_date, end_date, PREDICT_CHUNK_ROWS, False)
+        pred_df = pd.DataFrame({'Date': combined['Date'], 'Close': combined['Close_Predicted']})
+        actual_df = pd.DataFrame({'Date': combined['Date'], 'Close': combined['Close_Actual']})
+        return pred_df, actual_df
 
-        # Calculate technical indicators
-        df['SMA7'] = df['Close'].rolling(window=7).mean()
-        df['SMA21'] = df['Close'].rolling(window=21).mean()
-        
-        try:
-            from ta.momentum import RSIIndicator
-            from ta.trend import MACD
-
-            # Ensure Close is a pandas Series
-            close_series = pd.Series(df['Close'].values, index=df.index)
-            df['RSI'] = RSIIndicator(close=close_series).rsi()
-            macd = MACD(close=close_series)
-            df['MACD'] = macd.macd()
-            df['MACD_Signal'] = macd.macd_signal()
-        except ImportError:
-            # Fallback if ta library is not available
-            df['RSI'] = 50  # Default neutral RSI
-            df['MACD'] = 0  # Default MACD
-            df['MACD_Signal'] = 0  # Default MACD signal
-
-        df.dropna(inplace=True)
-        
-        if df.empty:
-            raise ValueError("No data available after preprocessing")
-        
-        features = ['Open', 'High', 'Low', 'Volume', 'RSI', 'MACD', 'MACD_Signal', 'SMA7', 'SMA21']
-        
-        # Check if all required features are available
-        missing_features = [f for f in features if f not in df.columns]
-        if missing_features:
-            raise ValueError(f"Missing features: {missing_features}")
-        
-        # Load model
-        model = load_model(stock)
+    except Exception as e:
+        raise Exception(f"Error predicting prices for {stock}: {str(e)}")
 
-        # Filter data for prediction period
-        predict_df = df[(df['Date'] >= pd.to_datetime(start_date)) & 
-                       (df['Date'] <= pd.to_datetime(end_date))].copy()
-        
-        if predict_df.empty:
-            raise ValueError(f"No data available for the specified date range: {start_date} to {end_date}")
+def _open_stores(stock):
+    """
+    Bring a stock's price and feature stores up to date with its CSV.
+    
+    Returns:
+        ndarray: The store's memory-mapped Date column, or None when the
+                 stores cannot be written (the caller then works in memory)
+    """
+    try:
+        if not price_store.is_fresh(stock):
+            with span("write_store"):
+                price_store.ingest_csv(stock)
+        prices = price_store.load_store(stock, columns=['Close'])
+        if not feature_store.is_current(stock, prices['Date']):
+            with span("indicators"):
+                feature_store.update_features(stock, prices)
+        if not feature_store.is_current(stock, prices['Date']):
+            return None
+    except OSError:
+        return None
+    return np.load(os.path.join(price_store.store_path(stock), "Date.npy"), mmap_mode="r")
 
-        # Make predictions
-        predict_df['Predicted_Close'] = model.predict(predict_df[features])
+def _predicted_chunk(model, prices, indicators, backend, ohlc=False, features=FEATURES, sentiment=None):
+    parts = [prices, indicators[feature_store.INDICATOR_COLUMNS]]
+    if sentiment is not None:
+        parts.append(sentiment.reset_index(drop=True))
+    df = pd.concat(parts, axis=1).dropna()
+    with span("inference"):
+        predicted = predict_features(model, df[features], backend)
+    columns = {'Date': df['Date'].to_numpy()}
+    if ohlc:
+        columns.update({col: df[col].to_numpy() for col in ('Open', 'High', 'Low')})
+    columns['Close_Actual'] = df['Close'].to_numpy()
+    columns['Close_Predicted'] = predicted
+    return pd.DataFrame(columns)
 
-        # Prepare return dataframes
-        pred_df = predict_df[['Date', 'Predicted_Close']].copy()
-        pred_df.columns = ['Date', 'Close']
+def _sentiment(stock, dates, features):
+    """Sentiment features for a stock's full date history, if the model takes them."""
+    if features == FEATURES:
+        return None
+    with span("sentiment"):
+        return sentiment_features.aligned_features(stock, dates)
 
-        actual_df = predict_df[['Date', 'Close']].copy()
-        
-        return pred_df, actual_df
+def iter_predictions(stock, start_date, end_date, chunk_rows=PREDICT_CHUNK_ROWS, backend=None, ohlc=False):
+    """
+    Predict a date range chunk by chunk.
+    
+    Rows come from the stock's published feature matrix when there is a
+    current one (see feature_matrix), otherwise prices and indicators are
+    read from the memory-mapped stores. Either way ``chunk_rows`` rows are
+    read at a time, so memory stays bounded however long the range is. Rows
+    whose indicators are still warming up are skipped. Models trained with
+    sentiment get the precomputed daily sentiment (see sentiment_features).
+    
+    Args:
+        stock (str): Stock symbol
+        start_date (date): Start date for prediction
+        end_date (date): End date for prediction
+        chunk_rows (int): Trading days per chunk
+        backend (str): Inference backend (see INFERENCE_BACKENDS)
+        ohlc (bool): Also include the Open, High and Low columns
+    
+    Yields:
+        DataFrame: Date, Close_Actual and Close_Predicted for one chunk
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    with span("model_load"):
+        model = model_registry.get(stock)
+    features = check_features(model, stock)
+    with span("load_prices"):
+        matrix = feature_matrix.attach(stock)
+        if matrix is not None and matrix.columns[:len(features)] != features:
+            # Published without the sentiment columns this model needs
+            matrix = None
+        dates = _open_stores(stock) if matrix is None else None
+
+    if matrix is not None:
+        # Published matrix: every row is predictable and already in feature order
+        first, last = matrix.rows(start_date, end_date)
+        for lo in range(first, last, chunk_rows):
+            hi = min(lo + chunk_rows, last)
+            with span("inference"):
+                predicted = predict_features(model, matrix.features[lo:hi, :len(features)], backend)
+            columns = {'Date': matrix.dates[lo:hi]}
+            if ohlc:
+                columns.update({col: matrix.prices[lo:hi, i] for i, col in enumerate(('Open', 'High', 'Low'))})
+            columns['Close_Actual'] = matrix.prices[lo:hi, 3]
+            columns['Close_Predicted'] = predicted
+            yield pd.DataFrame(columns)
+        return
+
+    start = np.datetime64(pd.Timestamp(start_date), "ns")
+    end = np.datetime64(pd.Timestamp(end_date), "ns")
+    if dates is None:
+        # Read-only deployment: predict from an in-memory frame instead
+        df = load_price_data(stock)
+        indicators = feature_store.update_features(stock, df)
+        sentiment = _sentiment(stock, df['Date'], features)
+        mask = ((df['Date'] >= start) & (df['Date'] <= end)).to_numpy()
+        df, indicators = df[mask].reset_index(drop=True), indicators[mask].reset_index(drop=True)
+        if sentiment is not None:
+            sentiment = sentiment[mask]
+        for lo in range(0, len(df), chunk_rows):
+            yield _predicted_chunk(model, df.iloc[lo:lo + chunk_rows], indicators.iloc[lo:lo + chunk_rows], backend,
+                                   ohlc, features, None if sentiment is None else sentiment.iloc[lo:lo + chunk_rows])
+        return
+
+    sentiment = _sentiment(stock, dates, features)
+    first = int(np.searchsorted(dates, start, side="left"))
+    last = int(np.searchsorted(dates, end, side="right"))
+    for lo in range(first, last, chunk_rows):
+        hi = min(lo + chunk_rows, last)
+        chunk_start, chunk_end = dates[lo], dates[hi - 1]
+        prices = price_store.load_store(stock, columns=price_store.PRICE_COLUMNS, start=chunk_start, end=chunk_end)
+        indicators = feature_store.load_features(stock, chunk_start, chunk_end)
+        yield _predicted_chunk(model, prices, indicators, backend, ohlc, features,
+                               None if sentiment is None else sentiment.iloc[lo:hi])
+
+@traced("predict_range", profile_calls=True)
+def predict_range(stock, start_date, end_date, chunk_rows=PREDICT_CHUNK_ROWS, ohlc=False):
+    """
+    Predict stock prices for a date range of any length.
+    
+    Args:
+        stock (str): Stock symbol
+        start_date (date): Start date for prediction
+        end_date (date): End date for prediction
+        chunk_rows (int): Trading days predicted per chunk
+        ohlc (bool): Also include the Open, High and Low columns
+    
+    Returns:
+        DataFrame: Date, Close_Actual and Close_Predicted columns
+    """
+    try:
+        return _collect_predictions(stock, start_date, end_date, chunk_rows, ohlc)
 
     except Exception as e:
         raise Exception(f"Error predicting prices for {stock}: {str(e)}")
+
+def _collect_predictions(stock, start_date, end_date, chunk_rows, ohlc):
+    chunks = [chunk for chunk in iter_predictions(stock, start_date, end_date, chunk_rows, ohlc=ohlc) if len(chunk)]
+    if not chunks:
+        raise ValueError(f"No data available for the specified date range: {start_date} to {end_date}")
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+def predict_prices_batch(stocks, start_date, end_date, max_workers=None):
+    """
+    Predict prices for many stocks over the same date range.
+    
+    Price data is loaded once per stock, indicators that need rebuilding are
+    computed together in one batch, and model inference runs in a thread
+    pool (XGBoost releases the GIL while predicting). A failing stock is
+    reported in the returned failures instead of aborting the batch.
+    
+    Args:
+        stocks (list): Stock symbols
+        start_date (date): Start date for prediction
+        end_date (date): End date for prediction
+        max_workers (int): Inference threads (default: one per stock, at most 8)
+    
+    Returns:
+        tuple: (long-format DataFrame with Stock, Date, Actual, Predicted, Error
+                columns; dict mapping failed stocks to their error message)
+    """
+    failures = {}
+    prices = {}
+    for stock in stocks:
+        try:
+            df = load_price_data(stock)
+            if len(df) == 0:
+                raise ValueError("No valid numeric data found in the CSV file")
+            prices[stock] = df
+        except Exception as e:
+            failures[stock] = str(e)
+
+    frames = {}
+    try:
+        indicators = feature_store.update_features_many(prices)
+    except Exception as e:
+        indicators = {}
+        for stock in prices:
+            failures[stock] = str(e)
+    for stock, df in prices.items():
+        if stock in indicators:
+            try:
+                frames[stock] = _feature_frame(df, indicators[stock])
+            except Exception as e:
+                failures[stock] = str(e)
+
+    def run(stock):
+        predict_df = _predict_range(stock, frames[stock], start_date, end_date)
+        return pd.DataFrame({
+            'Stock': stock,
+            'Date': predict_df['Date'].to_numpy(),
+            'Actual': predict_df['Close'].to_numpy(),
+            'Predicted': predict_df['Predicted_Close'].to_numpy(),
+        })
+
+    results = []
+    if frames:
+        workers = max_workers or min(len(frames), 8)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {stock: executor.submit(run, stock) for stock in frames}
+            for stock, future in futures.items():
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    failures[stock] = str(e)
+
+    columns = ['Stock', 'Date', 'Actual', 'Predicted', 'Error']
+    if not results:
+        return pd.DataFrame(columns=columns), failures
+    result = pd.concat(results, ignore_index=True)
+    result['Error'] = result['Predicted'] - result['Actual']
+    return result[columns], failures
@@ -0,0 +1,213 @@
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+NEWS_API_KEY = os.getenv("NEWS_API_KEY", "10918c1fb6964375be2d936bdea986a5")  # Set your API key as environment variable
+NEWS_ENDPOINT = "https://newsapi.org/v2/everything"
+MAX_PAGE_SIZE = 100  # NewsAPI's per-request maximum
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class NewsAPIError(Exception):
+    """Raised when NewsAPI answers with an error status."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ArticleList(list):
+    """
+    Articles returned for one query, with the total NewsAPI reported for it.
+    
+    Args:
+        articles (list): Article dicts
+        total_results (int): ``totalResults`` of the query (default: the
+            number of articles)
+    """
+
+    def __init__(self, articles=(), total_results=None):
+        super().__init__(articles)
+        self.total_results = len(self) if total_results is None else total_results
+
+    @property
+    def truncated(self):
+        """True when the article budget cut the query's results short."""
+        return self.total_results > len(self)
+
+
+def end_of_day(day):
+    """Format a day as the inclusive ``to`` bound of a NewsAPI query."""
+    # A date-only bound can stop at the start of that day
+    return day.strftime("%Y-%m-%d") + "T23:59:59"
+
+
+def make_session(pool_size=10):
+    """
+    Create a keep-alive ``requests.Session`` with a bounded connection pool.
+    
+    Retries are handled by ``NewsClient`` itself so that backoff also covers
+    HTTP 429/5xx responses, not just connection errors.
+    
+    Args:
+        pool_size (int): Maximum connections kept open per host
+    
+    Returns:
+        requests.Session: The configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class NewsClient:
+    """
+    NewsAPI ``/v2/everything`` client with pooling, backoff and pagination.
+    
+    Requests go through ``transport``, anything with a ``requests``-style
+    ``get(url, params=..., timeout=...)`` returning an object with
+    ``status_code``, ``headers`` and ``json()``. By default this is a pooled
+    ``requests.Session``; tests pass a fake transport or point ``endpoint``
+    at a local fake server.
+    
+    Args:
+        api_key (str): NewsAPI key
+        endpoint (str): URL of the everything endpoint
+        transport: Object used to send GET requests
+        pool_size (int): Connection pool size for the default session
+        max_articles (int): Article budget per query across all pages, or
+            None for no budget
+        page_size (int): Articles requested per page (at most 100)
+        max_workers (int): Pages fetched concurrently after the first
+        max_retries (int): Retries on 429/5xx and connection errors
+        backoff (float): Base delay in seconds, doubled on each retry
+        max_backoff (float): Upper bound on a single delay
+        timeout (float): Per-request timeout in seconds
+        sleep (callable): Used to wait between retries
+    """
+
+    def __init__(self, api_key=NEWS_API_KEY, endpoint=NEWS_ENDPOINT, transport=None, pool_size=10,
+                 max_articles=100, page_size=MAX_PAGE_SIZE, max_workers=4, max_retries=4,
+                 backoff=0.5, max_backoff=8.0, timeout=10, sleep=time.sleep):
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.transport = transport if transport is not None else make_session(pool_size)
+        if max_articles is not None and max_articles < 1:
+            raise ValueError(f"max_articles must be at least 1, got {max_articles}")
+        self.max_articles = max_articles
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+
+    def _delay(self, attempt, response=None):
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return min(self.backoff * (2 ** attempt), self.max_backoff)
+
+    def get_page(self, params, page=1):
+        """
+        Fetch one page, retrying 429/5xx responses and connection errors.
+        
+        Args:
+            params (dict): Query parameters without page/apiKey
+            page (int): 1-based page number
+        
+        Returns:
+            dict: Decoded JSON response
+        """
+        params = dict(params, page=page, pageSize=params.get("pageSize", self.page_size), apiKey=self.api_key)
+        for attempt in range(self.max_retries + 1):
+            with self._lock:
+                self.requests += 1
+            try:
+                response = self.transport.get(self.endpoint, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                self._retry(attempt)
+                continue
+
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                self._retry(attempt, response)
+                continue
+            try:
+                message = response.json().get("message", "Unknown error")
+            except ValueError:
+                message = f"HTTP {response.status_code}"
+            raise NewsAPIError(message, response.status_code)
+
+    def _retry(self, attempt, response=None):
+        with self._lock:
+            self.retries += 1
+        self.sleep(self._delay(attempt, response))
+
+    def everything(self, query, start_date, end_date, sort_by="relevancy", language="en", max_articles=None):
+        """
+        Fetch articles for a query, following pagination up to the budget.
+        
+        The first page reports ``totalResults``; the remaining pages within
+        the article budget are then fetched concurrently.
+        
+        Args:
+            query (str): Search query
+            start_date (date): Start date
+            end_date (date): End date
+            sort_by (str): NewsAPI sort order
+            language (str): Article language
+            max_articles (int): Overrides the client's article budget (at least 1)
+        
+        Returns:
+            ArticleList: Article dicts in page order; ``truncated`` tells
+                         whether the budget left results out
+        """
+        budget = self.max_articles if max_articles is None else max_articles
+        if budget is not None and budget < 1:
+            raise ValueError(f"max_articles must be at least 1, got {budget}")
+        page_size = self.page_size if budget is None else min(self.page_size, budget)
+        params = {
+            "q": query,
+            "from": start_date.strftime("%Y-%m-%d"),
+            "to": end_of_day(end_date),
+            "sortBy": sort_by,
+            "language": language,
+            "pageSize": page_size,
+        }
+
+        first = self.get_page(params, 1)
+        articles = list(first.get("articles", []))
+        total_results = first.get("totalResults", len(articles))
+        total = total_results if budget is None else min(total_results, budget)
+        pages = math.ceil(total / page_size)
+
+        if pages > 1:
+            workers = max(1, min(self.max_workers, pages - 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(lambda page: self.get_page(params, page), range(2, pages + 1)):
+                    articles.extend(result.get("articles", []))
+        return ArticleList(articles[:budget], total_results)
+
+    def stats(self):
+        """Return request and retry counts."""
+        with self._lock:
+            return {"requests": self.requests, "retries": self.retries}
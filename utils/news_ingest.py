@@ -0,0 +1,240 @@
+import asyncio
+import math
+import time
+from datetime import timedelta
+
+from utils.news_client import (MAX_PAGE_SIZE, NEWS_API_KEY, NEWS_ENDPOINT, RETRY_STATUSES, ArticleList,
+                               NewsAPIError, end_of_day)
+from utils.sentiment_cache import articles_by_day, as_date
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+    
+    Args:
+        rate (float): Tokens added per second
+        capacity (float): Maximum burst size
+        clock (callable): Monotonic clock
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncNewsIngestor:
+    """
+    Fetch NewsAPI articles for many tickers concurrently.
+    
+    Requests share one aiohttp session, are bounded by a semaphore and paced
+    by a token bucket so a run stays within NewsAPI's quota. Articles are
+    deduplicated by URL across tickers and written per (ticker, day) to the
+    ``ArticleStore`` that ``analyze_sentiment`` reads through its cache.
+    
+    A query that NewsAPI reports more results for than ``max_articles`` is
+    split in halves and refetched, down to single days. Days that still do
+    not fit are stored as incomplete so the cache refetches them later.
+    
+    Args:
+        store (ArticleStore): Destination store, or None to only return results
+        api_key (str): NewsAPI key
+        endpoint (str): URL of the everything endpoint
+        concurrency (int): Maximum requests in flight
+        rate (float): Requests per second allowed by the token bucket
+        burst (int): Token-bucket capacity
+        max_articles (int): Article budget per query
+        page_size (int): Articles requested per page
+        max_retries (int): Retries on 429/5xx and connection errors
+        backoff (float): Base retry delay in seconds, doubled on each retry
+        max_backoff (float): Upper bound on any single retry delay
+        timeout (float): Per-request timeout in seconds
+    """
+
+    def __init__(self, store=None, api_key=NEWS_API_KEY, endpoint=NEWS_ENDPOINT, concurrency=8, rate=5.0,
+                 burst=5, max_articles=100, page_size=MAX_PAGE_SIZE, max_retries=4, backoff=0.5,
+                 max_backoff=8.0, timeout=10):
+        self.store = store
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.max_articles = max_articles
+        self.page_size = min(page_size, max_articles, MAX_PAGE_SIZE)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.requests = 0
+        self.retries = 0
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return min(self.backoff * (2 ** attempt), self.max_backoff)
+
+    async def _get_page(self, session, semaphore, bucket, params, page):
+        import aiohttp
+
+        params = dict(params, page=page, apiKey=self.api_key)
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            async with semaphore:
+                self.requests += 1
+                try:
+                    async with session.get(self.endpoint, params=params) as response:
+                        status = response.status
+                        body = await response.json(content_type=None)
+                        retry_after = response.headers.get("Retry-After")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == self.max_retries:
+                        raise
+                    status, body, retry_after = None, None, None
+
+            if status == 200:
+                return body
+            if (status is None or status in RETRY_STATUSES) and attempt < self.max_retries:
+                self.retries += 1
+                await asyncio.sleep(self._delay(attempt, retry_after))
+                continue
+            raise NewsAPIError((body or {}).get("message", f"HTTP {status}"), status)
+
+    async def _fetch_ticker(self, session, semaphore, bucket, ticker, start_date, end_date):
+        params = {
+            "q": f"{ticker} stock",
+            "from": start_date.strftime("%Y-%m-%d"),
+            "to": end_of_day(end_date),
+            "sortBy": "relevancy",
+            "language": "en",
+            "pageSize": self.page_size,
+        }
+        first = await self._get_page(session, semaphore, bucket, params, 1)
+        articles = list(first.get("articles", []))
+        total_results = first.get("totalResults", len(articles))
+        total = min(total_results, self.max_articles)
+        pages = math.ceil(total / self.page_size)
+        if pages > 1:
+            rest = await asyncio.gather(*(
+                self._get_page(session, semaphore, bucket, params, page) for page in range(2, pages + 1)
+            ))
+            for body in rest:
+                articles.extend(body.get("articles", []))
+        return ArticleList(articles[:self.max_articles], total_results)
+
+    async def _fetch_range(self, session, semaphore, bucket, ticker, start_date, end_date):
+        """
+        Fetch a ticker's range, splitting it while the article budget cuts results short.
+        
+        Returns:
+            list: (start, end, articles, complete) per fetched part
+        """
+        articles = await self._fetch_ticker(session, semaphore, bucket, ticker, start_date, end_date)
+        if not articles.truncated:
+            return [(start_date, end_date, articles, True)]
+        if start_date == end_date:
+            return [(start_date, end_date, articles, False)]
+        middle = start_date + timedelta(days=(end_date - start_date).days // 2)
+        halves = await asyncio.gather(
+            self._fetch_range(session, semaphore, bucket, ticker, start_date, middle),
+            self._fetch_range(session, semaphore, bucket, ticker, middle + timedelta(days=1), end_date),
+        )
+        return halves[0] + halves[1]
+
+    async def ingest(self, tickers, start_date, end_date):
+        """
+        Fetch and store news for every ticker.
+        
+        Args:
+            tickers (list): Stock symbols
+            start_date (date): First day of the range
+            end_date (date): Last day of the range
+        
+        Returns:
+            dict: ``articles`` (ticker -> deduplicated article list), ``errors``
+                  (ticker -> message), ``unique_urls``, ``requests``, ``retries``
+                  and ``elapsed`` seconds
+        """
+        import aiohttp
+
+        start_time = time.perf_counter()
+        start, end = as_date(start_date), as_date(end_date)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        bucket = TokenBucket(self.rate, self.burst)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._fetch_range(session, semaphore, bucket, ticker, start, end) for ticker in tickers),
+                return_exceptions=True,
+            )
+
+        fetched_at = time.time()
+        by_ticker, errors, seen = {}, {}, {}
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, Exception):
+                errors[ticker] = str(result)
+                continue
+            unique, urls, parts = [], set(), []
+            for part_start, part_end, articles, complete in result:
+                part = []
+                for article in articles:
+                    url = article.get("url")
+                    if url in urls:
+                        continue
+                    urls.add(url)
+                    # Tickers sharing a story reference a single payload
+                    part.append(seen.setdefault(url, article) if url else article)
+                unique.extend(part)
+                parts.append((part_start, part_end, part, complete))
+            by_ticker[ticker] = unique
+            if self.store is not None:
+                self._store(ticker, parts, fetched_at)
+
+        return {
+            "articles": by_ticker,
+            "errors": errors,
+            "unique_urls": len(seen),
+            "requests": self.requests,
+            "retries": self.retries,
+            "elapsed": time.perf_counter() - start_time,
+        }
+
+    def _store(self, ticker, parts, fetched_at):
+        for start, end, articles, complete in parts:
+            self.store.put_days(ticker, articles_by_day(articles, start, end), fetched_at, complete)
+
+
+def ingest_news(tickers, start_date, end_date, **kwargs):
+    """
+    Run ``AsyncNewsIngestor.ingest`` from synchronous code.
+    
+    Args:
+        tickers (list): Stock symbols
+        start_date (date): First day of the range
+        end_date (date): Last day of the range
+        **kwargs: Passed to ``AsyncNewsIngestor``
+    
+    Returns:
+        dict: The ingest summary
+    """
+    return asyncio.run(AsyncNewsIngestor(**kwargs).ingest(tickers, start_date, end_date))
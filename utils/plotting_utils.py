@@ -1,13 +1,141 @@
+import os
+
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
-def plot_candlestick(df):
+# Points per trace sent to the browser; longer series are downsampled
+MAX_PLOT_POINTS = int(os.getenv("PLOT_MAX_POINTS", "2000"))
+# Traces with more points than this are drawn with WebGL (Scattergl)
+WEBGL_MIN_POINTS = int(os.getenv("PLOT_WEBGL_MIN_POINTS", "1000"))
+
+def lttb_indices(x, y, n_out):
+    """
+    Pick ``n_out`` points of a series with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept. The points between them are
+    split into ``n_out - 2`` buckets, and each bucket keeps the point
+    forming the largest triangle with the point kept from the previous
+    bucket and the mean of the next bucket. Peaks and troughs therefore
+    survive, where evenly spaced thinning would skip them.
+    
+    Args:
+        x (array-like): Sorted x values (numbers or datetimes)
+        y (array-like): Finite y values
+        n_out (int): Points to keep, at least 3
+    
+    Returns:
+        ndarray: Sorted positions of the kept points
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        raise ValueError("LTTB needs at least 3 output points")
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[ns]").astype(np.int64)
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket edges over the points between the first and the last; every
+    # bucket holds at least one point because n > n_out
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    # Mean point of every bucket; the one after the last bucket is the last point
+    mean_x = np.append(np.add.reduceat(x[:edges[-1]], edges[:-1]) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:edges[-1]], edges[:-1]) / counts, y[-1])
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    if n < 16 * n_out:
+        # Small buckets: a plain loop beats the per-call overhead of NumPy
+        xs, ys, bounds = x.tolist(), y.tolist(), edges.tolist()
+        mean_x, mean_y = mean_x.tolist(), mean_y.tolist()
+        for i in range(n_out - 2):
+            xa, ya = xs[a], ys[a]
+            dx, dy = xa - mean_x[i + 1], mean_y[i + 1] - ya
+            best = -1.0
+            for j in range(bounds[i], bounds[i + 1]):
+                area = abs(dx * (ys[j] - ya) - (xa - xs[j]) * dy)
+                if area > best:
+                    best, a = area, j
+            indices[i + 1] = a
+        return indices
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - mean_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+def downsample(df, max_points=MAX_PLOT_POINTS, y=None):
+    """
+    Thin a date-sorted frame to at most ``max_points`` rows.
+    
+    Args:
+        df (DataFrame): Rows to plot, with a Date column
+        max_points (int): Maximum rows to keep (the first and last are kept)
+        y (str): Column the rows are chosen for with LTTB; without it the
+                 rows are evenly spaced
+    
+    Returns:
+        DataFrame: ``df`` itself when it is short enough, else a subset of its rows
+    """
+    if max_points is None or len(df) <= max_points:
+        return df
+    if y is not None:
+        return df.iloc[lttb_indices(df['Date'].to_numpy(), df[y].to_numpy(), max_points)]
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+    positions = np.linspace(0, len(df) - 1, max_points).round().astype(int)
+    return df.iloc[np.unique(positions)]
+
+def resample_ohlc(df, max_bars=MAX_PLOT_POINTS):
+    """
+    Merge consecutive bars so that at most ``max_bars`` remain.
+    
+    Each merged bar takes the first Date and Open, the highest High, the
+    lowest Low and the last Close of the bars it covers.
+    
+    Args:
+        df (DataFrame): Date-sorted frame with Date, Open, High, Low, Close columns
+        max_bars (int): Maximum bars to keep
+    
+    Returns:
+        DataFrame: ``df`` itself when it is short enough, else the merged bars
+    """
+    n = len(df)
+    if max_bars is None or n <= max_bars:
+        return df
+    starts = np.unique(np.arange(max_bars) * n // max_bars)
+    ends = np.append(starts[1:], n) - 1
+    return pd.DataFrame({
+        'Date': df['Date'].to_numpy()[starts],
+        'Open': df['Open'].to_numpy()[starts],
+        'High': np.maximum.reduceat(df['High'].to_numpy(), starts),
+        'Low': np.minimum.reduceat(df['Low'].to_numpy(), starts),
+        'Close': df['Close'].to_numpy()[ends],
+    })
+
+def _scatter(points, **kwargs):
+    """Scatter trace, drawn with WebGL and without markers for long series."""
+    if points > WEBGL_MIN_POINTS:
+        if kwargs.get('mode') == 'lines+markers':
+            kwargs['mode'] = 'lines'
+        return go.Scattergl(**kwargs)
+    return go.Scatter(**kwargs)
+
+def plot_candlestick(df, max_points=MAX_PLOT_POINTS):
     """
     Create a line plot comparing predicted vs actual close prices.
     
     Args:
         df (DataFrame): DataFrame with Date, Close_Actual, Close_Predicted columns
+        max_points (int): Points per line at most (LTTB, see downsample),
+                          or None for all
     
     Returns:
         plotly.graph_objects.Figure: The line chart
@@ -31,12 +159,16 @@ def plot_candlestick(df):
         fig.update_layout(title='Price Prediction vs Actual')
         return fig
     
+    # Rows are picked on the actual prices and shared by both lines, so the
+    # unified hover shows actual and predicted for the same day
+    actual = predicted = downsample(df, max_points, y='Close_Actual')
     fig = go.Figure()
     
     # Add actual price line
-    fig.add_trace(go.Scatter(
-        x=df['Date'],
-        y=df['Close_Actual'],
+    fig.add_trace(_scatter(
+        len(actual),
+        x=actual['Date'],
+        y=actual['Close_Actual'],
         mode='lines+markers',
         name='Actual Price',
         line=dict(color='blue', width=2),
@@ -44,9 +176,10 @@ def plot_candlestick(df):
     ))
     
     # Add predicted price line
-    fig.add_trace(go.Scatter(
-        x=df['Date'],
-        y=df['Close_Predicted'],
+    fig.add_trace(_scatter(
+        len(predicted),
+        x=predicted['Date'],
+        y=predicted['Close_Predicted'],
         mode='lines+markers',
         name='Predicted Price',
         line=dict(color='red', width=2, dash='dash'),
@@ -70,12 +203,76 @@ def plot_candlestick(df):
     
     return fig
 
-def plot_sentiment(df):
+def plot_ohlc(df, max_points=MAX_PLOT_POINTS):
+    """
+    Create a candlestick chart of the stored bars, with the predicted close.
+    
+    Args:
+        df (DataFrame): DataFrame with Date, Open, High, Low, Close_Actual and
+                        optionally Close_Predicted columns
+        max_points (int): Candles (see resample_ohlc) and predicted points
+                          plotted at most, or None for all
+    
+    Returns:
+        plotly.graph_objects.Figure: The candlestick chart
+    """
+    required_cols = ['Date', 'Open', 'High', 'Low', 'Close_Actual']
+    missing_cols = [col for col in required_cols if col not in df.columns]
+    if df.empty or missing_cols:
+        fig = go.Figure()
+        text = "No data available" if df.empty else f"Missing columns: {', '.join(missing_cols)}"
+        fig.add_annotation(text=text, xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        fig.update_layout(title='Price Prediction vs Actual')
+        return fig
+
+    bars = resample_ohlc(df[required_cols].rename(columns={'Close_Actual': 'Close'}), max_points)
+    fig = go.Figure()
+    fig.add_trace(go.Candlestick(
+        x=bars['Date'],
+        open=bars['Open'],
+        high=bars['High'],
+        low=bars['Low'],
+        close=bars['Close'],
+        name='Actual Price'
+    ))
+
+    if 'Close_Predicted' in df.columns:
+        predicted = downsample(df, max_points, y='Close_Predicted')
+        fig.add_trace(_scatter(
+            len(predicted),
+            x=predicted['Date'],
+            y=predicted['Close_Predicted'],
+            mode='lines',
+            name='Predicted Price',
+            line=dict(color='red', width=2, dash='dash')
+        ))
+
+    fig.update_layout(
+        title='Stock Price Prediction vs Actual',
+        xaxis_title='Date',
+        yaxis_title='Price (₹)',
+        template='plotly_white',
+        hovermode='x unified',
+        xaxis_rangeslider_visible=False,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+
+    return fig
+
+def plot_sentiment(df, max_points=MAX_PLOT_POINTS):
     """
     Create a sentiment timeline plot using Plotly.
     
     Args:
         df (DataFrame): DataFrame with Date, Sentiment, and Score columns
+        max_points (int): Days plotted per sentiment at most (LTTB over the
+                          daily counts), or None for all
     
     Returns:
         plotly.graph_objects.Figure: The sentiment timeline plot
@@ -106,11 +303,14 @@ def plot_sentiment(df):
     for sentiment in ['POSITIVE', 'NEGATIVE', 'NEUTRAL']:
         sentiment_data = sentiment_counts[sentiment_counts['Sentiment'] == sentiment]
         if not sentiment_data.empty:
-            fig.add_trace(go.Scatter(
+            total = sentiment_data["Count"].sum()
+            sentiment_data = downsample(sentiment_data, max_points, y='Count')
+            fig.add_trace(_scatter(
+                len(sentiment_data),
                 x=sentiment_data['Date'],
                 y=sentiment_data['Count'],
                 mode='markers',
-                name=f'{sentiment} ({sentiment_data["Count"].sum()} total)',
+                name=f'{sentiment} ({total} total)',
                 marker=dict(
                     color=color_map[sentiment],
                     size=12,
@@ -149,4 +349,78 @@ def plot_sentiment(df):
         ]
     )
     
-    return fig
\ No newline at end of file
+    return fig
+
+def plot_forecast(forecast_df, actual_df):
+    """
+    Create a plot of recent closes followed by the forecast and its interval.
+    
+    Args:
+        forecast_df (DataFrame): DataFrame with Date, Close, Lower, Upper columns
+        actual_df (DataFrame): DataFrame with Date, Close columns
+    
+    Returns:
+        plotly.graph_objects.Figure: The forecast chart
+    """
+    if forecast_df.empty:
+        fig = go.Figure()
+        fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        fig.update_layout(title='Price Forecast')
+        return fig
+
+    fig = go.Figure()
+
+    # Interval band: upper edge, then lower edge filled up to it
+    fig.add_trace(go.Scatter(
+        x=forecast_df['Date'],
+        y=forecast_df['Upper'],
+        mode='lines',
+        line=dict(width=0),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast_df['Date'],
+        y=forecast_df['Lower'],
+        mode='lines',
+        line=dict(width=0),
+        fill='tonexty',
+        fillcolor='rgba(255, 0, 0, 0.15)',
+        name='Forecast Interval',
+        hoverinfo='skip'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=actual_df['Date'],
+        y=actual_df['Close'],
+        mode='lines+markers',
+        name='Actual Price',
+        line=dict(color='blue', width=2),
+        marker=dict(size=6)
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=forecast_df['Date'],
+        y=forecast_df['Close'],
+        mode='lines+markers',
+        name='Forecast',
+        line=dict(color='red', width=2, dash='dash'),
+        marker=dict(size=6, symbol='diamond')
+    ))
+
+    fig.update_layout(
+        title='Stock Price Forecast',
+        xaxis_title='Date',
+        yaxis_title='Price (₹)',
+        template='plotly_white',
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+
+    return fig
@@ -0,0 +1,186 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from utils.instrumentation import span
+
+DATA_DIR = "data"
+STORE_DIR = os.path.join(DATA_DIR, "store")
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+STORE_VERSION = 1
+
+
+def csv_path(stock, data_dir=DATA_DIR):
+    """Return the path of the raw CSV for a stock."""
+    return os.path.join(data_dir, f"{stock.lower()}.csv")
+
+
+def store_path(stock, store_dir=STORE_DIR):
+    """Return the directory holding the columnar store for a stock."""
+    return os.path.join(store_dir, stock.lower())
+
+
+def read_price_csv(path):
+    """
+    Parse a yfinance CSV into a clean, typed frame sorted by date.
+    
+    yfinance writes one or two junk header rows (``,RELIANCE.NS,...`` and
+    sometimes ``Date,,,``) below the real header; these are dropped by the
+    numeric coercion. Newer files label the date column ``Price``.
+    
+    Args:
+        path (str): Path to the CSV file
+    
+    Returns:
+        DataFrame: Date plus the OHLCV columns, sorted by Date
+    """
+    with span("csv_read"):
+        df = pd.read_csv(path)
+    if 'Date' not in df.columns:
+        df = df.rename(columns={df.columns[0]: 'Date'})
+
+    with span("coerce"):
+        for col in PRICE_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+            else:
+                df[col] = np.nan
+
+        df['Date'] = pd.to_datetime(df['Date'], errors='coerce', format='ISO8601')
+        df = df.dropna(subset=['Date'] + PRICE_COLUMNS)
+        df['Date'] = df['Date'].astype('datetime64[ns]')
+        df = df.sort_values('Date', kind='stable').reset_index(drop=True)
+    return df[['Date'] + PRICE_COLUMNS]
+
+
+def _source_signature(path):
+    st = os.stat(path)
+    return {"source_mtime_ns": st.st_mtime_ns, "source_size": st.st_size}
+
+
+def write_store(df, path, source=None):
+    """
+    Write a price frame as one ``.npy`` file per column plus ``meta.json``.
+    
+    The directory is built next to the target and swapped in with a rename so
+    readers never see a half-written store.
+    
+    Args:
+        df (DataFrame): Frame with a Date column, sorted by Date
+        path (str): Store directory to create or replace
+        source (str): CSV the frame was built from, recorded for staleness checks
+    """
+    parent = os.path.dirname(path) or "."
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    columns = [col for col in df.columns if col != 'Date']
+    np.save(os.path.join(tmp_path, "Date.npy"), df['Date'].to_numpy(dtype="datetime64[ns]"))
+    for col in columns:
+        np.save(os.path.join(tmp_path, f"{col}.npy"), df[col].to_numpy(dtype=np.float64))
+
+    meta = {"version": STORE_VERSION, "rows": int(len(df)), "columns": columns}
+    if source is not None:
+        meta["source"] = os.path.abspath(source)
+        meta.update(_source_signature(source))
+    with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+    old_path = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.rename(path, old_path)
+    os.rename(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def ingest_csv(stock, data_dir=DATA_DIR, store_dir=STORE_DIR):
+    """
+    Convert a stock's CSV into the columnar store.
+    
+    Args:
+        stock (str): Stock symbol
+        data_dir (str): Directory holding the raw CSVs
+        store_dir (str): Directory holding the columnar stores
+    
+    Returns:
+        DataFrame: The cleaned frame that was written
+    """
+    source = csv_path(stock, data_dir)
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Data file not found: {source}")
+    df = read_price_csv(source)
+    write_store(df, store_path(stock, store_dir), source=source)
+    return df
+
+
+def read_meta(stock, store_dir=STORE_DIR):
+    """Return the store metadata for a stock, or None if there is no store."""
+    meta_path = os.path.join(store_path(stock, store_dir), "meta.json")
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(stock, data_dir=DATA_DIR, store_dir=STORE_DIR):
+    """
+    Check whether the store exists and was built from the current CSV.
+    
+    Returns:
+        bool: True if the store can be used instead of the CSV
+    """
+    meta = read_meta(stock, store_dir)
+    if meta is None or meta.get("version") != STORE_VERSION:
+        return False
+    source = csv_path(stock, data_dir)
+    if not os.path.exists(source):
+        # Store without a CSV (e.g. a deployment that ships only the store)
+        return True
+    signature = _source_signature(source)
+    return all(meta.get(key) == value for key, value in signature.items())
+
+
+def load_store(stock, columns=None, start=None, end=None, store_dir=STORE_DIR, mmap=True):
+    """
+    Load selected columns from the store, optionally restricted to a date range.
+    
+    Only the requested column files are opened. With ``mmap`` the arrays are
+    memory-mapped read-only and the date range is located with a binary search
+    over the sorted Date column, so only the requested rows are paged in.
+    
+    Args:
+        stock (str): Stock symbol
+        columns (list): Columns to load (default: all stored columns)
+        start (date): First date to include, or None
+        end (date): Last date to include, or None
+        store_dir (str): Directory holding the columnar stores
+        mmap (bool): Memory-map the column files instead of reading them
+    
+    Returns:
+        DataFrame: Date plus the requested columns
+    """
+    path = store_path(stock, store_dir)
+    meta = read_meta(stock, store_dir)
+    if meta is None:
+        raise FileNotFoundError(f"Price store not found: {path}")
+    if columns is None:
+        columns = meta["columns"]
+    missing = [col for col in columns if col not in meta["columns"]]
+    if missing:
+        raise ValueError(f"Columns not in store: {missing}")
+
+    mmap_mode = "r" if mmap else None
+    dates = np.load(os.path.join(path, "Date.npy"), mmap_mode=mmap_mode)
+    lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "ns"), side="left"))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "ns"), side="right"))
+
+    data = {'Date': np.asarray(dates[lo:hi])}
+    for col in columns:
+        data[col] = np.asarray(np.load(os.path.join(path, f"{col}.npy"), mmap_mode=mmap_mode)[lo:hi])
+    return pd.DataFrame(data)
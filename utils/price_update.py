@@ -0,0 +1,182 @@
+"""
+Incremental OHLCV refresh for the CSVs in data/.
+
+Each CSV is read for its last stored date and only the missing bars are
+fetched, with one multi-ticker download for all stocks. New rows are
+appended by writing a temp file next to the CSV and renaming it over the
+original, so readers never see a partial file. The spurious yfinance ticker
+header rows are dropped on the way.
+"""
+import os
+from datetime import date, timedelta
+
+import pandas as pd
+
+from utils.price_store import DATA_DIR, csv_path
+from utils.stocks import STOCK_LIST, YF_TICKERS
+
+DEFAULT_START = "2024-01-01"
+CSV_COLUMNS = ['Date', 'Close', 'High', 'Low', 'Open', 'Volume']
+
+
+def yf_download(tickers, start, end):
+    """
+    Download daily bars for several tickers with one yfinance call.
+    
+    Args:
+        tickers (list): Yahoo Finance tickers
+        start (date): First date to fetch
+        end (date): Day after the last date to fetch (exclusive)
+    
+    Returns:
+        DataFrame: yfinance frame with (ticker, field) columns
+    """
+    import yfinance as yf
+
+    return yf.download(tickers, start=str(start), end=str(end), group_by="ticker", progress=False, threads=True)
+
+
+def read_bars(path):
+    """
+    Read a price CSV as text, keeping only rows with a valid date.
+    
+    Values are kept as the exact strings in the file so rewriting it does not
+    change existing rows.
+    
+    Args:
+        path (str): Path to the CSV file
+    
+    Returns:
+        DataFrame: String columns, Date first
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=CSV_COLUMNS, dtype=object)
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    if 'Date' not in df.columns:
+        df = df.rename(columns={df.columns[0]: 'Date'})
+    dates = pd.to_datetime(df['Date'], errors='coerce', format='ISO8601')
+    return df[dates.notna()].reset_index(drop=True)
+
+
+def last_stored_date(path):
+    """Return the last date in a price CSV, or None if it has no bars."""
+    bars = read_bars(path)
+    if bars.empty:
+        return None
+    return pd.to_datetime(bars['Date'], format='ISO8601').max().date()
+
+
+def ticker_frame(downloaded, ticker):
+    """
+    Extract one ticker's bars from a multi-ticker download.
+    
+    Handles both yfinance column layouts, (ticker, field) and (field, ticker),
+    as well as the flat columns of a single-ticker download.
+    
+    Returns:
+        DataFrame: Date plus the OHLCV columns, rows without a close dropped
+    """
+    df = downloaded
+    if isinstance(df.columns, pd.MultiIndex):
+        if ticker in df.columns.get_level_values(0):
+            df = df[ticker]
+        elif ticker in df.columns.get_level_values(-1):
+            df = df.xs(ticker, axis=1, level=-1)
+        else:
+            return pd.DataFrame(columns=CSV_COLUMNS)
+    df = df.reset_index()
+    if 'Date' not in df.columns:
+        df = df.rename(columns={df.columns[0]: 'Date'})
+    df = df.dropna(subset=['Close'])
+    df['Date'] = pd.to_datetime(df['Date']).dt.tz_localize(None)
+    return df
+
+
+def _format_rows(df, columns):
+    rows = pd.DataFrame({'Date': df['Date'].dt.strftime('%Y-%m-%d')})
+    for col in columns[1:]:
+        if col not in df.columns:
+            rows[col] = ""
+        elif col == 'Volume':
+            rows[col] = [str(int(v)) for v in df[col]]
+        else:
+            rows[col] = [repr(float(v)) for v in df[col]]
+    return rows
+
+
+def append_bars(path, new_bars):
+    """
+    Append bars newer than the last stored date, atomically.
+    
+    The cleaned file (junk header rows dropped) plus the new rows is written
+    to ``<path>.tmp-<pid>`` and renamed over the original.
+    
+    Args:
+        path (str): Path to the CSV file
+        new_bars (DataFrame): Bars from ``ticker_frame``
+    
+    Returns:
+        int: Number of rows appended
+    """
+    existing = read_bars(path)
+    if not existing.empty:
+        last = pd.to_datetime(existing['Date'], format='ISO8601').max()
+        new_bars = new_bars[new_bars['Date'] > last]
+    if new_bars.empty:
+        return 0
+    columns = list(existing.columns) if len(existing.columns) else CSV_COLUMNS
+    rows = _format_rows(new_bars.sort_values('Date'), columns)
+
+    combined = pd.concat([existing, rows], ignore_index=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        combined.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(rows)
+
+
+def refresh_prices(stocks=None, end=None, data_dir=DATA_DIR, download=yf_download, default_start=DEFAULT_START):
+    """
+    Bring the price CSVs up to date with one download for all stale stocks.
+    
+    Args:
+        stocks (list): Stock symbols (default: STOCK_LIST)
+        end (date): Last date to fetch (default: today)
+        data_dir (str): Directory holding the CSVs
+        download (callable): ``download(tickers, start, end)`` returning a
+            yfinance-shaped frame; ``end`` is exclusive
+        default_start (str): First date for stocks with no stored bars
+    
+    Returns:
+        dict: Rows appended per stock
+    """
+    stocks = list(stocks or STOCK_LIST)
+    end = pd.Timestamp(end or date.today()).date()
+    os.makedirs(data_dir, exist_ok=True)
+
+    starts = {}
+    for stock in stocks:
+        last = last_stored_date(csv_path(stock, data_dir))
+        start = last + timedelta(days=1) if last else pd.Timestamp(default_start).date()
+        if start <= end:
+            starts[stock] = start
+    if not starts:
+        return {stock: 0 for stock in stocks}
+
+    tickers = [YF_TICKERS.get(stock.upper(), f"{stock.upper()}.NS") for stock in starts]
+    try:
+        downloaded = download(tickers, min(starts.values()), end + timedelta(days=1))
+    except Exception as e:
+        raise Exception(f"Error downloading prices: {str(e)}")
+
+    appended = {stock: 0 for stock in stocks}
+    for stock, ticker in zip(starts, tickers):
+        bars = ticker_frame(downloaded, ticker)
+        if bars.empty:
+            continue
+        bars = bars[bars['Date'].dt.date >= starts[stock]]
+        appended[stock] = append_bars(csv_path(stock, data_dir), bars)
+    return appended
@@ -0,0 +1,417 @@
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+NEWS_DB_PATH = os.getenv("NEWS_DB_PATH", os.path.join("data", "news.db"))
+
+
+def as_date(value):
+    """Coerce a date, datetime or ISO string to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+class ArticleStore:
+    """
+    SQLite store of raw NewsAPI article payloads per ticker and day.
+    
+    Articles are stored once per URL, so the same story fetched for several
+    tickers (or several overlapping ranges) is deduplicated. ``fetched_days``
+    records which (ticker, day) pairs have been queried, including days
+    that returned no articles, and whether the fetch returned all of the
+    day's articles or was cut short by the article budget.
+    
+    Args:
+        path (str): SQLite database file
+    """
+
+    def __init__(self, path=NEWS_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    published_at TEXT,
+                    payload TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS ticker_articles (
+                    ticker TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    PRIMARY KEY (ticker, day, url)
+                );
+                CREATE TABLE IF NOT EXISTS fetched_days (
+                    ticker TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    complete INTEGER NOT NULL DEFAULT 1,
+                    PRIMARY KEY (ticker, day)
+                );
+            """)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(fetched_days)")]
+            if "complete" not in columns:
+                # Stores created before truncated fetches were tracked
+                conn.execute("ALTER TABLE fetched_days ADD COLUMN complete INTEGER NOT NULL DEFAULT 1")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_day(self, ticker, day):
+        """
+        Return the cached articles for a ticker and day.
+        
+        Returns:
+            tuple: (list of article dicts, fetched_at timestamp, complete flag),
+                   or None if the day has never been fetched
+        """
+        ticker, day = ticker.upper(), as_date(day).isoformat()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT fetched_at, complete FROM fetched_days WHERE ticker = ? AND day = ?", (ticker, day)
+            ).fetchone()
+            if row is None:
+                return None
+            payloads = conn.execute(
+                "SELECT a.payload FROM ticker_articles t JOIN articles a ON a.url = t.url "
+                "WHERE t.ticker = ? AND t.day = ? ORDER BY t.position",
+                (ticker, day),
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in payloads], row[0], bool(row[1])
+
+    def put_day(self, ticker, day, articles, fetched_at, complete=True):
+        """
+        Replace the cached articles for a ticker and day.
+        
+        Args:
+            ticker (str): Stock symbol
+            day (date): Publication day
+            articles (list): Raw NewsAPI article dicts
+            fetched_at (float): Unix timestamp of the fetch
+            complete (bool): False if the fetch was cut short by the article budget
+        """
+        self.put_days(ticker, {day: articles}, fetched_at, complete)
+
+    def put_days(self, ticker, articles_by_day, fetched_at, complete=True):
+        """
+        Replace the cached articles for several days in one transaction.
+        
+        Args:
+            ticker (str): Stock symbol
+            articles_by_day (dict): Publication day -> raw NewsAPI article dicts
+            fetched_at (float): Unix timestamp of the fetch
+            complete (bool): False if the fetch was cut short by the article budget
+        """
+        ticker = ticker.upper()
+        with self._connect() as conn:
+            for day, articles in articles_by_day.items():
+                day = as_date(day).isoformat()
+                conn.execute("DELETE FROM ticker_articles WHERE ticker = ? AND day = ?", (ticker, day))
+                for position, article in enumerate(articles):
+                    url = article.get("url") or f"{ticker}:{day}:{position}"
+                    conn.execute(
+                        "INSERT OR REPLACE INTO articles (url, published_at, payload) VALUES (?, ?, ?)",
+                        (url, article.get("publishedAt", ""), json.dumps(article)),
+                    )
+                    conn.execute(
+                        "INSERT OR IGNORE INTO ticker_articles (ticker, day, url, position) VALUES (?, ?, ?, ?)",
+                        (ticker, day, url, position),
+                    )
+                conn.execute(
+                    "INSERT OR REPLACE INTO fetched_days (ticker, day, fetched_at, complete) VALUES (?, ?, ?, ?)",
+                    (ticker, day, fetched_at, int(complete)),
+                )
+
+    def get_ticker_days(self, ticker):
+        """
+        Return every cached day of a ticker with its articles.
+        
+        Days that were fetched but returned no articles are included with an
+        empty list; invalidated days are left out until they are refetched.
+        
+        Args:
+            ticker (str): Stock symbol
+        
+        Returns:
+            dict: Day (date) -> list of article dicts
+        """
+        ticker = ticker.upper()
+        with self._connect() as conn:
+            days = conn.execute("SELECT day FROM fetched_days WHERE ticker = ?", (ticker,)).fetchall()
+            rows = conn.execute(
+                "SELECT t.day, a.payload FROM ticker_articles t "
+                "JOIN fetched_days f ON f.ticker = t.ticker AND f.day = t.day "
+                "JOIN articles a ON a.url = t.url "
+                "WHERE t.ticker = ? ORDER BY t.day, t.position",
+                (ticker,),
+            ).fetchall()
+        by_day = {as_date(day): [] for (day,) in days}
+        for day, payload in rows:
+            by_day[as_date(day)].append(json.loads(payload))
+        return by_day
+
+    def invalidate(self, ticker=None):
+        """Forget fetched days for one ticker, or for all tickers."""
+        with self._connect() as conn:
+            if ticker is None:
+                conn.execute("DELETE FROM fetched_days")
+            else:
+                conn.execute("DELETE FROM fetched_days WHERE ticker = ?", (ticker.upper(),))
+
+
+class SentimentCache:
+    """
+    Two-tier cache of news articles per (ticker, day).
+    
+    Lookups go to an in-process LRU first and the SQLite ``ArticleStore``
+    second. Only days missing from both (or expired) are fetched, grouped
+    into contiguous spans so overlapping date ranges reuse cached days.
+    
+    A day's entry is final once it was fetched more than ``recent_days``
+    after the day itself; news fetched on the day expires after
+    ``today_ttl`` seconds and news for the last few days after
+    ``recent_ttl`` seconds, since late articles keep arriving.
+    
+    A fetch is cut short when NewsAPI reports more results than the article
+    budget returned (see ``news_client.ArticleList``). The span is then
+    split in halves and refetched until every part fits. A single day that
+    still does not fit is cached as incomplete and expires after
+    ``truncated_ttl`` seconds instead of becoming final.
+    
+    Args:
+        store (ArticleStore): Persistent tier, or None for memory only
+        open_store (callable): Returns the persistent tier on first use, in
+            place of ``store``; it may return None to stay memory only
+        max_entries (int): Maximum (ticker, day) entries kept in memory
+        today_ttl (float): Seconds before a same-day fetch expires
+        recent_ttl (float): Seconds before a fetch of a recent day expires
+        recent_days (int): Days after which a fetched day never expires
+        truncated_ttl (float): Seconds before an incomplete day expires
+        clock (callable): Returns the current Unix time
+    """
+
+    def __init__(self, store=None, max_entries=512, today_ttl=15 * 60, recent_ttl=6 * 3600,
+                 recent_days=1, truncated_ttl=6 * 3600, clock=time.time, open_store=None):
+        self._store = store
+        self._open_store = open_store
+        self._store_lock = threading.Lock()
+        self.max_entries = max_entries
+        self.today_ttl = today_ttl
+        self.recent_ttl = recent_ttl
+        self.recent_days = recent_days
+        self.truncated_ttl = truncated_ttl
+        self.clock = clock
+        self._memory = OrderedDict()  # (ticker, day) -> (articles, fetched_at, complete)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.fetches = 0
+
+    @property
+    def store(self):
+        """The persistent tier, opened by ``open_store`` on first access."""
+        if self._open_store is not None:
+            with self._store_lock:
+                if self._open_store is not None:
+                    self._store, self._open_store = self._open_store(), None
+        return self._store
+
+    def expires_at(self, day, fetched_at, complete=True):
+        """
+        Return when an entry fetched at ``fetched_at`` stops being fresh.
+        
+        Returns:
+            float: Unix timestamp, or None if the entry never expires
+        """
+        age_at_fetch = (datetime.fromtimestamp(fetched_at).date() - as_date(day)).days
+        if age_at_fetch > self.recent_days:
+            expires = None
+        elif age_at_fetch <= 0:
+            expires = fetched_at + self.today_ttl
+        else:
+            expires = fetched_at + self.recent_ttl
+        if not complete:
+            expires = min(expires or math.inf, fetched_at + self.truncated_ttl)
+        return expires
+
+    def _is_fresh(self, day, fetched_at, complete=True):
+        expires = self.expires_at(day, fetched_at, complete)
+        return expires is None or self.clock() < expires
+
+    def _remember(self, key, articles, fetched_at, complete=True):
+        with self._lock:
+            self._memory[key] = (articles, fetched_at, complete)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, ticker, day):
+        key = (ticker, day)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(day, entry[1], entry[2]):
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry[0]
+                del self._memory[key]
+                self.expired += 1
+
+        if self.store is not None:
+            entry = self.store.get_day(ticker, day)
+            if entry is not None:
+                if self._is_fresh(day, entry[1], entry[2]):
+                    with self._lock:
+                        self.disk_hits += 1
+                    self._remember(key, *entry)
+                    return entry[0]
+                with self._lock:
+                    self.expired += 1
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get_articles(self, ticker, start_date, end_date, fetch):
+        """
+        Return all articles for a ticker and date range, fetching missing days.
+        
+        Args:
+            ticker (str): Stock symbol
+            start_date (date): First day of the range
+            end_date (date): Last day of the range
+            fetch (callable): ``fetch(ticker, span_start, span_end)`` returning a
+                list of raw NewsAPI articles (an ``ArticleList`` reports
+                truncation); exceptions propagate to the caller
+        
+        Returns:
+            list: Article dicts ordered by day
+        """
+        ticker = ticker.upper()
+        start, end = as_date(start_date), as_date(end_date)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+        by_day = {}
+        missing = []
+        for day in days:
+            articles = self._lookup(ticker, day)
+            if articles is None:
+                missing.append(day)
+            else:
+                by_day[day] = articles
+
+        for span_start, span_end in _spans(missing):
+            for part_start, part_end, articles, complete, fetched_at in self._fetch_span(
+                    ticker, span_start, span_end, fetch):
+                span = articles_by_day(articles, part_start, part_end)
+                for day, day_articles in span.items():
+                    by_day[day] = day_articles
+                    self._remember((ticker, day), day_articles, fetched_at, complete)
+                if self.store is not None:
+                    self.store.put_days(ticker, span, fetched_at, complete)
+
+        return [article for day in days for article in by_day.get(day, [])]
+
+    def _fetch_span(self, ticker, span_start, span_end, fetch):
+        """
+        Fetch a span, splitting it while the article budget cuts results short.
+        
+        Returns:
+            list: (start, end, articles, complete, fetched_at) per fetched part
+        """
+        fetched_at = self.clock()
+        articles = fetch(ticker, span_start, span_end)
+        with self._lock:
+            self.fetches += 1
+        if not getattr(articles, "truncated", False):
+            return [(span_start, span_end, articles, True, fetched_at)]
+        if span_start == span_end:
+            return [(span_start, span_end, articles, False, fetched_at)]
+        middle = span_start + timedelta(days=(span_end - span_start).days // 2)
+        return (self._fetch_span(ticker, span_start, middle, fetch)
+                + self._fetch_span(ticker, middle + timedelta(days=1), span_end, fetch))
+
+    def invalidate(self, ticker=None):
+        """Drop cached days for one ticker, or everything, from both tiers."""
+        with self._lock:
+            if ticker is None:
+                self._memory.clear()
+            else:
+                for key in [key for key in self._memory if key[0] == ticker.upper()]:
+                    del self._memory[key]
+        if self.store is not None:
+            self.store.invalidate(ticker)
+
+    def stats(self):
+        """
+        Return cache counters.
+        
+        Returns:
+            dict: Per-day hit/miss counts, hit rate and number of API fetches
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "fetches": self.fetches,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+
+def articles_by_day(articles, start, end):
+    """
+    Group articles by publication day.
+    
+    Args:
+        articles (list): Raw NewsAPI article dicts
+        start (date): First day of the range
+        end (date): Last day of the range
+    
+    Returns:
+        dict: Day -> articles, with an entry (possibly empty) for every day in
+              the range; articles outside it are dropped
+    """
+    days = {start + timedelta(days=i): [] for i in range((end - start).days + 1)}
+    for article in articles:
+        try:
+            day = as_date(article.get("publishedAt", ""))
+        except ValueError:
+            continue
+        if day in days:
+            days[day].append(article)
+    return days
+
+
+def _spans(days):
+    """Group sorted days into (start, end) runs of consecutive days."""
+    spans = []
+    for day in days:
+        if spans and day == spans[-1][1] + timedelta(days=1):
+            spans[-1][1] = day
+        else:
+            spans.append([day, day])
+    return [tuple(span) for span in spans]
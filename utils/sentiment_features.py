@@ -0,0 +1,251 @@
+"""
+Daily news sentiment as model features.
+
+``build_daily_sentiment`` reads every cached article of a stock from the
+ArticleStore (filled by analyze_sentiment and scripts/news_ingest.py),
+scores the headlines once and stores one row per calendar day: the sum of
+the scores and the positive, negative and total article counts. They are
+kept as ``.npy`` columns under ``data/sentiment/<stock>``.
+
+``aligned_features`` maps those days onto a stock's trading days with an
+as-of join. News of a weekend or holiday counts towards the next trading
+day, and days without news are zero. The result is cached per process, so
+a prediction only pays for the join when the prices or the sentiment store
+change. It never reads articles.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import price_store
+from utils.sentiment_cache import NEWS_DB_PATH, ArticleStore
+
+SENTIMENT_DIR = os.path.join(price_store.DATA_DIR, "sentiment")
+SENTIMENT_VERSION = 1
+SENTIMENT_FEATURES = ['Sent_Mean', 'Sent_Pos', 'Sent_Neg', 'News_Volume']
+# Stored per calendar day; Sent_Mean is derived after days are merged
+DAILY_COLUMNS = ['Score_Sum', 'Sent_Pos', 'Sent_Neg', 'News_Volume']
+DEFAULT_SCORER = os.getenv("SENTIMENT_FEATURE_SCORER", "lexicon")
+
+_lock = threading.Lock()
+_daily = {}  # (sentiment_dir, stock) -> (meta mtime_ns, daily frame)
+_aligned = {}  # (sentiment_dir, stock) -> (key, aligned frame)
+
+
+def sentiment_path(stock, sentiment_dir=SENTIMENT_DIR):
+    """Return the directory holding the daily sentiment columns for a stock."""
+    return os.path.join(sentiment_dir, stock.lower())
+
+
+def daily_aggregates(articles_by_day, scorer=DEFAULT_SCORER):
+    """
+    Score articles and aggregate them per day.
+    
+    Args:
+        articles_by_day (dict): Day -> raw NewsAPI article dicts
+        scorer (str): Headline scorer, one of sentiment_utils.SCORERS
+    
+    Returns:
+        DataFrame: Date plus DAILY_COLUMNS, one row per day in date order
+    """
+    from utils.sentiment_utils import score_headlines
+
+    days = sorted(articles_by_day)
+    headlines, owners = [], []
+    for i, day in enumerate(days):
+        for article in articles_by_day[day]:
+            if article.get('title'):
+                headlines.append(article['title'])
+                owners.append(i)
+    # One batch, so the scorer's setup is paid once
+    scores = np.asarray(score_headlines(headlines, scorer), dtype=np.float64)
+    owners = np.asarray(owners, dtype=np.intp)
+
+    n = len(days)
+    # Same thresholds as analyze_sentiment's labels
+    return pd.DataFrame({
+        'Date': pd.to_datetime(days).astype("datetime64[ns]"),
+        'Score_Sum': np.bincount(owners, weights=scores, minlength=n),
+        'Sent_Pos': np.bincount(owners, weights=scores > 0.1, minlength=n),
+        'Sent_Neg': np.bincount(owners, weights=scores < -0.1, minlength=n),
+        'News_Volume': np.bincount(owners, minlength=n).astype(np.float64),
+    })
+
+
+def _write(path, daily, meta):
+    parent = os.path.dirname(path) or "."
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    np.save(os.path.join(tmp_path, "Date.npy"), daily['Date'].to_numpy(dtype="datetime64[ns]"))
+    for col in DAILY_COLUMNS:
+        np.save(os.path.join(tmp_path, f"{col}.npy"), daily[col].to_numpy(dtype=np.float64))
+    with open(os.path.join(tmp_path, "sentiment.json"), "w") as f:
+        json.dump(meta, f)
+
+    old_path = f"{path}.old-{os.getpid()}"
+    if os.path.exists(path):
+        os.rename(path, old_path)
+    os.rename(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def build_daily_sentiment(stock, store=None, scorer=DEFAULT_SCORER, sentiment_dir=SENTIMENT_DIR):
+    """
+    Rebuild a stock's daily sentiment store from its cached articles.
+    
+    Args:
+        stock (str): Stock symbol
+        store (ArticleStore): Article store to read (default: NEWS_DB_PATH)
+        scorer (str): Headline scorer, one of sentiment_utils.SCORERS
+        sentiment_dir (str): Directory holding the sentiment stores
+    
+    Returns:
+        DataFrame: The stored daily aggregates (Date plus DAILY_COLUMNS)
+    """
+    store = store or ArticleStore(NEWS_DB_PATH)
+    articles_by_day = store.get_ticker_days(stock)
+    daily = daily_aggregates(articles_by_day, scorer)
+    meta = {
+        "version": SENTIMENT_VERSION,
+        "scorer": scorer,
+        "rows": int(len(daily)),
+        "articles": int(daily['News_Volume'].sum()),
+        "first_date": str(daily['Date'].iloc[0]) if len(daily) else None,
+        "last_date": str(daily['Date'].iloc[-1]) if len(daily) else None,
+        "built_at": time.time(),
+    }
+    _write(sentiment_path(stock, sentiment_dir), daily, meta)
+    return daily
+
+
+def read_meta(stock, sentiment_dir=SENTIMENT_DIR):
+    """Return the sentiment store's metadata, or None if it has not been built."""
+    try:
+        with open(os.path.join(sentiment_path(stock, sentiment_dir), "sentiment.json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == SENTIMENT_VERSION else None
+
+
+def signature(stock, sentiment_dir=SENTIMENT_DIR):
+    """Return the modification time of the stock's sentiment store, or None."""
+    try:
+        return os.stat(os.path.join(sentiment_path(stock, sentiment_dir), "sentiment.json")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_daily(stock, sentiment_dir=SENTIMENT_DIR):
+    """
+    Load a stock's daily sentiment aggregates.
+    
+    Args:
+        stock (str): Stock symbol
+        sentiment_dir (str): Directory holding the sentiment stores
+    
+    Returns:
+        DataFrame: Date plus DAILY_COLUMNS, or None if the store has not
+                   been built
+    """
+    mtime = signature(stock, sentiment_dir)
+    if mtime is None:
+        return None
+    key = (sentiment_dir, stock.lower())
+    with _lock:
+        cached = _daily.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    if read_meta(stock, sentiment_dir) is None:
+        return None
+
+    path = sentiment_path(stock, sentiment_dir)
+    try:
+        daily = pd.DataFrame({col: np.load(os.path.join(path, f"{col}.npy")) for col in ['Date'] + DAILY_COLUMNS})
+    except OSError:
+        # Being rebuilt right now
+        return None
+    with _lock:
+        _daily[key] = (mtime, daily)
+    return daily
+
+
+def align(dates, daily):
+    """
+    Map daily sentiment onto trading days.
+    
+    Each news day is attached to the first trading day on or after it with
+    an as-of join, and the days landing on the same trading day are summed.
+    News after the last trading day is left out until that day's prices
+    arrive.
+    
+    Args:
+        dates (array-like): Sorted trading dates
+        daily (DataFrame): Date plus DAILY_COLUMNS, or None
+    
+    Returns:
+        DataFrame: SENTIMENT_FEATURES aligned row-for-row with ``dates``
+    """
+    dates = pd.DatetimeIndex(np.asarray(dates, dtype="datetime64[ns]"))
+    if daily is None or daily.empty or dates.empty:
+        return pd.DataFrame(0.0, index=range(len(dates)), columns=SENTIMENT_FEATURES)
+
+    trading = pd.DataFrame({'Trading_Date': dates})
+    mapped = pd.merge_asof(daily, trading, left_on='Date', right_on='Trading_Date', direction='forward')
+    sums = mapped.dropna(subset=['Trading_Date']).groupby('Trading_Date')[DAILY_COLUMNS].sum()
+    sums = sums.reindex(dates, fill_value=0.0)
+
+    volume = sums['News_Volume'].to_numpy()
+    mean = np.divide(sums['Score_Sum'].to_numpy(), volume, out=np.zeros(len(volume)), where=volume > 0)
+    return pd.DataFrame({
+        'Sent_Mean': mean,
+        'Sent_Pos': sums['Sent_Pos'].to_numpy(),
+        'Sent_Neg': sums['Sent_Neg'].to_numpy(),
+        'News_Volume': volume,
+    })
+
+
+def aligned_features(stock, dates, sentiment_dir=SENTIMENT_DIR):
+    """
+    Return a stock's sentiment features for its trading days.
+    
+    Pass the stock's full date history rather than a slice of it, so news
+    from before the slice is not piled onto its first day.
+    
+    Args:
+        stock (str): Stock symbol
+        dates (array-like): Sorted trading dates
+        sentiment_dir (str): Directory holding the sentiment stores
+    
+    Returns:
+        DataFrame: SENTIMENT_FEATURES aligned row-for-row with ``dates``
+                   (zeros when the store has not been built)
+    """
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    key = (signature(stock, sentiment_dir), len(dates),
+           dates[0] if len(dates) else None, dates[-1] if len(dates) else None)
+    cache_key = (sentiment_dir, stock.lower())
+    with _lock:
+        cached = _aligned.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    aligned = align(dates, load_daily(stock, sentiment_dir))
+    with _lock:
+        _aligned[cache_key] = (key, aligned)
+    return aligned
+
+
+def clear_cache():
+    """Forget cached daily and aligned sentiment."""
+    with _lock:
+        _daily.clear()
+        _aligned.clear()
@@ -2,14 +2,86 @@ import requests
 import pandas as pd
 from datetime import datetime, timedelta
 import os
-from textblob import TextBlob
-import matplotlib.pyplot as plt
+import sqlite3
+from utils.instrumentation import span, traced
+from utils.news_client import NEWS_API_KEY, NEWS_ENDPOINT, NewsAPIError, NewsClient
+from utils.sentiment_cache import NEWS_DB_PATH, ArticleStore, SentimentCache
 
-# News API Config - Use environment variable or placeholder
-NEWS_API_KEY = os.getenv("NEWS_API_KEY", "10918c1fb6964375be2d936bdea986a5")  # Set your API key as environment variable
-NEWS_ENDPOINT = "https://newsapi.org/v2/everything"
+# Pooled NewsAPI client shared by every session
+news_client = NewsClient(
+    api_key=NEWS_API_KEY,
+    max_articles=int(os.getenv("NEWS_MAX_ARTICLES", "100")),
+)
 
-def analyze_sentiment(stock, start_date, end_date):
+def _open_article_store():
+    try:
+        return ArticleStore(NEWS_DB_PATH)
+    except (OSError, sqlite3.Error):
+        # Fall back to the in-memory tier on a read-only filesystem
+        return None
+
+# Articles are cached per (ticker, day) in memory and in SQLite, so repeated
+# and overlapping queries only hit NewsAPI for days not seen before. The
+# SQLite file is opened on the first lookup, not on import
+sentiment_cache = SentimentCache(
+    open_store=_open_article_store,
+    today_ttl=float(os.getenv("NEWS_CACHE_TODAY_TTL", 15 * 60)),
+    recent_ttl=float(os.getenv("NEWS_CACHE_RECENT_TTL", 6 * 3600)),
+)
+
+def fetch_articles(stock, start_date, end_date):
+    """
+    Fetch raw NewsAPI articles for a stock and date range.
+    
+    Args:
+        stock (str): Stock symbol
+        start_date (date): Start date
+        end_date (date): End date
+    
+    Returns:
+        list: Article dicts as returned by NewsAPI
+    """
+    with span("newsapi_http"):
+        return news_client.everything(f"{stock} stock", start_date, end_date)
+
+def _textblob_polarity(headlines):
+    # TextBlob pulls in nltk, so it is only imported when this scorer is used
+    from textblob import TextBlob
+    return [TextBlob(headline).sentiment.polarity for headline in headlines]
+
+def _lexicon_polarity(headlines):
+    from utils.lexicon_sentiment import get_scorer
+    return get_scorer().polarity(headlines)
+
+def _transformer_polarity(headlines):
+    from utils.transformer_sentiment import get_scorer
+    return get_scorer().polarity(headlines)
+
+# Headline scorers selectable in analyze_sentiment; each maps a list of
+# headlines to polarity scores in [-1, 1]
+SCORERS = {
+    "textblob": _textblob_polarity,
+    "lexicon": _lexicon_polarity,
+    "transformer": _transformer_polarity,
+}
+
+def score_headlines(headlines, scorer="textblob"):
+    """
+    Score headlines with the named scorer.
+    
+    Args:
+        headlines (list): Headline strings
+        scorer (str): One of SCORERS
+    
+    Returns:
+        list: Polarity scores in [-1, 1]
+    """
+    if scorer not in SCORERS:
+        raise ValueError(f"Unknown sentiment scorer: {scorer}")
+    return SCORERS[scorer](headlines) if headlines else []
+
+@traced("analyze_sentiment", profile_calls=True)
+def analyze_sentiment(stock, start_date, end_date, scorer="textblob"):
     """
     Analyze sentiment for a given stock using news articles.
     
@@ -17,6 +89,7 @@ def analyze_sentiment(stock, start_date, end_date):
         stock (str): Stock symbol
         start_date (date): Start date for analysis
         end_date (date): End date for analysis
+        scorer (str): Headline scorer, one of SCORERS
     
     Returns:
         tuple: (sentiment_df, summary, top_news_df)
@@ -28,39 +101,20 @@ def analyze_sentiment(stock, start_date, end_date):
         error_msg = "❌ Free API supports only last 30 days! Please upgrade to premium."
         return pd.DataFrame(), error_msg, pd.DataFrame()
 
-    # Prepare query
-    params = {
-        "q": f"{stock} stock",
-        "from": start_date.strftime("%Y-%m-%d"),
-        "to": end_date.strftime("%Y-%m-%d"),
-        "sortBy": "relevancy",
-        "apiKey": NEWS_API_KEY,
-        "language": "en",
-        "pageSize": 50
-    }
-
     try:
-        response = requests.get(NEWS_ENDPOINT, params=params, timeout=10)
-        if response.status_code != 200:
-            error_msg = f"⚠️ API Error: {response.json().get('message', 'Unknown error')}"
-            return pd.DataFrame(), error_msg, pd.DataFrame()
-
-        articles = response.json().get("articles", [])
+        with span("fetch_articles"):
+            articles = sentiment_cache.get_articles(stock, start_date, end_date, fetch_articles)
         if not articles:
             error_msg = "⚠️ No articles found in this date range."
             return pd.DataFrame(), error_msg, pd.DataFrame()
 
-        results = []
-        for article in articles:
-            title = article.get('title', '')
-            published_at = article.get('publishedAt', '')[:10]
-            url = article.get('url', '')
-            
-            if title:
-                # Use TextBlob for sentiment analysis
-                blob = TextBlob(title)
-                sentiment_score = blob.sentiment.polarity
-                
+        articles = [article for article in articles if article.get('title')]
+        with span("score"):
+            scores = score_headlines([article['title'] for article in articles], scorer)
+
+        with span("build_frame"):
+            results = []
+            for article, sentiment_score in zip(articles, scores):
                 # Convert score to label
                 if sentiment_score > 0.1:
                     sentiment_label = "POSITIVE"
@@ -68,39 +122,42 @@ def analyze_sentiment(stock, start_date, end_date):
                     sentiment_label = "NEGATIVE"
                 else:
                     sentiment_label = "NEUTRAL"
-                
+            
                 results.append({
-                    "Date": published_at,
-                    "Headline": title,
-                    "URL": url,
+                    "Date": article.get('publishedAt', '')[:10],
+                    "Headline": article['title'],
+                    "URL": article.get('url', ''),
                     "Sentiment": sentiment_label,
                     "Score": round(sentiment_score, 3)
                 })
 
-        if not results:
-            error_msg = "⚠️ No valid articles found for sentiment analysis."
-            return pd.DataFrame(), error_msg, pd.DataFrame()
+            if not results:
+                error_msg = "⚠️ No valid articles found for sentiment analysis."
+                return pd.DataFrame(), error_msg, pd.DataFrame()
 
-        df = pd.DataFrame(results)
-        df['Date'] = pd.to_datetime(df['Date'])
+            df = pd.DataFrame(results)
+            df['Date'] = pd.to_datetime(df['Date'])
         
-        # Calculate overall sentiment summary
-        positive_count = len(df[df['Sentiment'] == 'POSITIVE'])
-        negative_count = len(df[df['Sentiment'] == 'NEGATIVE'])
-        neutral_count = len(df[df['Sentiment'] == 'NEUTRAL'])
+            # Calculate overall sentiment summary
+            positive_count = len(df[df['Sentiment'] == 'POSITIVE'])
+            negative_count = len(df[df['Sentiment'] == 'NEGATIVE'])
+            neutral_count = len(df[df['Sentiment'] == 'NEUTRAL'])
         
-        if positive_count > negative_count:
-            summary = "POSITIVE"
-        elif negative_count > positive_count:
-            summary = "NEGATIVE"
-        else:
-            summary = "NEUTRAL"
+            if positive_count > negative_count:
+                summary = "POSITIVE"
+            elif negative_count > positive_count:
+                summary = "NEGATIVE"
+            else:
+                summary = "NEUTRAL"
 
-        # Top 5 influential news (by absolute score)
-        top_news_df = df.sort_values(by="Score", key=abs, ascending=False).head(5)
+            # Top 5 influential news (by absolute score)
+            top_news_df = df.sort_values(by="Score", key=abs, ascending=False).head(5)
 
         return df, summary, top_news_df
 
+    except NewsAPIError as e:
+        error_msg = f"⚠️ API Error: {str(e)}"
+        return pd.DataFrame(), error_msg, pd.DataFrame()
     except requests.exceptions.RequestException as e:
         error_msg = f"⚠️ Network Error: {str(e)}"
         return pd.DataFrame(), error_msg, pd.DataFrame()
@@ -119,6 +176,8 @@ def plot_sentiment(df):
     Returns:
         matplotlib.figure.Figure: The plot figure
     """
+    import matplotlib.pyplot as plt
+
     if df.empty:
         # Return empty plot if no data
         fig, ax = plt.subplots(figsize=(6, 4))
@@ -0,0 +1,304 @@
+"""
+ASGI service exposing price prediction and news sentiment over HTTP.
+
+Endpoints (all GET, JSON responses):
+
+    /predict?stock=RELIANCE&start=2025-05-01&end=2025-05-29
+    /sentiment?stock=RELIANCE&start=2025-05-01&end=2025-05-29&scorer=lexicon
+    /health
+    /metrics   (Prometheus text; stage timings need PERF_TRACE=1)
+
+The service runs in one process so the model registry, price stores and
+sentiment caches stay warm between requests; models for every stock are
+loaded at startup. Prediction and scoring are CPU-bound, so they run on a
+bounded thread pool (XGBoost releases the GIL while predicting) and the
+event loop only parses requests and writes responses. When more than
+``max_pending`` jobs are queued the service answers 503 instead of queueing
+without limit. Identical requests that arrive while one is already being
+computed wait for that computation instead of starting another.
+
+A missing model or price file is answered with 404, a date range without
+data with 422 and any other failure with 500.
+"""
+import asyncio
+import contextlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from utils.warmup import warm_up
+
+SERVICE_WORKERS = int(os.getenv("SERVICE_WORKERS", "4"))
+SERVICE_MAX_PENDING = int(os.getenv("SERVICE_MAX_PENDING", "64"))
+
+
+class ServiceBusy(Exception):
+    """Raised when the executor already has ``max_pending`` jobs."""
+
+
+class Coalescer:
+    """
+    Share one computation between identical concurrent requests.
+    
+    Only in-flight work is shared: once a computation finishes its key is
+    forgotten, so later requests compute fresh results. Must be used from a
+    single event loop.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._inflight)
+
+    async def run(self, key, factory):
+        """
+        Await the result for ``key``, starting ``factory()`` if nothing is in flight.
+        
+        Args:
+            key (tuple): Hashable request identity
+            factory (callable): Returns the coroutine computing the result
+        
+        Returns:
+            The computation's result (or raises its exception)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        # A disconnecting client must not cancel the work other requests share
+        return await asyncio.shield(task)
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a cap on queued plus running jobs.
+    
+    Args:
+        max_workers (int): Worker threads
+        max_pending (int): Jobs accepted before ``ServiceBusy`` is raised
+    """
+
+    def __init__(self, max_workers=SERVICE_WORKERS, max_pending=SERVICE_MAX_PENDING):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="service")
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ServiceBusy(f"Server busy: {self.pending} jobs pending")
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_dates(params):
+    try:
+        start = date.fromisoformat(params["start"])
+        end = date.fromisoformat(params["end"])
+    except KeyError as e:
+        raise ValueError(f"Missing query parameter: {e.args[0]}")
+    except ValueError as e:
+        raise ValueError(f"Invalid date: {str(e)}")
+    if end < start:
+        raise ValueError("End date must be after start date")
+    return start, end
+
+
+def error_status(e):
+    """
+    Return the HTTP status for an exception raised while computing a response.
+    
+    ``predict_range`` wraps the original error in a plain Exception, so the
+    error it wraps decides the status.
+    
+    Args:
+        e (Exception): The raised exception
+    
+    Returns:
+        int: 404 for missing files, 422 for invalid input, otherwise 500
+    """
+    if type(e) is Exception:
+        e = e.__cause__ or e.__context__ or e
+    if isinstance(e, FileNotFoundError):
+        return 404
+    if isinstance(e, ValueError):
+        return 422
+    return 500
+
+
+def _iso(values):
+    return [str(value)[:10] for value in values]
+
+
+def predict_payload(stock, start, end):
+    """Run ``predict_range`` and return a JSON-ready dict."""
+    from utils.model_utils import predict_range
+
+    df = predict_range(stock, start, end)
+    return {
+        "stock": stock,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "predictions": [
+            {"date": day, "actual": float(actual), "predicted": float(predicted)}
+            for day, actual, predicted in zip(_iso(df['Date']), df['Close_Actual'], df['Close_Predicted'])
+        ],
+    }
+
+
+def sentiment_payload(stock, start, end, scorer):
+    """Run ``analyze_sentiment`` and return a JSON-ready dict."""
+    from utils.sentiment_utils import analyze_sentiment
+
+    df, summary, top_news_df = analyze_sentiment(stock, start, end, scorer)
+    if df.empty:
+        # analyze_sentiment reports problems through the summary text
+        return {"stock": stock, "start": start.isoformat(), "end": end.isoformat(), "summary": None,
+                "message": summary, "articles": [], "top": []}
+
+    def records(frame):
+        return [
+            {"date": day, "headline": headline, "url": url, "sentiment": label, "score": float(score)}
+            for day, headline, url, label, score in zip(
+                _iso(frame['Date']), frame['Headline'], frame['URL'], frame['Sentiment'], frame['Score'])
+        ]
+
+    return {"stock": stock, "start": start.isoformat(), "end": end.isoformat(), "summary": summary,
+            "message": None, "articles": records(df), "top": records(top_news_df)}
+
+
+def create_app(max_workers=SERVICE_WORKERS, max_pending=SERVICE_MAX_PENDING, warm=True):
+    """
+    Build the Starlette application.
+    
+    Args:
+        max_workers (int): Threads running predictions and sentiment scoring
+        max_pending (int): Jobs accepted before answering 503
+        warm (bool): Load every model and price series at startup
+    
+    Returns:
+        starlette.applications.Starlette: The ASGI app
+    """
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse, PlainTextResponse
+    from starlette.routing import Route
+
+    from utils.sentiment_utils import SCORERS
+    from utils.stocks import STOCK_LIST
+
+    executor = BoundedExecutor(max_workers, max_pending)
+    coalescer = Coalescer()
+    stats = {"requests": 0, "errors": 0, "started_at": time.time(), "warm_failures": {}}
+    stocks = {stock.upper() for stock in STOCK_LIST}
+
+    def error(status, message):
+        stats["errors"] += 1
+        return JSONResponse({"error": message}, status_code=status)
+
+    async def handle(key, fn, *args):
+        try:
+            result = await coalescer.run(key, lambda: executor.run(fn, *args))
+        except ServiceBusy as e:
+            return error(503, str(e))
+        except Exception as e:
+            return error(error_status(e), str(e))
+        return JSONResponse(result)
+
+    def common_params(request):
+        stats["requests"] += 1
+        params = request.query_params
+        stock = params.get("stock", "").upper()
+        if stock not in stocks:
+            raise LookupError(f"Unknown stock: {stock or '(missing)'}")
+        start, end = _parse_dates(params)
+        return stock, start, end
+
+    async def predict(request):
+        try:
+            stock, start, end = common_params(request)
+        except LookupError as e:
+            return error(404, str(e))
+        except ValueError as e:
+            return error(400, str(e))
+        key = ("predict", stock, start, end)
+        return await handle(key, predict_payload, stock, start, end)
+
+    async def sentiment(request):
+        try:
+            stock, start, end = common_params(request)
+        except LookupError as e:
+            return error(404, str(e))
+        except ValueError as e:
+            return error(400, str(e))
+        scorer = request.query_params.get("scorer", "textblob")
+        if scorer not in SCORERS:
+            return error(400, f"Unknown scorer: {scorer}")
+        key = ("sentiment", stock, start, end, scorer)
+        return await handle(key, sentiment_payload, stock, start, end, scorer)
+
+    async def health(request):
+        from utils.model_utils import model_registry
+
+        return JSONResponse({
+            "status": "ok",
+            "uptime_seconds": round(time.time() - stats["started_at"], 1),
+            "requests": stats["requests"],
+            "errors": stats["errors"],
+            "computations": coalescer.started,
+            "coalesced": coalescer.coalesced,
+            "in_flight": len(coalescer),
+            "pending_jobs": executor.pending,
+            "rejected": executor.rejected,
+            "workers": executor.max_workers,
+            "models": model_registry.stats(),
+            "warm_failures": stats["warm_failures"],
+        })
+
+    async def metrics(request):
+        from utils.instrumentation import prometheus_text
+
+        lines = [
+            "# TYPE stock_insights_requests_total counter",
+            f"stock_insights_requests_total {stats['requests']}",
+            "# TYPE stock_insights_request_errors_total counter",
+            f"stock_insights_request_errors_total {stats['errors']}",
+            "# TYPE stock_insights_coalesced_requests_total counter",
+            f"stock_insights_coalesced_requests_total {coalescer.coalesced}",
+            "# TYPE stock_insights_pending_jobs gauge",
+            f"stock_insights_pending_jobs {executor.pending}",
+        ]
+        return PlainTextResponse("\n".join(lines) + "\n" + prometheus_text(),
+                                 media_type="text/plain; version=0.0.4")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        if warm:
+            stats["warm_failures"] = await asyncio.get_running_loop().run_in_executor(None, warm_up)
+        yield
+        executor.shutdown()
+
+    app = Starlette(routes=[
+        Route("/predict", predict),
+        Route("/sentiment", sentiment),
+        Route("/health", health),
+        Route("/metrics", metrics),
+    ], lifespan=lifespan)
+    app.state.executor = executor
+    app.state.coalescer = coalescer
+    return app
@@ -0,0 +1,5 @@
+# NIFTY stocks supported by the app, with their Yahoo Finance tickers
+STOCK_LIST = ["RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK", "HCLTECH", "LT", "SBIN", "WIPRO", "ITC",
+              "BAJFINANCE", "HINDUNILVR", "KOTAKBANK", "ASIANPAINT", "NTPC", "TATAMOTORS", "ONGC", "SUNPHARMA", "TECHM", "POWERGRID"]
+
+YF_TICKERS = {stock: f"{stock}.NS" for stock in STOCK_LIST}
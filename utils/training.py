@@ -0,0 +1,192 @@
+"""
+Headless training of the per-stock XGBoost models.
+
+Replaces the per-stock notebooks: each stock's features come from the
+shared indicator engine, the model is fit on the first 80% of rows in date
+order (``train_test_split(shuffle=False)`` as in the notebooks) and scored
+on the rest. Stocks train in parallel worker processes; every worker caps
+XGBoost/OpenMP at its share of the CPUs.
+
+Models are written atomically to ``models/<stock>.ubj`` (XGBoost's native
+binary format, with a ``.meta.json`` sidecar; ``.json`` and pickle are also
+available) and described in ``models/manifest.json`` (version, training
+time, metrics, feature schema).
+"""
+import hashlib
+import json
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+import numpy as np
+
+from utils import price_store
+from utils.backtest import _metrics, feature_matrix, feature_names
+from utils.model_utils import MODEL_PARAMS, MODELS_DIR, save_model
+from utils.stocks import STOCK_LIST
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+TEST_SIZE = 0.2
+
+
+def manifest_path(models_dir=MODELS_DIR):
+    """Return the path of the training manifest."""
+    return os.path.join(models_dir, MANIFEST_NAME)
+
+
+def read_manifest(models_dir=MODELS_DIR):
+    """Return the training manifest, or None if there is none."""
+    try:
+        with open(manifest_path(models_dir)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _limit_threads(n_threads):
+    # Runs in each worker before any OpenMP runtime starts
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(n_threads)
+
+
+DEFAULT_FORMAT = "ubj"
+
+
+def train_stock(stock, version, params=None, n_jobs=1, test_size=TEST_SIZE, models_dir=MODELS_DIR,
+                data_dir=price_store.DATA_DIR, store_dir=price_store.STORE_DIR, fmt=DEFAULT_FORMAT, sentiment=False):
+    """
+    Train, evaluate and save one stock's model.
+    
+    Args:
+        stock (str): Stock symbol
+        version (str): Version tag recorded for the artifact
+        params (dict): XGBRegressor parameters (default: MODEL_PARAMS)
+        n_jobs (int): XGBoost threads
+        test_size (float): Fraction of the latest rows held out for metrics
+        models_dir (str): Directory to write the model to
+        data_dir (str): Directory holding the raw CSVs
+        store_dir (str): Directory holding the columnar stores
+        fmt (str): Model file format: "ubj", "json" or "pkl"
+        sentiment (bool): Also train on the daily sentiment features
+    
+    Returns:
+        dict: Manifest entry for the model
+    """
+    from xgboost import XGBRegressor
+
+    started = time.perf_counter()
+    dates, X, y = feature_matrix(stock, data_dir, store_dir, sentiment)
+    split = int(len(y) * (1 - test_size))
+    if split < 1 or split >= len(y):
+        raise ValueError(f"Not enough rows to train {stock}: {len(y)}")
+
+    params = {**MODEL_PARAMS, **(params or {})}
+    model = XGBRegressor(**params, n_jobs=n_jobs)
+    t0 = time.perf_counter()
+    model.fit(X[:split], y[:split])
+    fit_time = time.perf_counter() - t0
+    metrics = _metrics(y[split:], model.predict(X[split:]))
+
+    # Saved with the feature names the serving path passes in; they also
+    # tell it whether to join the sentiment features
+    features = feature_names(sentiment)
+    model.get_booster().feature_names = features
+    path = save_model(model, stock, models_dir, fmt=fmt, version=version)
+    with open(path, "rb") as f:
+        payload = f.read()
+
+    return {
+        "version": version,
+        "file": os.path.basename(path),
+        "format": fmt,
+        "features": features,
+        "sha256": hashlib.sha256(payload).hexdigest(),
+        "bytes": len(payload),
+        "train_rows": int(split),
+        "test_rows": int(len(y) - split),
+        "train_start": str(np.datetime_as_string(dates[0], unit="D")),
+        "train_end": str(np.datetime_as_string(dates[split - 1], unit="D")),
+        "test_end": str(np.datetime_as_string(dates[-1], unit="D")),
+        "params": params,
+        "metrics": {name: round(value, 6) for name, value in metrics.items()},
+        "fit_seconds": round(fit_time, 3),
+        "total_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def train_all(stocks=None, params=None, max_workers=None, test_size=TEST_SIZE, models_dir=MODELS_DIR,
+              data_dir=price_store.DATA_DIR, store_dir=price_store.STORE_DIR, version=None, fmt=DEFAULT_FORMAT,
+              sentiment=False):
+    """
+    Train every stock in parallel and write the manifest.
+    
+    Each worker process trains one stock at a time with
+    ``cpu_count // max_workers`` XGBoost threads, so the pool never runs more
+    threads than there are cores. Entries for stocks that were not retrained
+    are carried over from the previous manifest.
+    
+    Args:
+        stocks (list): Stock symbols (default: STOCK_LIST)
+        params (dict): XGBRegressor parameter overrides
+        max_workers (int): Worker processes (default: CPU count, capped at
+                           the number of stocks)
+        version (str): Version tag (default: UTC timestamp of the run)
+        Other arguments are passed to ``train_stock``.
+    
+    Returns:
+        dict: The manifest written to ``models/manifest.json``, with a
+              ``failures`` map of stock to error message
+    """
+    import xgboost
+
+    stocks = [stock.upper() for stock in (stocks or STOCK_LIST)]
+    version = version or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    cpus = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers or cpus, len(stocks)))
+    n_jobs = max(1, cpus // max_workers)
+    os.makedirs(models_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    entries, failures = {}, {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_limit_threads, initargs=(n_jobs,)) as pool:
+        futures = {
+            pool.submit(train_stock, stock, version, params, n_jobs, test_size, models_dir, data_dir, store_dir, fmt,
+                        sentiment): stock
+            for stock in stocks
+        }
+        for future in as_completed(futures):
+            stock = futures[future]
+            try:
+                entries[stock] = future.result()
+            except Exception as e:
+                failures[stock] = str(e)
+
+    previous = read_manifest(models_dir) or {}
+    models = dict(previous.get("models", {}))
+    models.update(entries)
+    manifest = {
+        "manifest_version": MANIFEST_VERSION,
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "features": feature_names(sentiment),
+        "target": "Close",
+        "xgboost": xgboost.__version__,
+        "python": platform.python_version(),
+        "workers": max_workers,
+        "threads_per_worker": n_jobs,
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "models": dict(sorted(models.items())),
+        "failures": dict(sorted(failures.items())),
+    }
+    _write_atomic(manifest_path(models_dir), (json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
+    return manifest
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
+
+class TransformerSentimentScorer:
+    """
+    Batched DistilBERT sentiment scorer for CPU inference.
+    
+    Texts are tokenized in one bulk call, truncated by tokens (not
+    characters), sorted by length and run through the model in batches
+    padded only to the longest text in each batch. Results are cached by a
+    hash of the text, so a headline is never scored twice.
+    
+    The model is loaded on first use; ``torch`` and ``transformers`` are only
+    imported then.
+    
+    Args:
+        model_name (str): Hugging Face model id or local path
+        batch_size (int): Texts per forward pass
+        num_threads (int): CPU threads for torch, or None to keep its default
+        max_length (int): Maximum tokens per text
+        cache_size (int): Maximum cached results
+    """
+
+    def __init__(self, model_name=DEFAULT_MODEL, batch_size=16, num_threads=None, max_length=512, cache_size=10000):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._model = None
+        self._tokenizer = None
+        self.cache_hits = 0
+        self.scored = 0
+
+    def _load(self):
+        with self._lock:
+            if self._model is None:
+                import torch
+                from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+                if self.num_threads:
+                    torch.set_num_threads(self.num_threads)
+                self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                model.eval()
+                self._model = model
+        return self._tokenizer, self._model
+
+    @staticmethod
+    def _key(text):
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def predict(self, texts):
+        """
+        Score texts, reusing cached results.
+        
+        Args:
+            texts (list): Strings to classify
+        
+        Returns:
+            list: One dict per text with ``label`` (POSITIVE/NEGATIVE),
+                  ``score`` (confidence of that label) and ``polarity``
+                  (P(positive) - P(negative), in [-1, 1])
+        """
+        keys = [self._key(text) for text in texts]
+        results = [None] * len(texts)
+        pending = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    results[i] = cached
+                else:
+                    pending.setdefault(key, []).append(i)
+
+        if pending:
+            unique = [texts[indices[0]] for indices in pending.values()]
+            fresh = dict(zip(pending, self._score(unique)))
+            for key, indices in pending.items():
+                for i in indices:
+                    results[i] = fresh[key]
+            with self._lock:
+                self.scored += len(fresh)
+                self._cache.update(fresh)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results
+
+    def _score(self, texts):
+        import torch
+
+        tokenizer, model = self._load()
+        encoded = tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+        # Sorting by length keeps padding inside each batch minimal
+        order = sorted(range(len(texts)), key=lambda i: len(encoded[i]))
+        labels = model.config.id2label
+        positive = next((i for i, name in labels.items() if name.upper() == "POSITIVE"), 1)
+        negative = next((i for i, name in labels.items() if name.upper() == "NEGATIVE"), 0)
+
+        scored = [None] * len(texts)
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                batch = order[start:start + self.batch_size]
+                inputs = tokenizer.pad({"input_ids": [encoded[i] for i in batch]}, return_tensors="pt")
+                probs = torch.softmax(model(**inputs).logits, dim=-1).tolist()
+                for i, p in zip(batch, probs):
+                    best = max(range(len(p)), key=p.__getitem__)
+                    scored[i] = {
+                        "label": labels[best].upper(),
+                        "score": p[best],
+                        "polarity": p[positive] - p[negative],
+                    }
+        return scored
+
+    def polarity(self, texts):
+        """Return P(positive) - P(negative) for each text."""
+        return [result["polarity"] for result in self.predict(texts)]
+
+    def stats(self):
+        """Return the number of texts scored and cache hits."""
+        with self._lock:
+            return {"scored": self.scored, "cache_hits": self.cache_hits, "cached": len(self._cache)}
+
+
+_default_scorer = None
+_default_lock = threading.Lock()
+
+
+def get_scorer():
+    """
+    Return the process-wide scorer, configured from the environment.
+    
+    ``SENTIMENT_MODEL``, ``SENTIMENT_BATCH_SIZE`` and ``SENTIMENT_THREADS``
+    override the model, batch size and CPU thread count.
+    """
+    global _default_scorer
+    with _default_lock:
+        if _default_scorer is None:
+            threads = os.getenv("SENTIMENT_THREADS")
+            _default_scorer = TransformerSentimentScorer(
+                model_name=os.getenv("SENTIMENT_MODEL", DEFAULT_MODEL),
+                batch_size=int(os.getenv("SENTIMENT_BATCH_SIZE", "16")),
+                num_threads=int(threads) if threads else None,
+            )
+        return _default_scorer
@@ -0,0 +1,189 @@
+"""
+NumPy inference for trained XGBoost regressors.
+
+For the handful of rows the app predicts at a time, ``XGBRegressor.predict``
+spends most of its time converting the DataFrame to a DMatrix and setting
+up the call. ``CompiledEnsemble`` flattens every tree of the booster into
+contiguous node arrays (feature, threshold, children, default direction,
+leaf value) and walks all trees for all rows at once, one tree level per
+vectorized step.
+
+Predictions are bit-identical to the booster: inputs and thresholds are
+compared in float32, missing values follow each node's default direction,
+and leaf values are accumulated in float32 in tree order starting from the
+base score, as XGBoost's CPU predictor does.
+"""
+import json
+import threading
+import weakref
+
+import numpy as np
+
+SUPPORTED_OBJECTIVES = ("reg:squarederror", "reg:absoluteerror", "reg:pseudohubererror")
+
+
+def _parse_base_score(value):
+    # xgboost >= 2 stores a vector such as "[1.3993589E3]"
+    return np.float32(float(str(value).strip("[]").split(",")[0]))
+
+
+class CompiledEnsemble:
+    """
+    Tree ensemble flattened into NumPy arrays.
+    
+    Leaves point to themselves, so every row can take ``max_depth`` steps
+    without checking which trees have already finished.
+    
+    Args:
+        feature (ndarray): Split feature of each node (int32)
+        threshold (ndarray): Split threshold of each node (float32)
+        left (ndarray): Global index of the left child (int32)
+        right (ndarray): Global index of the right child (int32)
+        default_left (ndarray): Direction taken by missing values (bool)
+        value (ndarray): Leaf value of each node (float32)
+        roots (ndarray): Global index of each tree's root, in tree order
+        max_depth (int): Depth of the deepest tree
+        base_score (float32): Prediction before any tree is added
+        feature_names (list): Feature names in input column order, or None
+    """
+
+    def __init__(self, feature, threshold, left, right, default_left, value, roots, max_depth, base_score,
+                 feature_names=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.default_left = default_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.base_score = np.float32(base_score)
+        self.feature_names = feature_names
+        self.children = np.stack([left, right], axis=1).ravel()
+
+    @classmethod
+    def from_booster(cls, booster):
+        """
+        Flatten an ``xgboost.Booster`` (or a model with ``get_booster``).
+        
+        Args:
+            booster: Trained booster with numerical splits
+        
+        Returns:
+            CompiledEnsemble: The flattened ensemble
+        """
+        if hasattr(booster, "get_booster"):
+            booster = booster.get_booster()
+        learner = json.loads(booster.save_raw(raw_format="json"))["learner"]
+        objective = learner["objective"]["name"]
+        if objective not in SUPPORTED_OBJECTIVES:
+            raise ValueError(f"Unsupported objective for compiled inference: {objective}")
+        model = learner["gradient_booster"]["model"]
+        if learner["gradient_booster"]["name"] != "gbtree":
+            raise ValueError(f"Unsupported booster: {learner['gradient_booster']['name']}")
+        if int(learner["learner_model_param"].get("num_target", 1)) != 1:
+            raise ValueError("Compiled inference supports single-target models only")
+
+        trees = model["trees"]
+        sizes = [len(tree["left_children"]) for tree in trees]
+        offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int32)
+        total = int(offsets[-1])
+
+        feature = np.zeros(total, dtype=np.int32)
+        threshold = np.zeros(total, dtype=np.float32)
+        left = np.empty(total, dtype=np.int32)
+        right = np.empty(total, dtype=np.int32)
+        default_left = np.zeros(total, dtype=bool)
+        value = np.zeros(total, dtype=np.float32)
+        max_depth = 0
+
+        for tree, offset in zip(trees, offsets[:-1]):
+            if any(tree.get("split_type", [])):
+                raise ValueError("Categorical splits are not supported by compiled inference")
+            lc = np.asarray(tree["left_children"], dtype=np.int32)
+            rc = np.asarray(tree["right_children"], dtype=np.int32)
+            n = len(lc)
+            nodes = slice(offset, offset + n)
+            is_leaf = lc == -1
+            own = np.arange(offset, offset + n, dtype=np.int32)
+            left[nodes] = np.where(is_leaf, own, lc + offset)
+            right[nodes] = np.where(is_leaf, own, rc + offset)
+            conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+            threshold[nodes] = np.where(is_leaf, np.float32(0), conditions)
+            value[nodes] = np.where(is_leaf, conditions, np.float32(0))
+            feature[nodes] = np.where(is_leaf, 0, np.asarray(tree["split_indices"], dtype=np.int32))
+            default_left[nodes] = np.asarray(tree["default_left"], dtype=bool)
+
+            depth = np.zeros(n, dtype=np.int32)
+            parents = np.asarray(tree["parents"], dtype=np.int64)
+            for node in range(1, n):
+                depth[node] = depth[parents[node]] + 1
+            max_depth = max(max_depth, int(depth.max()) if n else 0)
+
+        return cls(
+            feature, threshold, left, right, default_left, value,
+            roots=offsets[:-1].copy(), max_depth=max_depth,
+            base_score=_parse_base_score(learner["learner_model_param"]["base_score"]),
+            feature_names=learner.get("feature_names") or None,
+        )
+
+    def predict(self, X):
+        """
+        Predict for a 2-D array of rows.
+        
+        Args:
+            X (ndarray): Rows with the model's features in training order;
+                         NaN marks a missing value
+        
+        Returns:
+            ndarray: float32 predictions, equal to the booster's
+        """
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        n_rows = X.shape[0]
+        if n_rows == 0:
+            return np.empty(0, dtype=np.float32)
+
+        n_features = X.shape[1]
+        flat = X.ravel()
+        row_offset = (np.arange(n_rows, dtype=np.int64) * n_features)[:, None]
+        node = np.broadcast_to(self.roots, (n_rows, len(self.roots))).copy()
+        has_missing = bool(np.isnan(flat).any())
+        for _ in range(self.max_depth):
+            x = flat.take(row_offset + self.feature.take(node))
+            if has_missing:
+                go_right = np.where(np.isnan(x), ~self.default_left.take(node), x >= self.threshold.take(node))
+            else:
+                go_right = x >= self.threshold.take(node)
+            # children holds (left, right) pairs, so the branch is an offset
+            node = self.children.take(node * 2 + go_right)
+
+        leaves = np.empty((n_rows, len(self.roots) + 1), dtype=np.float32)
+        leaves[:, 0] = self.base_score
+        leaves[:, 1:] = self.value[node]
+        # cumsum adds strictly left to right, matching XGBoost's float32 sum
+        return np.cumsum(leaves, axis=1, dtype=np.float32)[:, -1]
+
+
+_compiled = weakref.WeakKeyDictionary()
+_compiled_lock = threading.Lock()
+
+
+def compile_model(model):
+    """
+    Return the compiled ensemble for a loaded model, building it once.
+    
+    Args:
+        model: XGBRegressor (or Booster)
+    
+    Returns:
+        CompiledEnsemble: Cached for as long as the model is alive
+    """
+    with _compiled_lock:
+        ensemble = _compiled.get(model)
+    if ensemble is None:
+        ensemble = CompiledEnsemble.from_booster(model)
+        with _compiled_lock:
+            _compiled[model] = ensemble
+    return ensemble
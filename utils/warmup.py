@@ -0,0 +1,100 @@
+"""
+Model and data warm-up, in the foreground or on a background thread.
+
+The utils import their heavy dependencies (xgboost, textblob, matplotlib,
+transformers) on first use, so the app renders without paying for them.
+``start_background_warm_up`` then pays for the ones a first prediction
+needs while the user is still picking inputs: it imports plotly's figure
+classes, unpickles the models (which imports xgboost) and brings the
+feature stores up to date. A request that arrives before the warm-up is
+done simply loads what it needs itself; the model registry and feature
+store are thread-safe.
+"""
+import os
+import threading
+import time
+
+APP_WARMUP = os.getenv("APP_WARMUP", "1") == "1"
+
+_lock = threading.Lock()
+_thread = None
+_status = {"state": "idle", "started_at": None, "seconds": None, "failures": {}}
+
+
+def warm_up(stocks=None, max_models=None):
+    """
+    Load stock models and price data into memory.
+    
+    Args:
+        stocks (list): Stock symbols (default: STOCK_LIST)
+        max_models (int): Load at most this many models, so a small model
+                          registry is not filled only to evict them again
+    
+    Returns:
+        dict: Stocks that failed to load, mapped to the error message
+    """
+    import plotly.graph_objects  # noqa: F401  (first figure otherwise pays for it)
+
+    from utils import feature_store
+    from utils.model_utils import find_model_file, load_price_data, model_registry
+    from utils.stocks import STOCK_LIST
+
+    failures = {}
+    loaded = 0
+    for stock in stocks or STOCK_LIST:
+        if max_models is not None and loaded >= max_models:
+            break
+        try:
+            if find_model_file(stock) is None:
+                raise FileNotFoundError(f"No model file for {stock}")
+            model_registry.get(stock)
+            loaded += 1
+            feature_store.update_features(stock, load_price_data(stock))
+        except Exception as e:
+            failures[stock] = str(e)
+    return failures
+
+
+def _run(stocks, max_models):
+    started = time.perf_counter()
+    try:
+        failures = warm_up(stocks, max_models)
+        state = "done"
+    except Exception as e:
+        failures = {"*": str(e)}
+        state = "failed"
+    with _lock:
+        _status.update({"state": state, "seconds": time.perf_counter() - started, "failures": failures})
+
+
+def start_background_warm_up(stocks=None, max_models=None):
+    """
+    Run ``warm_up`` on a daemon thread, once per process.
+    
+    Args:
+        stocks (list): Stock symbols (default: STOCK_LIST)
+        max_models (int): Models to load (default: the model registry's capacity)
+    
+    Returns:
+        threading.Thread: The warm-up thread (the running or finished one
+                          when called again), or None if APP_WARMUP=0
+    """
+    global _thread
+    if not APP_WARMUP:
+        return None
+    with _lock:
+        if _thread is None:
+            if max_models is None:
+                from utils.model_utils import model_registry
+
+                max_models = model_registry.max_models
+            _status.update({"state": "running", "started_at": time.time()})
+            _thread = threading.Thread(target=_run, args=(stocks, max_models), name="warm-up", daemon=True)
+            _thread.start()
+        return _thread
+
+
+def status():
+    """Return the background warm-up's state, duration and failures."""
+    with _lock:
+        return {**_status, "failures": dict(_status["failures"])}